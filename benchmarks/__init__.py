@@ -0,0 +1 @@
+"""Load-test and latency benchmarks for the MCP Perplexica server."""
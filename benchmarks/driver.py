@@ -0,0 +1,253 @@
+"""Load driver - Pushes concurrent MCP `search` calls through a real server.
+
+The server is started as a subprocess running `src/main.py`, configured
+through environment variables to use the requested transport and to talk
+to the given Perplexica URL (normally the fake server), so the whole stack
+is exercised: MCP transport, use case, decorators and PerplexicaAdapter.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from benchmarks.report import BenchmarkReport, LatencySummary, sample_process
+
+Transport = Literal["stdio", "sse", "streamable-http"]
+
+TRANSPORTS: tuple[Transport, ...] = ("stdio", "sse", "streamable-http")
+MAIN = Path(__file__).resolve().parent.parent / "src" / "main.py"
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """Shape of a load run.
+
+    Attributes:
+        requests: Calls to make, excluding warm-up.
+        concurrency: Calls kept in flight at once.
+        warmup: Calls made before measuring, to open connections.
+        stream: Whether searches use Perplexica streaming.
+        server_env: Extra environment variables for the server process.
+    """
+
+    requests: int = 200
+    concurrency: int = 20
+    warmup: int = 5
+    stream: bool = False
+    server_env: tuple[tuple[str, str], ...] = ()
+
+
+def _free_port() -> int:
+    """Find a TCP port nobody is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _child_pid(marker: str) -> int | None:
+    """Find a child process of this one whose command line contains a marker.
+
+    Args:
+        marker: Text to look for in the child's command line.
+
+    Returns:
+        The child's pid, or None where /proc is unavailable.
+    """
+    try:
+        tasks = os.listdir(f"/proc/{os.getpid()}/task")
+        children = [
+            int(pid)
+            for task in tasks
+            for pid in Path(f"/proc/{os.getpid()}/task/{task}/children").read_text().split()
+        ]
+        for pid in children:
+            if marker in Path(f"/proc/{pid}/cmdline").read_text():
+                return pid
+    except OSError:
+        pass
+    return None
+
+
+async def _wait_for_port(port: int, process: asyncio.subprocess.Process) -> None:
+    """Wait until the server accepts TCP connections.
+
+    Raises:
+        RuntimeError: If the server exits or does not start within 30 seconds.
+    """
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.returncode is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.05)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+    raise RuntimeError(f"Server did not listen on port {port} within 30s")
+
+
+@asynccontextmanager
+async def connect(
+    transport: Transport, perplexica_url: str, server_env: dict[str, str] | None = None
+) -> AsyncIterator[tuple[ClientSession, int | None]]:
+    """Start a server and open an MCP session to it.
+
+    Args:
+        transport: MCP transport to use.
+        perplexica_url: Perplexica URL the server should search through.
+        server_env: Extra environment variables for the server process.
+
+    Yields:
+        The initialized client session and the server's pid, if known.
+    """
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PERPLEXICA_URL": perplexica_url,
+        "TRANSPORT": transport,
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        **(server_env or {}),
+    }
+
+    if transport == "stdio":
+        params = StdioServerParameters(command=sys.executable, args=[str(MAIN)], env=env)
+        with open(os.devnull, "w") as errlog:
+            async with (
+                stdio_client(params, errlog=errlog) as (read, write),
+                ClientSession(read, write) as session,
+            ):
+                await session.initialize()
+                yield session, _child_pid(str(MAIN))
+        return
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(MAIN),
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        await _wait_for_port(port, process)
+        if transport == "sse":
+            client = sse_client(f"http://127.0.0.1:{port}/sse")
+        else:
+            client = streamablehttp_client(f"http://127.0.0.1:{port}/mcp")
+        async with client as streams, ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            yield session, process.pid
+    finally:
+        if process.returncode is None:
+            process.terminate()
+            await process.wait()
+
+
+def search_arguments(index: int, stream: bool = False) -> dict[str, Any]:
+    """Build the arguments of the index-th benchmark search.
+
+    Queries differ so single-flight and caching do not collapse the load.
+
+    Args:
+        index: Sequence number of the call.
+        stream: Whether the search uses Perplexica streaming.
+
+    Returns:
+        Arguments for the `search` tool.
+    """
+    return {
+        "search_request": {
+            "query": f"benchmark query {index}",
+            "chatModel": {"providerId": "benchmark", "key": "benchmark-chat"},
+            "embeddingModel": {"providerId": "benchmark", "key": "benchmark-embedding"},
+            "stream": stream,
+        }
+    }
+
+
+async def _progress(progress: float, total: float | None, message: str | None) -> None:
+    """Accept streamed progress notifications."""
+
+
+async def run_load(session: ClientSession, profile: LoadProfile) -> LatencySummary:
+    """Make `profile.requests` searches with bounded concurrency.
+
+    Args:
+        session: Initialized MCP client session.
+        profile: Shape of the run.
+
+    Returns:
+        Throughput and latency of the run.
+    """
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(profile.concurrency)
+
+    async def call(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await session.call_tool(
+                    "search",
+                    search_arguments(index, profile.stream),
+                    progress_callback=_progress if profile.stream else None,
+                )
+            except Exception:
+                errors += 1
+                return
+            text = result.content[0].text if result.content else ""
+            if result.isError or text.startswith("Search failed"):
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(profile.requests)))
+    return LatencySummary.from_samples(latencies, errors, time.perf_counter() - started)
+
+
+async def run_scenario(
+    name: str, transport: Transport, perplexica_url: str, profile: LoadProfile
+) -> BenchmarkReport:
+    """Start a server, warm it up, load it and report.
+
+    Args:
+        name: Scenario name.
+        transport: MCP transport to use.
+        perplexica_url: Perplexica URL the server should search through.
+        profile: Shape of the run.
+
+    Returns:
+        The scenario's report.
+    """
+    async with connect(transport, perplexica_url, dict(profile.server_env)) as (session, pid):
+        for i in range(profile.warmup):
+            await session.call_tool("search", search_arguments(-1 - i, profile.stream))
+        before = sample_process(pid) if pid else None
+        latency = await run_load(session, profile)
+        after = sample_process(pid) if pid else None
+
+    return BenchmarkReport(
+        name=name,
+        transport=transport,
+        concurrency=profile.concurrency,
+        latency=latency,
+        before=before,
+        after=after,
+    )
@@ -0,0 +1,188 @@
+"""Fake Perplexica - Local stand-in for the Perplexica search API.
+
+Answers `POST /api/search` with canned results after a configurable,
+log-normally distributed delay, fails a configurable share of requests,
+and streams NDJSON events for streaming requests, so the real
+PerplexicaAdapter and MCP transports can be loaded without an LLM.
+
+Run standalone with `python -m benchmarks.fake_perplexica --port 3001`.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+
+@dataclass(frozen=True)
+class FakePerplexicaConfig:
+    """Behaviour of the fake Perplexica server.
+
+    Attributes:
+        latency_ms: Median response latency in milliseconds.
+        latency_sigma: Log-normal shape parameter; 0 gives a fixed latency.
+        error_rate: Share of requests answered with `error_status`.
+        error_status: HTTP status code of failed requests.
+        stream_chunks: Number of response events in a streamed answer.
+        sources: Number of sources attached to each answer.
+    """
+
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    error_status: int = 503
+    stream_chunks: int = 8
+    sources: int = 3
+
+
+class FakePerplexica:
+    """Request handler implementing the fake search endpoint.
+
+    Attributes:
+        config: Behaviour of the server.
+        requests: Search requests received since startup.
+    """
+
+    def __init__(self, config: FakePerplexicaConfig, rng: random.Random | None = None) -> None:
+        """Initialize FakePerplexica.
+
+        Args:
+            config: Behaviour of the server.
+            rng: Random source, seeded for reproducible runs.
+        """
+        self.config = config
+        self.requests = 0
+        self._rng = rng or random.Random()
+
+    def _latency(self) -> float:
+        """Draw a response latency in seconds."""
+        median = self.config.latency_ms / 1000
+        if self.config.latency_sigma <= 0:
+            return median
+        return self._rng.lognormvariate(math.log(median), self.config.latency_sigma)
+
+    def _sources(self, query: str) -> list[dict[str, Any]]:
+        """Build the canned sources for a query."""
+        return [
+            {
+                "title": f"Result {i} for {query}",
+                "url": f"https://example.com/{i}",
+                "snippet": f"Snippet {i} about {query}",
+            }
+            for i in range(1, self.config.sources + 1)
+        ]
+
+    async def _stream(self, query: str, latency: float) -> AsyncIterator[bytes]:
+        """Emit NDJSON events spread over the response latency."""
+        interval = latency / (self.config.stream_chunks + 1)
+        yield (json.dumps({"type": "init", "data": "Stream connected"}) + "\n").encode()
+        await asyncio.sleep(interval)
+        yield (json.dumps({"type": "sources", "data": self._sources(query)}) + "\n").encode()
+        for i in range(self.config.stream_chunks):
+            await asyncio.sleep(interval)
+            event = {"type": "response", "data": f"Part {i} of the answer to {query}. "}
+            yield (json.dumps(event) + "\n").encode()
+        yield (json.dumps({"type": "done"}) + "\n").encode()
+
+    async def search(self, request: Request) -> Response:
+        """Handle `POST /api/search`."""
+        self.requests += 1
+        payload = await request.json()
+        query = payload.get("query", "")
+        latency = self._latency()
+
+        if self._rng.random() < self.config.error_rate:
+            await asyncio.sleep(latency)
+            return JSONResponse({"message": "fake failure"}, status_code=self.config.error_status)
+
+        if payload.get("stream"):
+            return StreamingResponse(
+                self._stream(query, latency), media_type="application/x-ndjson"
+            )
+
+        await asyncio.sleep(latency)
+        return JSONResponse(
+            {"message": f"Answer to {query}.", "sources": self._sources(query)}
+        )
+
+
+def create_app(handler: FakePerplexica) -> Starlette:
+    """Build the ASGI application serving a handler.
+
+    Args:
+        handler: The fake search endpoint.
+
+    Returns:
+        Starlette application.
+    """
+    return Starlette(routes=[Route("/api/search", handler.search, methods=["POST"])])
+
+
+@asynccontextmanager
+async def serve(
+    config: FakePerplexicaConfig, host: str = "127.0.0.1", port: int = 0
+) -> AsyncIterator[tuple[FakePerplexica, str]]:
+    """Run the fake server in the current event loop.
+
+    Args:
+        config: Behaviour of the server.
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free one.
+
+    Yields:
+        The handler (for request counts) and the server's base URL.
+    """
+    handler = FakePerplexica(config)
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(handler), host=host, port=port, log_level="warning", lifespan="off"
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if task.done():
+                task.result()
+            await asyncio.sleep(0.01)
+        bound_port = server.servers[0].sockets[0].getsockname()[1]
+        yield handler, f"http://{host}:{bound_port}"
+    finally:
+        server.should_exit = True
+        await task
+
+
+def main() -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stream-chunks", type=int, default=8)
+    args = parser.parse_args()
+
+    handler = FakePerplexica(
+        FakePerplexicaConfig(
+            latency_ms=args.latency_ms,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            stream_chunks=args.stream_chunks,
+        )
+    )
+    uvicorn.run(create_app(handler), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
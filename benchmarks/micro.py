@@ -0,0 +1,194 @@
+"""CPU microbenchmarks of the search hot path.
+
+Measures process CPU time per call, without network or server latency, for
+the work the Perplexica adapter does around every search: encoding the
+request payload (spliced into a cached template), decoding the answer and
+building domain results. Each
+scenario runs once per available JSON codec so their cost can be compared.
+
+Usage (the `src` directory must be importable):
+    PYTHONPATH=src python -m benchmarks.micro
+    PYTHONPATH=src python -m benchmarks.micro --iterations 20000 --sources 40 --message-kb 16
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+from domain.entities import ChatModel, EmbeddingModel, SearchRequest
+from infrastructure.perplexica.adapter import (
+    ORJSON_CODEC,
+    STDLIB_CODEC,
+    JsonCodec,
+    PerplexicaAdapter,
+)
+
+
+@dataclass(frozen=True)
+class MicroResult:
+    """CPU cost of one microbenchmark scenario.
+
+    Attributes:
+        name: Scenario name, including the codec.
+        iterations: Number of timed calls.
+        cpu_per_call: Mean process CPU time per call, in seconds.
+    """
+
+    name: str
+    iterations: int
+    cpu_per_call: float
+
+    def format(self) -> str:
+        """Render the result as a single line."""
+        return f"{self.name:<32} {self.cpu_per_call * 1e6:9.1f} µs/call  ({self.iterations} calls)"
+
+
+def make_request() -> SearchRequest:
+    """Create a search request with typical model and mode settings."""
+    return SearchRequest(
+        query="What are the latest developments in solid-state batteries?",
+        chat_model=ChatModel(provider_id="openrouter", key="anthropic/claude-sonnet-4.5"),
+        embedding_model=EmbeddingModel(provider_id="openai", key="text-embedding-3-small"),
+        system_instructions="Answer concisely and cite your sources.",
+    )
+
+
+def make_response_body(sources: int, message_bytes: int) -> bytes:
+    """Create a Perplexica answer of the given size.
+
+    Args:
+        sources: Number of sources in the answer.
+        message_bytes: Approximate size of the answer text.
+
+    Returns:
+        The JSON response body.
+    """
+    sentence = "Solid-state cells replace the liquid electrolyte with a ceramic [1]. "
+    return json.dumps(
+        {
+            "message": sentence * max(1, message_bytes // len(sentence)),
+            "sources": [
+                {
+                    "title": f"Source {i}: battery research roundup",
+                    "url": f"https://example.com/articles/{i}",
+                    "snippet": "Researchers reported a new sulfide electrolyte " * 3,
+                }
+                for i in range(sources)
+            ],
+        }
+    ).encode()
+
+
+def available_codecs() -> list[JsonCodec]:
+    """Return every JSON codec installed in this environment."""
+    return [codec for codec in (STDLIB_CODEC, ORJSON_CODEC) if codec is not None]
+
+
+def measure(name: str, call: Callable[[], object], iterations: int) -> MicroResult:
+    """Time a synchronous call.
+
+    Args:
+        name: Scenario name.
+        call: The work to time.
+        iterations: Number of timed calls.
+
+    Returns:
+        The mean CPU time per call.
+    """
+    call()  # warm up
+    start = time.process_time()
+    for _ in range(iterations):
+        call()
+    return MicroResult(name, iterations, (time.process_time() - start) / iterations)
+
+
+async def _measure_search(adapter: PerplexicaAdapter, iterations: int) -> float:
+    """Time adapter.search() calls answered by an in-process transport."""
+    request = make_request()
+    await adapter.search(request)  # warm up the client
+    start = time.process_time()
+    for _ in range(iterations):
+        await adapter.search(request)
+    cpu_per_call = (time.process_time() - start) / iterations
+    await adapter.close()
+    return cpu_per_call
+
+
+def _codec_scenarios(
+    codec: JsonCodec, request: SearchRequest, body: bytes, iterations: int
+) -> list[MicroResult]:
+    """Measure request encoding, answer parsing and a full search with one codec."""
+    adapter = PerplexicaAdapter(
+        base_url="http://perplexica",
+        client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body))
+        ),
+        codec=codec,
+    )
+    return [
+        measure(
+            f"encode request [{codec.name}]",
+            lambda: adapter._encode_payload(request, stream=False),
+            iterations,
+        ),
+        measure(
+            f"parse answer [{codec.name}]",
+            lambda: adapter._parse_response(codec.loads(body)),
+            iterations,
+        ),
+        MicroResult(
+            f"adapter.search [{codec.name}]",
+            iterations,
+            asyncio.run(_measure_search(adapter, iterations)),
+        ),
+    ]
+
+
+def codec_scenarios(iterations: int, sources: int, message_bytes: int) -> list[MicroResult]:
+    """Measure request encoding, answer parsing and a full search per codec.
+
+    Args:
+        iterations: Number of timed calls per scenario.
+        sources: Number of sources in the canned answer.
+        message_bytes: Approximate size of the canned answer text.
+
+    Returns:
+        One result per scenario and codec.
+    """
+    body = make_response_body(sources, message_bytes)
+    request = make_request()
+    return [
+        result
+        for codec in available_codecs()
+        for result in _codec_scenarios(codec, request, body, iterations)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the microbenchmarks and print one line per scenario.
+
+    Args:
+        argv: Command line arguments, defaulting to sys.argv.
+
+    Returns:
+        Process exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--sources", type=int, default=25)
+    parser.add_argument("--message-kb", type=float, default=8.0)
+    args = parser.parse_args(argv)
+
+    for result in codec_scenarios(args.iterations, args.sources, int(args.message_kb * 1024)):
+        print(result.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
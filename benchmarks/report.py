@@ -0,0 +1,235 @@
+"""Benchmark reports - Latency percentiles, resource growth and baselines."""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Compute a percentile with linear interpolation.
+
+    Args:
+        samples: Observed values.
+        q: Percentile in [0, 100].
+
+    Returns:
+        The percentile, or 0.0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Throughput and latency of a load run.
+
+    Attributes:
+        requests: Calls made.
+        errors: Calls that failed.
+        duration: Wall-clock seconds the run took.
+        throughput: Successful calls per second.
+        mean: Mean latency of successful calls, in seconds.
+        p50: Median latency, in seconds.
+        p95: 95th percentile latency, in seconds.
+        p99: 99th percentile latency, in seconds.
+        max: Slowest successful call, in seconds.
+    """
+
+    requests: int
+    errors: int
+    duration: float
+    throughput: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_samples(
+        cls, latencies: list[float], errors: int, duration: float
+    ) -> "LatencySummary":
+        """Summarize the latencies of successful calls.
+
+        Args:
+            latencies: Latency of each successful call, in seconds.
+            errors: Number of failed calls.
+            duration: Wall-clock seconds the run took.
+
+        Returns:
+            The summary.
+        """
+        return cls(
+            requests=len(latencies) + errors,
+            errors=errors,
+            duration=duration,
+            throughput=len(latencies) / duration if duration > 0 else 0.0,
+            mean=sum(latencies) / len(latencies) if latencies else 0.0,
+            p50=percentile(latencies, 50),
+            p95=percentile(latencies, 95),
+            p99=percentile(latencies, 99),
+            max=max(latencies, default=0.0),
+        )
+
+    @property
+    def error_rate(self) -> float:
+        """Share of calls that failed."""
+        return self.errors / self.requests if self.requests else 0.0
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """Memory and file descriptor usage of a process.
+
+    Attributes:
+        rss_bytes: Resident set size in bytes.
+        open_fds: Number of open file descriptors.
+    """
+
+    rss_bytes: int
+    open_fds: int
+
+
+def sample_process(pid: int) -> ResourceSample | None:
+    """Read a process's memory and file descriptor usage from /proc.
+
+    Args:
+        pid: Process to inspect.
+
+    Returns:
+        The sample, or None where /proc is unavailable (non-Linux).
+    """
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+        open_fds = len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return None
+    rss_kb = next(
+        (int(line.split()[1]) for line in status.splitlines() if line.startswith("VmRSS:")), 0
+    )
+    return ResourceSample(rss_bytes=rss_kb * 1024, open_fds=open_fds)
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    """Outcome of one benchmark scenario.
+
+    Attributes:
+        name: Scenario name, used as the baseline file name.
+        transport: MCP transport exercised.
+        concurrency: Calls kept in flight at once.
+        latency: Throughput and latency of the run.
+        before: Server resource usage after warm-up, if measurable.
+        after: Server resource usage after the run, if measurable.
+    """
+
+    name: str
+    transport: str
+    concurrency: int
+    latency: LatencySummary
+    before: ResourceSample | None = None
+    after: ResourceSample | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to plain JSON-compatible data."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkReport":
+        """Rebuild a report from `to_dict` output."""
+        return cls(
+            name=data["name"],
+            transport=data["transport"],
+            concurrency=data["concurrency"],
+            latency=LatencySummary(**data["latency"]),
+            before=ResourceSample(**data["before"]) if data.get("before") else None,
+            after=ResourceSample(**data["after"]) if data.get("after") else None,
+        )
+
+    def format(self) -> str:
+        """Render the report as human-readable text."""
+        latency = self.latency
+        lines = [
+            f"{self.name} ({self.transport}, concurrency {self.concurrency})",
+            f"  requests   {latency.requests} ({latency.errors} errors, "
+            f"{latency.error_rate:.1%})",
+            f"  throughput {latency.throughput:.1f} req/s over {latency.duration:.2f}s",
+            f"  latency    p50 {latency.p50 * 1000:.1f}ms  p95 {latency.p95 * 1000:.1f}ms  "
+            f"p99 {latency.p99 * 1000:.1f}ms  max {latency.max * 1000:.1f}ms",
+        ]
+        if self.before and self.after:
+            rss_growth = (self.after.rss_bytes - self.before.rss_bytes) / 2**20
+            lines.append(
+                f"  server     rss {self.after.rss_bytes / 2**20:.1f}MiB ({rss_growth:+.1f}MiB)  "
+                f"fds {self.after.open_fds} ({self.after.open_fds - self.before.open_fds:+d})"
+            )
+        return "\n".join(lines)
+
+
+def save_baseline(report: BenchmarkReport, directory: Path) -> Path:
+    """Write a report as the baseline for its scenario.
+
+    Args:
+        report: The report to save.
+        directory: Directory holding baseline files.
+
+    Returns:
+        Path of the written baseline.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{report.name}.json"
+    path.write_text(json.dumps(report.to_dict(), indent=2) + "\n")
+    return path
+
+
+def load_baseline(name: str, directory: Path) -> BenchmarkReport | None:
+    """Read the baseline for a scenario.
+
+    Args:
+        name: Scenario name.
+        directory: Directory holding baseline files.
+
+    Returns:
+        The baseline report, or None if none was saved.
+    """
+    path = directory / f"{name}.json"
+    if not path.exists():
+        return None
+    return BenchmarkReport.from_dict(json.loads(path.read_text()))
+
+
+def find_regressions(
+    report: BenchmarkReport, baseline: BenchmarkReport, tolerance: float = 0.2
+) -> list[str]:
+    """Compare a report against its baseline.
+
+    Args:
+        report: The new report.
+        baseline: The saved baseline for the same scenario.
+        tolerance: Relative slack before a difference counts as a regression.
+
+    Returns:
+        Descriptions of every metric that regressed; empty if none did.
+    """
+    regressions = []
+    new, old = report.latency, baseline.latency
+    if new.throughput < old.throughput * (1 - tolerance):
+        regressions.append(
+            f"throughput fell from {old.throughput:.1f} to {new.throughput:.1f} req/s"
+        )
+    for metric in ("p50", "p95", "p99"):
+        before, after = getattr(old, metric), getattr(new, metric)
+        if after > before * (1 + tolerance):
+            regressions.append(
+                f"{metric} rose from {before * 1000:.1f}ms to {after * 1000:.1f}ms"
+            )
+    if new.error_rate > old.error_rate + tolerance / 10:
+        regressions.append(f"error rate rose from {old.error_rate:.1%} to {new.error_rate:.1%}")
+    return regressions
@@ -0,0 +1,115 @@
+"""Benchmark runner - Loads the server over each transport and checks baselines.
+
+Usage:
+    python -m benchmarks.run                       # all transports, compare to baselines
+    python -m benchmarks.run --save-baseline       # record new baselines
+    python -m benchmarks.run --transport stdio --requests 500 --concurrency 50
+    python -m benchmarks.run --transport streamable-http --workers 1 --workers 4
+
+Exits with status 1 if any scenario regressed beyond the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.driver import TRANSPORTS, LoadProfile, run_scenario
+from benchmarks.fake_perplexica import FakePerplexicaConfig, serve
+from benchmarks.report import (
+    BenchmarkReport,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transport", action="append", choices=TRANSPORTS, help="Repeatable; default: all"
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--stream", action="store_true", help="Use Perplexica streaming")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        action="append",
+        help="Server worker processes; repeatable to compare (streamable-http only above 1)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--json", type=Path, help="Also write every report to this file")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> list[BenchmarkReport]:
+    """Run every requested scenario against one fake Perplexica."""
+    fake_config = FakePerplexicaConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+    )
+    profile = LoadProfile(
+        requests=args.requests, concurrency=args.concurrency, stream=args.stream
+    )
+    reports = []
+    async with serve(fake_config) as (_, url):
+        for transport in args.transport or TRANSPORTS:
+            for workers in args.workers or [1]:
+                if workers > 1 and transport != "streamable-http":
+                    continue
+                name = (
+                    f"{transport}-c{args.concurrency}"
+                    + (f"-w{workers}" if workers > 1 else "")
+                    + ("-stream" if args.stream else "")
+                )
+                scenario = replace(profile, server_env=(("WORKERS", str(workers)),))
+                reports.append(await run_scenario(name, transport, url, scenario))
+    return reports
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks.
+
+    Args:
+        argv: Command line arguments, defaulting to sys.argv.
+
+    Returns:
+        Process exit status.
+    """
+    args = _parse_args(argv)
+    reports = asyncio.run(_run(args))
+
+    regressed = False
+    for report in reports:
+        print(report.format())
+        if args.save_baseline:
+            print(f"  saved baseline {save_baseline(report, args.baseline_dir)}")
+            continue
+        baseline = load_baseline(report.name, args.baseline_dir)
+        if baseline is None:
+            print("  no baseline saved")
+            continue
+        regressions = find_regressions(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"  REGRESSION: {regression}")
+        regressed = regressed or bool(regressions)
+
+    if args.json:
+        args.json.write_text(json.dumps([r.to_dict() for r in reports], indent=2) + "\n")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,295 @@
 """Application API - MCP tool definitions."""
 
-from dependencies import mcp, get_search_use_case
-from application.requests import SearchRequestDTO
-from domain.ports import SearchError
+import json
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict
+from typing import Literal
+
+from mcp.server.fastmcp import Context
+from starlette.requests import Request
+from starlette.responses import Response
+
+from application.requests import BatchSearchRequestDTO, SearchRequestDTO
+from application.use_cases import SearchUseCase, describe_error
+from dependencies import (
+    get_admission_controller,
+    get_batch_search_use_case,
+    get_circuit_breaker,
+    get_degrader,
+    get_hedging_adapter,
+    get_load_balancer,
+    get_metrics,
+    get_model_router,
+    get_rate_limiter,
+    get_retry_adapter,
+    get_search_cache,
+    get_search_use_case,
+    get_semantic_cache,
+    get_session_store,
+    get_tracer,
+    mcp,
+    settings,
+)
+from domain.entities import OptimizationMode, SearchMetadata, SearchResult, Source
+from domain.ports import SearchError, SpanPort
+
+# Answer layouts the search tools can return
+OutputFormat = Literal["markdown", "compact"]
+
+
+def _format_result(result: SearchResult, output_format: OutputFormat = "markdown") -> str:
+    """Format a search result with source citations.
+
+    Args:
+        result: The search result to format.
+        output_format: Markdown with source snippets, or compact text
+            listing only source titles and URLs.
+
+    Returns:
+        The response message followed by a numbered list of sources, and a
+        note when the server lowered the optimization mode.
+    """
+    response_parts = [result.message]
+
+    if result.sources and output_format == "compact":
+        response_parts.append("\nSources:")
+        response_parts.extend(
+            f"[{i}] {source.title} <{source.url}>"
+            for i, source in enumerate(result.sources, 1)
+        )
+    elif result.sources:
+        response_parts.append("\n\n## Sources")
+        for i, source in enumerate(result.sources, 1):
+            source_line = f"{i}. [{source.title}]({source.url})"
+            if source.snippet:
+                source_line += f"\n   > {source.snippet}"
+            response_parts.append(source_line)
+
+    if result.metadata.degraded_to is not None:
+        response_parts.append(
+            f"\n(Answered in {result.metadata.degraded_to} mode: the server is under heavy load.)"
+        )
+
+    return "\n".join(response_parts)
+
+
+def _client_id(ctx: Context) -> str | None:
+    """Identify the client of a tool call, for rate limits and fair queuing.
+
+    Over HTTP, the client is named by the `client_id_header` header, or else
+    by the MCP client id, the MCP session or the remote address, in that
+    order. The header is not authenticated: it separates cooperating
+    clients, it does not keep out hostile ones.
+
+    Args:
+        ctx: The MCP request context.
+
+    Returns:
+        The client identity, or None if the client cannot be told apart
+        (such as the single client of a stdio server).
+    """
+    request = ctx.request_context.request
+    http = request if isinstance(request, Request) else None
+    if http is not None and http.headers.get(settings.client_id_header):
+        return http.headers[settings.client_id_header]
+    if ctx.client_id:
+        return ctx.client_id
+    if http is not None and http.headers.get("mcp-session-id"):
+        return f"session:{http.headers['mcp-session-id']}"
+    if http is not None and http.client is not None:
+        return f"address:{http.client.host}"
+    return None
+
+
+def _tool_span(name: str) -> AbstractContextManager[SpanPort | None]:
+    """Open the root span of an MCP tool call, if tracing is enabled.
+
+    Args:
+        name: The tool name.
+
+    Returns:
+        Context manager yielding the span, or None when not tracing.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(f"mcp.tool {name}", {"mcp.tool.name": name})
+
+
+async def _stream_search(
+    use_case: SearchUseCase, search_request: SearchRequestDTO, ctx: Context
+) -> SearchResult:
+    """Run a streaming search, relaying partial results as MCP progress.
+
+    Args:
+        use_case: The search use case.
+        search_request: The search request to stream.
+        ctx: The MCP request context used to identify the client and send
+            progress notifications.
+
+    Returns:
+        The final result assembled from every streamed chunk.
+    """
+    message_parts: list[str] = []
+    sources: tuple[Source, ...] = ()
+    degraded_to: OptimizationMode | None = None
+    # MCP requires progress to increase with every notification
+    progress = 0
+
+    async for chunk in use_case.execute_stream(search_request, _client_id(ctx)):
+        degraded_to = chunk.degraded_to or degraded_to
+        if chunk.sources:
+            sources = chunk.sources
+            progress += 1
+            await ctx.report_progress(progress, message=f"Found {len(sources)} sources")
+        if chunk.message:
+            message_parts.append(chunk.message)
+            progress += 1
+            await ctx.report_progress(progress, message=chunk.message)
+
+    return SearchResult(
+        message="".join(message_parts),
+        sources=sources,
+        metadata=SearchMetadata(degraded_to=degraded_to),
+    )
 
 
 @mcp.tool()
-async def search(search_request: SearchRequestDTO) -> str:
+async def search(search_request: SearchRequestDTO, ctx: Context) -> str:
     """Search the web using Perplexica and get AI-generated responses with sources.
 
+    When `stream` is enabled, partial answer text and sources are sent as
+    progress notifications while Perplexica is still generating.
+
     Args:
         search_request: The search request containing query, models, and options.
+        ctx: The MCP request context (injected by FastMCP).
 
     Returns:
         A formatted string containing the AI-generated response and source citations.
     """
     use_case = get_search_use_case()
 
-    try:
-        result = await use_case.execute(search_request)
+    with _tool_span("search") as span:
+        try:
+            if search_request.stream:
+                result = await _stream_search(use_case, search_request, ctx)
+            else:
+                result = await use_case.execute(search_request, _client_id(ctx))
+
+            return _format_result(
+                result, search_request.output_format or settings.default_output_format
+            )
+
+        except Exception as e:
+            # Failures are answered as text, so record them on the span here
+            if span is not None:
+                span.set_attribute("error.type", type(e).__name__)
+            if isinstance(e, SearchError):
+                return f"Search failed: {describe_error(e)}"
+            return f"Unexpected error: {e}"
+
+
+@mcp.tool()
+async def batch_search(batch_request: BatchSearchRequestDTO, ctx: Context) -> str:
+    """Run several Perplexica searches concurrently in a single call.
+
+    Each search succeeds or fails on its own; searches still running when
+    the batch deadline passes are reported as timed out.
+
+    Args:
+        batch_request: The searches to run and an optional batch deadline.
+        ctx: The MCP request context (injected by FastMCP).
+
+    Returns:
+        One formatted section per search, in the order they were given.
+    """
+    use_case = get_batch_search_use_case()
 
-        response_parts = [result.message]
+    with _tool_span("batch_search") as span:
+        if span is not None:
+            span.set_attribute("search.batch_size", len(batch_request.searches))
+        try:
+            items = await use_case.execute(
+                batch_request.searches,
+                timeout=batch_request.timeout,
+                client_id=_client_id(ctx),
+            )
+        except Exception as e:
+            if span is not None:
+                span.set_attribute("error.type", type(e).__name__)
+            return f"Unexpected error: {e}"
 
-        if result.sources:
-            response_parts.append("\n\n## Sources")
-            for i, source in enumerate(result.sources, 1):
-                source_line = f"{i}. [{source.title}]({source.url})"
-                if source.snippet:
-                    source_line += f"\n   > {source.snippet}"
-                response_parts.append(source_line)
+    sections = []
+    for i, (item, search_request) in enumerate(
+        zip(items, batch_request.searches, strict=True), 1
+    ):
+        output_format = search_request.output_format or settings.default_output_format
+        body = (
+            _format_result(item.result, output_format)
+            if item.result
+            else f"Search failed: {item.error}"
+        )
+        sections.append(f"# {i}. {item.query}\n\n{body}")
 
-        return "\n".join(response_parts)
+    return "\n\n".join(sections)
 
-    except SearchError as e:
-        return f"Search failed: {e.message}"
-    except Exception as e:
-        return f"Unexpected error: {e}"
\ No newline at end of file
+
+@mcp.resource("perplexica://status", mime_type="application/json")
+def status() -> str:
+    """Report the runtime state of the search pipeline.
+
+    Returns:
+        JSON document with per-client rate limiting, cache and semantic
+        cache counters, session counts, load degradation, admission queue
+        metrics, circuit breaker state, retry, chat model fallback and
+        hedging activity, and backend health.
+    """
+    rate_limiter = get_rate_limiter()
+    cache = get_search_cache()
+    semantic_cache = get_semantic_cache()
+    sessions = get_session_store()
+    degrader = get_degrader()
+    admission = get_admission_controller()
+    breaker = get_circuit_breaker()
+    retry = get_retry_adapter()
+    router = get_model_router()
+    hedging = get_hedging_adapter()
+    balancer = get_load_balancer()
+    return json.dumps(
+        {
+            "rate_limit": asdict(rate_limiter.stats) if rate_limiter else None,
+            "cache": asdict(cache.stats) if cache else None,
+            "semantic_cache": asdict(semantic_cache.stats) if semantic_cache else None,
+            "sessions": asdict(sessions.stats) if sessions else None,
+            "degradation": asdict(degrader.stats) if degrader else None,
+            "admission": (
+                {mode: asdict(stats) for mode, stats in admission.stats.items()}
+                if admission
+                else None
+            ),
+            "circuit_breaker": asdict(breaker.stats) if breaker else None,
+            "retry": asdict(retry.stats) if retry else None,
+            "models": [asdict(model) for model in router.stats] if router else None,
+            "hedging": asdict(hedging.stats) if hedging else None,
+            "backends": (
+                [asdict(backend) for backend in balancer.stats] if balancer else None
+            ),
+        }
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(_: Request) -> Response:
+    """Serve Prometheus metrics (sse and streamable-http transports only).
+
+    Args:
+        _: The HTTP request.
+
+    Returns:
+        Metrics in the Prometheus text format, or 404 if metrics are disabled.
+    """
+    recorder = get_metrics()
+    if recorder is None:
+        return Response("Metrics are disabled\n", status_code=404, media_type="text/plain")
+    return Response(recorder.exposition(), media_type=recorder.content_type)
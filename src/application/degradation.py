@@ -0,0 +1,214 @@
+"""Load-aware degradation - Lowers the optimization mode of searches under load."""
+
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from domain.entities import OptimizationMode, SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchPort
+
+# Optimization modes from fastest to slowest
+_MODE_ORDER = (OptimizationMode.SPEED, OptimizationMode.BALANCED, OptimizationMode.QUALITY)
+
+
+@dataclass(frozen=True)
+class DegradationPolicy:
+    """When searches are downgraded to a faster optimization mode.
+
+    A threshold left as None is not checked.
+
+    Attributes:
+        balanced_in_flight: Searches in flight from which 'quality' becomes 'balanced'.
+        speed_in_flight: Searches in flight from which every search runs in 'speed'.
+        balanced_latency: Smoothed search latency in seconds from which
+            'quality' becomes 'balanced'.
+        speed_latency: Smoothed search latency in seconds from which every
+            search runs in 'speed'.
+        history_max_chars: Optional history budget, in characters, applied to
+            downgraded searches.
+        ewma_alpha: Weight of the newest latency in the smoothed latency.
+    """
+
+    balanced_in_flight: int | None = None
+    speed_in_flight: int | None = None
+    balanced_latency: float | None = None
+    speed_latency: float | None = None
+    history_max_chars: int | None = None
+    ewma_alpha: float = 0.3
+
+
+@dataclass(frozen=True)
+class DegradationStats:
+    """Snapshot of the load and the degradation it causes.
+
+    Attributes:
+        in_flight: Searches currently running.
+        ewma_latency: Smoothed latency in seconds, None before the first search.
+        mode_cap: Slowest optimization mode currently allowed, None if any is.
+        degraded: Searches downgraded since startup.
+    """
+
+    in_flight: int
+    ewma_latency: float | None
+    mode_cap: OptimizationMode | None
+    degraded: int
+
+
+def _reached(value: float | None, threshold: float | None) -> bool:
+    """Whether a load signal is at or above its threshold."""
+    return value is not None and threshold is not None and value >= threshold
+
+
+class LoadDegrader:
+    """Tracks server load and caps the optimization mode of new searches.
+
+    Load is measured as the number of searches in flight and the smoothed
+    latency of recent successful searches, counted where they leave for
+    the backend (see LoadTrackingSearchAdapter) so that cache hits and
+    coalesced searches do not hide a slow backend. Past a policy threshold,
+    'quality' searches are run in 'balanced' mode, and past the next one
+    every search runs in 'speed' mode, until the load falls again.
+
+    Attributes:
+        policy: When searches are downgraded.
+        _clock: Time source, in seconds.
+        _in_flight: Searches currently running.
+        _ewma_latency: Smoothed latency in seconds, None before the first search.
+        _degraded: Searches downgraded since startup.
+    """
+
+    def __init__(
+        self, policy: DegradationPolicy, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize LoadDegrader.
+
+        Args:
+            policy: When searches are downgraded.
+            clock: Time source, in seconds.
+        """
+        self.policy = policy
+        self._clock = clock
+        self._in_flight = 0
+        self._ewma_latency: float | None = None
+        self._degraded = 0
+
+    @property
+    def stats(self) -> DegradationStats:
+        """Current load, mode cap and degradation counter."""
+        return DegradationStats(
+            in_flight=self._in_flight,
+            ewma_latency=self._ewma_latency,
+            mode_cap=self._mode_cap(),
+            degraded=self._degraded,
+        )
+
+    def _mode_cap(self) -> OptimizationMode | None:
+        """Compute the slowest optimization mode the current load allows.
+
+        Returns:
+            The mode cap, or None if searches run in their requested mode.
+        """
+        policy = self.policy
+        if _reached(self._in_flight, policy.speed_in_flight) or _reached(
+            self._ewma_latency, policy.speed_latency
+        ):
+            return OptimizationMode.SPEED
+        if _reached(self._in_flight, policy.balanced_in_flight) or _reached(
+            self._ewma_latency, policy.balanced_latency
+        ):
+            return OptimizationMode.BALANCED
+        return None
+
+    def degrade(self, mode: OptimizationMode) -> OptimizationMode:
+        """Choose the optimization mode a new search runs with.
+
+        Args:
+            mode: The requested optimization mode.
+
+        Returns:
+            The requested mode, or a faster one while the server is loaded.
+        """
+        cap = self._mode_cap()
+        if cap is None or _MODE_ORDER.index(mode) <= _MODE_ORDER.index(cap):
+            return mode
+        self._degraded += 1
+        return cap
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count a search as in flight, and record its latency if it succeeds.
+
+        Yields:
+            None.
+        """
+        self._in_flight += 1
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+        latency = self._clock() - started
+        self._ewma_latency = (
+            latency
+            if self._ewma_latency is None
+            else self.policy.ewma_alpha * latency
+            + (1 - self.policy.ewma_alpha) * self._ewma_latency
+        )
+
+
+class LoadTrackingSearchAdapter(SearchPort):
+    """SearchPort decorator reporting the searches it passes on to a degrader.
+
+    Placed below the caches and single-flight, it only sees searches that
+    reach the backend, so their count and latency measure the backend's load.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _degrader: The load tracker the searches are reported to.
+    """
+
+    def __init__(self, inner: SearchPort, degrader: LoadDegrader) -> None:
+        """Initialize LoadTrackingSearchAdapter.
+
+        Args:
+            inner: The search port whose load is tracked.
+            degrader: The load tracker the searches are reported to.
+        """
+        self._inner = inner
+        self._degrader = degrader
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search, counting it towards the load.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        with self._degrader.track():
+            return await self._inner.search(request)
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, counting it towards the load until it ends.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        with self._degrader.track():
+            async for chunk in self._inner.search_stream(request):
+                yield chunk
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
@@ -1,5 +1,7 @@
 """Application requests - Pydantic DTOs for input validation."""
 
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -50,13 +52,25 @@ class SearchRequestDTO(BaseModel):
 
     Attributes:
         query: The search query string.
-        chat_model: Configuration for the chat model.
-        embedding_model: Configuration for the embedding model.
+        chat_model: Optional chat model; defaults to the server's model route
+            for the focus mode, with its fallbacks.
+        embedding_model: Optional embedding model; defaults to the server's
+            model route for the focus mode.
         focus_mode: The search focus mode.
         optimization_mode: The optimization mode for search.
-        history: Conversation history as list of [role, content] tuples.
+        history: Conversation history as list of [role, content] tuples. With a
+            session id, only the turns not yet known to the server.
+        session_id: Optional id of a server-side session holding the history.
         system_instructions: Optional custom system instructions.
         stream: Whether to stream the response.
+        bypass_cache: Whether to skip cached results and fetch a fresh one.
+        deadline_ms: Optional time budget in milliseconds for the whole search.
+        max_sources: Optional maximum number of sources returned.
+        snippet_max_chars: Optional maximum length of each source snippet.
+        dedupe_sources: Optional de-duplication of sources by URL or domain.
+        allow_degradation: Whether the server may lower the optimization mode
+            while under load.
+        output_format: Optional answer layout: full Markdown or compact text.
     """
 
     model_config = ConfigDict(
@@ -79,13 +93,27 @@ class SearchRequestDTO(BaseModel):
                 ],
                 "systemInstructions": "Focus on providing accurate information",
                 "stream": False,
+                "bypassCache": False,
+                "deadlineMs": 15000,
+                "maxSources": 5,
+                "snippetMaxChars": 200,
+                "dedupeSources": "domain",
+                "outputFormat": "compact",
             }
         }
     )
 
     query: str = Field(..., min_length=1, description="The search query string")
-    chat_model: ChatModelRequest = Field(..., alias="chatModel")
-    embedding_model: EmbeddingModelRequest = Field(..., alias="embeddingModel")
+    chat_model: ChatModelRequest | None = Field(
+        default=None,
+        alias="chatModel",
+        description="Chat model; the server chooses one, with fallbacks, when omitted",
+    )
+    embedding_model: EmbeddingModelRequest | None = Field(
+        default=None,
+        alias="embeddingModel",
+        description="Embedding model; the server chooses one when omitted",
+    )
     focus_mode: str = Field(
         default="webSearch",
         alias="focusMode",
@@ -98,7 +126,20 @@ class SearchRequestDTO(BaseModel):
     )
     history: list[list[str]] = Field(
         default_factory=list,
-        description="Conversation history as list of [role, content] pairs",
+        description=(
+            "Conversation history as list of [role, content] pairs; with a "
+            "sessionId, only turns the server has not seen"
+        ),
+    )
+    session_id: str | None = Field(
+        default=None,
+        alias="sessionId",
+        min_length=1,
+        max_length=128,
+        description=(
+            "Server-side session keeping the conversation history; each search "
+            "adds its query and answer to it"
+        ),
     )
     system_instructions: str | None = Field(
         default=None,
@@ -106,3 +147,80 @@ class SearchRequestDTO(BaseModel):
         description="Custom system instructions",
     )
     stream: bool = Field(default=False, description="Whether to stream the response")
+    bypass_cache: bool = Field(
+        default=False,
+        alias="bypassCache",
+        description="Skip cached results and fetch a fresh answer",
+    )
+    deadline_ms: int | None = Field(
+        default=None,
+        alias="deadlineMs",
+        gt=0,
+        description="Time budget in milliseconds for the whole search, queuing included",
+    )
+    max_sources: int | None = Field(
+        default=None,
+        alias="maxSources",
+        ge=0,
+        description="Maximum number of sources returned",
+    )
+    snippet_max_chars: int | None = Field(
+        default=None,
+        alias="snippetMaxChars",
+        ge=0,
+        description="Maximum length of each source snippet; 0 drops snippets",
+    )
+    dedupe_sources: Literal["none", "url", "domain"] | None = Field(
+        default=None,
+        alias="dedupeSources",
+        description="Drop sources repeating an earlier source's URL or domain",
+    )
+    allow_degradation: bool = Field(
+        default=True,
+        alias="allowDegradation",
+        description="Whether the server may lower the optimization mode while under load",
+    )
+    output_format: Literal["markdown", "compact"] | None = Field(
+        default=None,
+        alias="outputFormat",
+        description="Markdown with snippets, or compact text listing source titles and URLs",
+    )
+
+
+class BatchSearchRequestDTO(BaseModel):
+    """Request DTO for running several searches concurrently.
+
+    Attributes:
+        searches: The searches to run, answered in the same order.
+        timeout: Optional deadline in seconds for the whole batch.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "searches": [
+                    {
+                        "query": "What is the capital of France?",
+                        "chatModel": {
+                            "providerId": "a1850332-621f-4960-b005-b005b8680328",
+                            "key": "anthropic/claude-sonnet-4.5",
+                        },
+                        "embeddingModel": {
+                            "providerId": "a1850332-621f-4960-b005-b005b8680328",
+                            "key": "openai/text-embedding-3-small",
+                        },
+                    }
+                ],
+                "timeout": 60,
+            }
+        }
+    )
+
+    searches: list[SearchRequestDTO] = Field(
+        ..., min_length=1, max_length=50, description="Searches to run concurrently"
+    )
+    timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Deadline in seconds for the whole batch; unfinished searches fail",
+    )
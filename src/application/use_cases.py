@@ -1,16 +1,86 @@
 """Application use cases - Business logic orchestration."""
 
+import asyncio
+import math
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import replace
+
+from application.degradation import LoadDegrader
 from application.requests import SearchRequestDTO
 from domain.entities import (
+    ANONYMOUS_CLIENT,
+    BatchSearchItem,
     ChatModel,
     EmbeddingModel,
     FocusMode,
     HistoryEntry,
+    ModelRoutes,
     OptimizationMode,
+    SearchChunk,
     SearchRequest,
     SearchResult,
+    SourceDedupe,
+    SourceLimits,
+)
+from domain.ports import (
+    MetricsPort,
+    SearchDeadlineError,
+    SearchError,
+    SearchPort,
+    SearchUnavailableError,
+    SessionStorePort,
+    SpanPort,
+    TracerPort,
 )
-from domain.ports import SearchPort
+
+# Source limits that keep every source, for use cases given no defaults
+_NO_LIMITS = SourceLimits()
+
+
+def trim_history(
+    history: Sequence[HistoryEntry], max_chars: int | None
+) -> tuple[HistoryEntry, ...]:
+    """Keep the most recent history turns fitting in a character budget.
+
+    Trimming drops whole turns: answers whose human entry did not fit are
+    dropped with it, so the history kept never opens with an answer.
+
+    Args:
+        history: Conversation history, oldest entry first.
+        max_chars: Maximum total content length, or None for no limit.
+
+    Returns:
+        The newest entries whose content fits in the budget, oldest first.
+    """
+    if max_chars is None:
+        return tuple(history)
+
+    start = len(history)
+    remaining = max_chars
+    while start > 0 and len(history[start - 1].content) <= remaining:
+        start -= 1
+        remaining -= len(history[start].content)
+    if start > 0:
+        while start < len(history) and history[start].role != "human":
+            start += 1
+    return tuple(history[start:])
+
+
+def describe_error(error: SearchError) -> str:
+    """Describe a search failure to the client.
+
+    Args:
+        error: The search failure.
+
+    Returns:
+        The error message, followed by when to retry if the search was
+        refused for lack of capacity and the refusal says so.
+    """
+    if isinstance(error, SearchUnavailableError) and error.retry_after is not None:
+        return f"{error.message}. Retry after {math.ceil(error.retry_after)}s."
+    return error.message
 
 
 class SearchUseCase:
@@ -22,49 +92,521 @@ class SearchUseCase:
     3. Delegating to the SearchPort for execution
     4. Returning the SearchResult
 
+    Requests carrying a session id are answered with the session's stored
+    history, and their query and answer are added to it afterwards. The
+    history sent upstream is cut to its most recent `history_max_chars`.
+
+    With a degrader, searches that allow it run in a faster optimization
+    mode while the server is under load, and report the mode they ran with.
+
+    Searches naming no model are sent to the model route of their focus
+    mode, with the route's later chat models as fallbacks.
+
     Attributes:
         _search_port: The port implementation for search operations.
+        _metrics: Optional recorder of search latency and errors.
+        _tracer: Optional tracer spanning each search.
+        _sessions: Optional store of server-side conversation histories.
+        _history_max_chars: Optional budget for the history sent upstream.
+        _source_limits: Source limits applied where a request sets none.
+        _degrader: Optional load tracker downgrading searches under load.
+        _model_routes: Optional models used where a request names none.
     """
 
-    def __init__(self, search_port: SearchPort) -> None:
+    def __init__(
+        self,
+        search_port: SearchPort,
+        metrics: MetricsPort | None = None,
+        tracer: TracerPort | None = None,
+        sessions: SessionStorePort | None = None,
+        history_max_chars: int | None = None,
+        source_limits: SourceLimits = _NO_LIMITS,
+        degrader: LoadDegrader | None = None,
+        model_routes: ModelRoutes | None = None,
+    ) -> None:
         """Initialize SearchUseCase.
 
         Args:
             search_port: The port implementation for search operations.
+            metrics: Optional recorder of search latency and errors.
+            tracer: Optional tracer spanning each search.
+            sessions: Optional store of server-side conversation histories.
+                Without it, requests with a session id are rejected.
+            history_max_chars: Optional budget, in characters, for the
+                history sent upstream; older entries are dropped first.
+            source_limits: Source limits applied where a request sets none.
+            degrader: Optional load tracker, shared by every use case, that
+                downgrades searches while the backend is under load. Load is
+                reported to it by a LoadTrackingSearchAdapter in the port stack.
+            model_routes: Optional models, by focus mode, used where a request
+                names none. Without it, requests must name their models.
         """
         self._search_port = search_port
+        self._metrics = metrics
+        self._tracer = tracer
+        self._sessions = sessions
+        self._history_max_chars = history_max_chars
+        self._source_limits = source_limits
+        self._degrader = degrader
+        self._model_routes = model_routes
 
-    async def execute(self, request_dto: SearchRequestDTO) -> SearchResult:
-        """Execute a search operation.
+    def _span(
+        self, name: str, request_dto: SearchRequestDTO | None = None
+    ) -> AbstractContextManager[SpanPort | None]:
+        """Open a span, if searches are traced."""
+        if self._tracer is None:
+            return nullcontext()
+        attributes = (
+            {
+                "search.focus_mode": request_dto.focus_mode,
+                "search.optimization_mode": request_dto.optimization_mode,
+                "search.chat_model": (
+                    request_dto.chat_model.key if request_dto.chat_model is not None else "default"
+                ),
+                "search.stream": request_dto.stream,
+            }
+            if request_dto is not None
+            else None
+        )
+        return self._tracer.span(name, attributes)
+
+    def _measure(self, request: SearchRequest) -> AbstractContextManager[None]:
+        """Measure a search end to end, if metrics are recorded."""
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.measure_search(request)
+
+    def _degrade(self, request_dto: SearchRequestDTO, request: SearchRequest) -> SearchRequest:
+        """Lower the optimization mode of a search while the server is loaded.
 
         Args:
             request_dto: The validated search request DTO.
+            request: The domain search request.
 
         Returns:
-            SearchResult containing the response and sources.
+            The request, downgraded (with its history cut to the policy's
+            budget) if the load calls for it and the client allows it.
+        """
+        if self._degrader is None or not request_dto.allow_degradation:
+            return request
+        mode = self._degrader.degrade(request.optimization_mode)
+        if mode == request.optimization_mode:
+            return request
+        return replace(
+            request,
+            optimization_mode=mode,
+            history=trim_history(request.history, self._degrader.policy.history_max_chars),
+        )
+
+    @staticmethod
+    def _degraded_to(
+        request_dto: SearchRequestDTO, request: SearchRequest
+    ) -> OptimizationMode | None:
+        """The mode a search was downgraded to, or None if it runs as requested."""
+        if request.optimization_mode == request_dto.optimization_mode:
+            return None
+        return request.optimization_mode
+
+    @staticmethod
+    def _session_key(request_dto: SearchRequestDTO, client_id: str | None) -> str | None:
+        """The store key of a request's session, scoped to the client naming it.
+
+        Session ids are chosen by clients, so a client can only reach the
+        sessions it created, not those of another client using the same id.
+        """
+        if request_dto.session_id is None:
+            return None
+        return f"{client_id or ANONYMOUS_CLIENT}/{request_dto.session_id}"
+
+    @staticmethod
+    def _new_history(request_dto: SearchRequestDTO) -> tuple[HistoryEntry, ...]:
+        """Convert the history sent with a request into domain entities."""
+        return tuple(
+            HistoryEntry(role=entry[0], content=entry[1]) for entry in request_dto.history
+        )
+
+    async def _load_history(
+        self, request_dto: SearchRequestDTO, client_id: str | None
+    ) -> tuple[HistoryEntry, ...]:
+        """Assemble the history to send upstream.
+
+        Args:
+            request_dto: The validated search request DTO.
+            client_id: Identity of the client that sent the search, if known.
+
+        Returns:
+            The session history followed by the request's own turns, cut to
+            the history budget.
 
         Raises:
-            SearchError: If the search operation fails.
+            SearchError: If the request names a session but sessions are disabled.
+        """
+        history = self._new_history(request_dto)
+        session_key = self._session_key(request_dto, client_id)
+        if session_key is not None:
+            if self._sessions is None:
+                raise SearchError(message="Sessions are not enabled on this server")
+            history = await self._sessions.get_history(session_key) + history
+        return trim_history(history, self._history_max_chars)
+
+    async def _remember(
+        self, request_dto: SearchRequestDTO, client_id: str | None, message: str
+    ) -> None:
+        """Add the request's turns and the answer to its session, if any.
+
+        Args:
+            request_dto: The validated search request DTO.
+            client_id: Identity of the client that sent the search, if known.
+            message: The answer to the request's query.
+        """
+        session_key = self._session_key(request_dto, client_id)
+        if session_key is None or self._sessions is None:
+            return
+        await self._sessions.append(
+            session_key,
+            (
+                *self._new_history(request_dto),
+                HistoryEntry(role="human", content=request_dto.query),
+                HistoryEntry(role="assistant", content=message),
+            ),
+        )
+
+    def _build_source_limits(self, request_dto: SearchRequestDTO) -> SourceLimits:
+        """Combine the request's source limits with the defaults.
+
+        Args:
+            request_dto: The validated search request DTO.
+
+        Returns:
+            The source limits of the request, defaults filling the gaps.
         """
-        # Direct transformations from DTO to domain entities
-        chat_model = ChatModel(**request_dto.chat_model.model_dump(by_alias=False))
-        embedding_model = EmbeddingModel(
-            **request_dto.embedding_model.model_dump(by_alias=False)
+        defaults = self._source_limits
+        return SourceLimits(
+            max_sources=(
+                request_dto.max_sources
+                if request_dto.max_sources is not None
+                else defaults.max_sources
+            ),
+            snippet_max_chars=(
+                request_dto.snippet_max_chars
+                if request_dto.snippet_max_chars is not None
+                else defaults.snippet_max_chars
+            ),
+            dedupe=(
+                SourceDedupe(request_dto.dedupe_sources)
+                if request_dto.dedupe_sources is not None
+                else defaults.dedupe
+            ),
         )
-        history_entries = tuple(
-            HistoryEntry(role=entry[0], content=entry[1])
-            for entry in request_dto.history
+
+    def _build_models(
+        self, request_dto: SearchRequestDTO, focus_mode: FocusMode
+    ) -> tuple[ChatModel, tuple[ChatModel, ...], EmbeddingModel]:
+        """Choose the models of a search.
+
+        Args:
+            request_dto: The validated search request DTO.
+            focus_mode: The search focus mode.
+
+        Returns:
+            The chat model, its fallbacks and the embedding model. Models the
+            request names are used as is, without fallbacks.
+
+        Raises:
+            SearchError: If the request names no model and no route is configured.
+        """
+        route = self._model_routes.route(focus_mode) if self._model_routes else None
+        no_models = (
+            "chatModel and embeddingModel are required: "
+            "no default models are configured on this server"
         )
 
-        request = SearchRequest(
+        if request_dto.chat_model is not None:
+            chat_model = ChatModel(**request_dto.chat_model.model_dump(by_alias=False))
+            fallbacks: tuple[ChatModel, ...] = ()
+        elif route is not None:
+            chat_model, *rest = route.chat_models
+            fallbacks = tuple(rest)
+        else:
+            raise SearchError(message=no_models)
+
+        if request_dto.embedding_model is not None:
+            embedding_model = EmbeddingModel(
+                **request_dto.embedding_model.model_dump(by_alias=False)
+            )
+        elif route is not None:
+            embedding_model = route.embedding_model
+        else:
+            raise SearchError(message=no_models)
+        return chat_model, fallbacks, embedding_model
+
+    def _build_request(
+        self,
+        request_dto: SearchRequestDTO,
+        history: tuple[HistoryEntry, ...],
+        client_id: str | None,
+    ) -> SearchRequest:
+        """Transform a validated DTO into a domain SearchRequest.
+
+        Args:
+            request_dto: The validated search request DTO.
+            history: The conversation history to send.
+            client_id: Identity of the client that sent the search, if known.
+
+        Returns:
+            The domain search request.
+
+        Raises:
+            SearchError: If the request names no model and no route is configured.
+        """
+        focus_mode = FocusMode(request_dto.focus_mode)
+        chat_model, fallbacks, embedding_model = self._build_models(request_dto, focus_mode)
+
+        return SearchRequest(
             query=request_dto.query,
             chat_model=chat_model,
             embedding_model=embedding_model,
-            focus_mode=FocusMode(request_dto.focus_mode),
+            focus_mode=focus_mode,
             optimization_mode=OptimizationMode(request_dto.optimization_mode),
-            history=history_entries,
+            history=history,
             system_instructions=request_dto.system_instructions,
             stream=request_dto.stream,
+            bypass_cache=request_dto.bypass_cache,
+            source_limits=self._build_source_limits(request_dto),
+            chat_model_fallbacks=fallbacks,
+            deadline=(
+                time.monotonic() + request_dto.deadline_ms / 1000
+                if request_dto.deadline_ms is not None
+                else None
+            ),
+            client_id=client_id,
+        )
+
+    @staticmethod
+    def _remaining(request: SearchRequest) -> float | None:
+        """Seconds left before the request deadline, or None if it has none."""
+        if request.deadline is None:
+            return None
+        return max(0.0, request.deadline - time.monotonic())
+
+    @staticmethod
+    def _deadline_error(request_dto: SearchRequestDTO, cause: Exception) -> SearchDeadlineError:
+        """Build the error reported when a search misses its deadline."""
+        return SearchDeadlineError(
+            message=f"Search exceeded its deadline of {request_dto.deadline_ms} ms",
+            cause=cause,
+        )
+
+    async def execute(
+        self, request_dto: SearchRequestDTO, client_id: str | None = None
+    ) -> SearchResult:
+        """Execute a search operation.
+
+        When the request carries a deadline, the whole search, queuing
+        included, is cancelled once it passes.
+
+        Args:
+            request_dto: The validated search request DTO.
+            client_id: Identity of the client that sent the search, if known.
+
+        Returns:
+            SearchResult containing the response and sources.
+
+        Raises:
+            SearchError: If the search operation fails or misses its deadline.
+        """
+        with self._span("search", request_dto) as span:
+            history = await self._load_history(request_dto, client_id)
+            with self._span("search.build_request"):
+                request = self._degrade(
+                    request_dto, self._build_request(request_dto, history, client_id)
+                )
+            with self._measure(request):
+                try:
+                    async with asyncio.timeout(self._remaining(request)):
+                        result = await self._search_port.search(request)
+                except TimeoutError as e:
+                    raise self._deadline_error(request_dto, e) from e
+            await self._remember(request_dto, client_id, result.message)
+            degraded_to = self._degraded_to(request_dto, request)
+            if degraded_to is not None:
+                result = replace(result, metadata=replace(result.metadata, degraded_to=degraded_to))
+            if span is not None:
+                span.set_attribute("search.source_count", len(result.sources))
+                span.set_attribute("search.attempts", result.metadata.attempts)
+                span.set_attribute("search.hedged", result.metadata.hedged)
+                span.set_attribute("search.optimization_mode", request.optimization_mode)
+            return result
+
+    async def execute_stream(
+        self, request_dto: SearchRequestDTO, client_id: str | None = None
+    ) -> AsyncIterator[SearchChunk]:
+        """Execute a search operation, yielding partial results as they arrive.
+
+        Args:
+            request_dto: The validated search request DTO.
+            client_id: Identity of the client that sent the search, if known.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the search operation fails or misses its deadline.
+        """
+        with self._span("search", request_dto) as span:
+            history = await self._load_history(request_dto, client_id)
+            with self._span("search.build_request"):
+                request = self._degrade(
+                    request_dto, self._build_request(request_dto, history, client_id)
+                )
+            degraded_to = self._degraded_to(request_dto, request)
+            chunks = aiter(self._search_port.search_stream(request))
+            chunk_count = source_count = 0
+            message_parts: list[str] = []
+            with self._measure(request):
+                try:
+                    while True:
+                        # The deadline is enforced per chunk, so it never fires
+                        # while the consumer is handling a yielded chunk
+                        try:
+                            async with asyncio.timeout(self._remaining(request)):
+                                chunk = await anext(chunks)
+                        except StopAsyncIteration:
+                            await self._remember(request_dto, client_id, "".join(message_parts))
+                            return
+                        except TimeoutError as e:
+                            raise self._deadline_error(request_dto, e) from e
+                        if chunk_count == 0 and degraded_to is not None:
+                            chunk = replace(chunk, degraded_to=degraded_to)
+                        chunk_count += 1
+                        source_count = len(chunk.sources) or source_count
+                        message_parts.append(chunk.message)
+                        yield chunk
+                finally:
+                    # Ports may return any async iterator; only generators need closing
+                    if isinstance(chunks, AsyncGenerator):
+                        await chunks.aclose()
+                    if span is not None:
+                        span.set_attribute("search.chunk_count", chunk_count)
+                        span.set_attribute("search.source_count", source_count)
+                        span.set_attribute(
+                            "search.optimization_mode", request.optimization_mode
+                        )
+
+
+class BatchSearchUseCase:
+    """Use case for executing many search operations concurrently.
+
+    Searches run through the same SearchPort as single searches, with at
+    most `max_concurrency` in flight at once. Each search succeeds or fails
+    on its own, and searches still running at the batch deadline are
+    cancelled and reported as timed out.
+
+    Attributes:
+        _search_use_case: Use case executing each individual search.
+        _max_concurrency: Maximum number of searches running at once.
+        _timeout: Default deadline in seconds for a whole batch.
+    """
+
+    def __init__(
+        self,
+        search_port: SearchPort,
+        max_concurrency: int = 5,
+        timeout: float | None = None,
+        metrics: MetricsPort | None = None,
+        tracer: TracerPort | None = None,
+        sessions: SessionStorePort | None = None,
+        history_max_chars: int | None = None,
+        source_limits: SourceLimits = _NO_LIMITS,
+        degrader: LoadDegrader | None = None,
+        model_routes: ModelRoutes | None = None,
+    ) -> None:
+        """Initialize BatchSearchUseCase.
+
+        Args:
+            search_port: The port implementation for search operations.
+            max_concurrency: Maximum number of searches running at once.
+            timeout: Default deadline in seconds for a whole batch.
+            metrics: Optional recorder of search latency and errors.
+            tracer: Optional tracer spanning each search.
+            sessions: Optional store of server-side conversation histories.
+            history_max_chars: Optional budget for the history sent upstream.
+            source_limits: Source limits applied where a request sets none.
+            degrader: Optional load tracker downgrading searches under load.
+            model_routes: Optional models, by focus mode, used where a request
+                names none.
+        """
+        self._search_use_case = SearchUseCase(
+            search_port=search_port,
+            metrics=metrics,
+            tracer=tracer,
+            sessions=sessions,
+            history_max_chars=history_max_chars,
+            source_limits=source_limits,
+            degrader=degrader,
+            model_routes=model_routes,
+        )
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+
+    async def execute(
+        self,
+        request_dtos: list[SearchRequestDTO],
+        timeout: float | None = None,
+        client_id: str | None = None,
+    ) -> tuple[BatchSearchItem, ...]:
+        """Execute a batch of search operations.
+
+        Args:
+            request_dtos: The validated search request DTOs.
+            timeout: Optional deadline in seconds overriding the default.
+            client_id: Identity of the client that sent the batch, if known.
+
+        Returns:
+            One BatchSearchItem per request, in input order.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(request_dto: SearchRequestDTO) -> SearchResult:
+            async with semaphore:
+                return await self._search_use_case.execute(request_dto, client_id)
+
+        tasks = [asyncio.create_task(run(request_dto)) for request_dto in request_dtos]
+        deadline = timeout or self._timeout
+        try:
+            await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            # Unfinished searches are cancelled so the batch returns on time,
+            # and so none outlive the batch if it is cancelled itself
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return tuple(
+            self._to_item(request_dto.query, task, deadline)
+            for request_dto, task in zip(request_dtos, tasks, strict=True)
         )
 
-        return await self._search_port.search(request)
+    @staticmethod
+    def _to_item(
+        query: str, task: asyncio.Task[SearchResult], deadline: float | None
+    ) -> BatchSearchItem:
+        """Turn a finished search task into a batch item.
+
+        Args:
+            query: The query the task searched for.
+            task: The finished (or cancelled) search task.
+            deadline: The batch deadline, for the timeout message.
+
+        Returns:
+            BatchSearchItem holding the result or the error message.
+        """
+        if task.cancelled():
+            return BatchSearchItem(query=query, error=f"Timed out after {deadline}s")
+
+        error = task.exception()
+        if error is None:
+            return BatchSearchItem(query=query, result=task.result())
+        if isinstance(error, SearchError):
+            return BatchSearchItem(query=query, error=describe_error(error))
+        return BatchSearchItem(query=query, error=f"Unexpected error: {error}")
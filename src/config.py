@@ -4,23 +4,152 @@ from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from domain.entities import FocusMode
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
 
     Attributes:
         perplexica_url: Base URL for Perplexica API.
-        perplexica_timeout: Request timeout in seconds.
+        perplexica_urls: Base URLs of several Perplexica replicas to balance
+            searches over. Overrides perplexica_url when set.
+        load_balancer_strategy: How the next replica is chosen.
+        load_balancer_max_failures: Consecutive failures that eject a replica.
+        load_balancer_ejection_time: Seconds an ejected replica receives no traffic.
+        perplexica_timeout: Request timeout in seconds, used for any phase below left unset.
+        perplexica_connect_timeout: Seconds to establish a connection to Perplexica.
+        perplexica_read_timeout: Seconds to wait for each chunk of Perplexica's answer.
+        perplexica_write_timeout: Seconds to send the request body to Perplexica.
+        perplexica_pool_timeout: Seconds to wait for a free pooled connection.
+        perplexica_max_connections: Maximum number of pooled connections to Perplexica.
+        perplexica_max_keepalive_connections: Maximum number of idle keep-alive connections.
+        perplexica_keepalive_expiry: Seconds an idle keep-alive connection is kept open.
+        perplexica_http2: Whether to negotiate HTTP/2 with Perplexica (requires `h2`).
+        cache_enabled: Whether identical searches are answered from a cache.
+        cache_ttl: Seconds a cached search result stays valid.
+        cache_max_entries: Maximum number of cached search results.
+        cache_max_bytes: Maximum total size of cached search results in bytes.
+        cache_path: Optional SQLite file path to persist the cache across restarts.
+        cache_stale_after: Age in seconds after which cached results are still served
+            but revalidated in the background (up to cache_ttl). Unset disables it.
+        cache_refresh_ahead: Fraction of cache_stale_after after which frequently hit
+            results are refreshed before going stale.
+        cache_refresh_ahead_hits: Hits after which a cached result counts as frequent.
+        cache_max_refreshes: Maximum background refreshes running at once.
+        semantic_cache_enabled: Whether searches similar to past ones are answered from
+            a cache (requires the `semantic-cache` extra).
+        semantic_cache_threshold: Minimum cosine similarity for a cached result to be served.
+        semantic_cache_ttl: Seconds a semantically cached result stays valid.
+        semantic_cache_max_entries: Maximum number of semantically cached results.
+        semantic_cache_embedder: Query embedder: dependency-free hashing or a local
+            sentence-transformers model.
+        semantic_cache_model: sentence-transformers model name or path.
+        semantic_cache_index: Vector index: exact NumPy scan or approximate HNSW (hnswlib).
+        sessions_enabled: Whether clients may keep their conversation history in
+            server-side sessions (the `sessionId` search field).
+        session_ttl: Seconds an unused session is kept.
+        session_max_sessions: Maximum number of stored sessions.
+        session_max_chars: Maximum characters of history stored per session.
+        history_max_chars: Optional budget, in characters, for the history sent to
+            Perplexica with each search; older turns are dropped first.
+        degradation_enabled: Whether searches run in a faster optimization mode
+            while the server is under load (unless a search opts out).
+        degradation_balanced_in_flight: Searches in flight from which 'quality'
+            searches run in 'balanced' mode.
+        degradation_speed_in_flight: Searches in flight from which every search
+            runs in 'speed' mode.
+        degradation_balanced_latency: Smoothed search latency in seconds from which
+            'quality' searches run in 'balanced' mode.
+        degradation_speed_latency: Smoothed search latency in seconds from which
+            every search runs in 'speed' mode.
+        degradation_history_max_chars: Optional history budget, in characters, for
+            downgraded searches.
+        rate_limit_enabled: Whether each client's searches are rate limited.
+        rate_limit_per_minute: Searches per minute each client may sustain.
+        rate_limit_burst: Searches each client may send at once after being idle;
+            at least 1.
+        rate_limit_focus_modes: Per-minute rate and burst of focus modes limited
+            separately from the others (e.g. {"academicSearch": [10, 3]}).
+        client_id_header: HTTP header naming the client of a search, for rate
+            limits and fair queuing; the MCP client id, session or remote
+            address is used without it.
+        client_weights: Relative share of each client (by id) in rate limits and
+            admission queues; unlisted clients weigh 1. A weight may not scale any
+            burst below 1.
+        singleflight_enabled: Whether concurrent identical searches share one upstream call.
+        batch_max_concurrency: Maximum number of searches of a batch running at once.
+        batch_timeout: Default deadline in seconds for a whole batch of searches.
+        admission_enabled: Whether concurrent searches to Perplexica are limited.
+        admission_max_in_flight_speed: Maximum concurrent 'speed' searches.
+        admission_max_in_flight_balanced: Maximum concurrent 'balanced' searches.
+        admission_max_in_flight_quality: Maximum concurrent 'quality' searches.
+        admission_max_queue: Maximum searches per mode waiting for a free slot.
+        admission_max_queue_time: Maximum seconds a search waits for a free slot.
+        admission_max_queue_per_client: Maximum searches of one client per mode
+            waiting for a free slot. Unset only applies admission_max_queue.
+        retry_enabled: Whether transient Perplexica failures are retried.
+        retry_max_attempts: Maximum attempts per search, including the first one.
+        retry_base_delay: Backoff delay in seconds before the first retry.
+        retry_max_delay: Maximum backoff delay (and honoured Retry-After) in seconds.
+        retry_status_codes: HTTP status codes from Perplexica that are retried.
+        retry_budget_ratio: Retries allowed per search, averaged over time.
+        retry_budget_max_tokens: Maximum burst of retries the budget allows.
+        hedging_enabled: Whether slow searches are duplicated to cut tail latency.
+            Needs a hedging fallback chat model or several perplexica_urls.
+        hedging_percentile: Percentile of recent latencies after which a search is hedged.
+        hedging_window: Number of recent latencies the percentile is computed over.
+        hedging_min_samples: Latencies needed before the percentile is used.
+        hedging_initial_delay: Seconds before hedging until enough latencies are known.
+        hedging_min_delay: Minimum seconds a search runs before it is hedged.
+        hedging_budget_ratio: Hedges allowed per search, averaged over time.
+        hedging_budget_max_tokens: Maximum burst of hedges the budget allows.
+        hedging_fallback_chat_model_provider_id: Provider ID of the chat model used by
+            hedged attempts; defaults to default_chat_model_provider_id.
+        hedging_fallback_chat_model_key: Key of the chat model used by hedged attempts.
+            Unset repeats the search unchanged, on another replica when load balanced.
+        circuit_breaker_enabled: Whether searches fail fast while Perplexica is failing.
+        circuit_breaker_window: Sliding window in seconds over which calls are judged.
+        circuit_breaker_min_calls: Calls needed in the window before the breaker may trip.
+        circuit_breaker_failure_rate: Failure ratio that trips the breaker.
+        circuit_breaker_slow_call_duration: Seconds after which a call counts as slow.
+        circuit_breaker_slow_call_rate: Slow-call ratio that trips the breaker.
+        circuit_breaker_open_duration: Seconds the breaker stays open before probing.
+        circuit_breaker_half_open_calls: Trial calls made while probing recovery.
+        metrics_enabled: Whether Prometheus metrics are recorded and served on /metrics.
+        tracing_enabled: Whether OpenTelemetry spans are recorded (requires the `tracing` extra).
+        tracing_exporter: Where spans are sent: an OTLP/HTTP collector or stdout.
+        tracing_endpoint: OTLP traces endpoint; defaults to the OTEL_EXPORTER_OTLP_* variables.
+        tracing_service_name: Service name reported with every span.
+        tracing_sample_ratio: Share of new traces recorded.
         transport: Transport type for MCP server (stdio, sse, streamable-http).
         host: Host to bind the server to (for sse and streamable-http).
         port: Port to bind the server to (for sse and streamable-http).
-        default_chat_model_provider_id: Default provider ID for chat model.
+        workers: Worker processes serving streamable-http; above 1, requests are
+            stateless and spread over the workers, and sessions, metrics, rate
+            limits and admission control are refused.
+        shutdown_timeout: Seconds a stopping worker waits for in-flight requests.
+        default_chat_model_provider_id: Default provider ID for chat model. Searches
+            may omit their models once this and the embedding provider ID are set.
         default_chat_model_key: Default key for chat model.
+        default_chat_model_fallbacks: Chat models tried, in order, when the default
+            one fails or is slow, as 'providerId:key' or a key of the default provider.
         default_embedding_model_provider_id: Default provider ID for embedding model.
         default_embedding_model_key: Default key for embedding model.
+        model_routes: Chat models, in order of preference, for searches of given focus
+            modes (e.g. {"academicSearch": ["p1:openai/gpt-4o", "openai/gpt-4o-mini"]}).
+        model_fallback_max_failures: Consecutive failures after which a chat model is
+            skipped in favour of its fallbacks.
+        model_fallback_ejection_time: Seconds a failing chat model is skipped.
+        model_fallback_slow_latency: Smoothed latency in seconds past which a chat model
+            is tried after its fallbacks.
         default_focus_mode: Default search focus mode.
         default_optimization_mode: Default optimization mode.
         default_system_instructions: Default system instructions for searches.
+        default_max_sources: Default maximum number of sources returned per search.
+        default_snippet_max_chars: Default maximum length of each source snippet.
+        default_dedupe_sources: Default de-duplication of sources by URL or domain.
+        default_output_format: Default answer layout: full Markdown or compact text.
     """
 
     model_config = SettingsConfigDict(
@@ -32,12 +161,128 @@ class Settings(BaseSettings):
 
     # Perplexica API configuration
     perplexica_url: str = "http://localhost:3000"
+    perplexica_urls: list[str] = []
     perplexica_timeout: float = 120.0
+    perplexica_connect_timeout: float | None = 10.0
+    perplexica_read_timeout: float | None = None
+    perplexica_write_timeout: float | None = 30.0
+    perplexica_pool_timeout: float | None = 30.0
+
+    # Perplexica connection pool configuration
+    perplexica_max_connections: int = 100
+    perplexica_max_keepalive_connections: int = 20
+    perplexica_keepalive_expiry: float = 5.0
+    perplexica_http2: bool = False
+
+    # Load balancing across several Perplexica replicas
+    load_balancer_strategy: Literal["round_robin", "least_in_flight", "ewma"] = "least_in_flight"
+    load_balancer_max_failures: int = 3
+    load_balancer_ejection_time: float = 30.0
+
+    # Search result cache configuration
+    cache_enabled: bool = False
+    cache_ttl: float = 300.0
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_path: str | None = None
+    cache_stale_after: float | None = None
+    cache_refresh_ahead: float = 0.8
+    cache_refresh_ahead_hits: int = 3
+    cache_max_refreshes: int = 2
+
+    # Semantic cache answering near-duplicate queries
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.85
+    semantic_cache_ttl: float = 3600.0
+    semantic_cache_max_entries: int = 1000
+    semantic_cache_embedder: Literal["hashing", "sentence-transformers"] = "hashing"
+    semantic_cache_model: str = "all-MiniLM-L6-v2"
+    semantic_cache_index: Literal["numpy", "hnsw"] = "numpy"
+
+    # Server-side conversation sessions
+    sessions_enabled: bool = False
+    session_ttl: float = 1800.0
+    session_max_sessions: int = 1000
+    session_max_chars: int = 100_000
+    history_max_chars: int | None = None
+
+    # Load-aware degradation of the optimization mode
+    degradation_enabled: bool = False
+    degradation_balanced_in_flight: int | None = 16
+    degradation_speed_in_flight: int | None = 32
+    degradation_balanced_latency: float | None = 30.0
+    degradation_speed_latency: float | None = 60.0
+    degradation_history_max_chars: int | None = None
+
+    # Per-client rate limiting and fair queuing
+    rate_limit_enabled: bool = False
+    rate_limit_per_minute: float = 60.0
+    rate_limit_burst: float = 10.0
+    rate_limit_focus_modes: dict[FocusMode, tuple[float, float]] = {}
+    client_id_header: str = "X-Client-Id"
+    client_weights: dict[str, float] = {}
+
+    # Concurrent identical searches share a single upstream call
+    singleflight_enabled: bool = False
+
+    # Batch search configuration
+    batch_max_concurrency: int = 5
+    batch_timeout: float = 120.0
+
+    # Admission control in front of Perplexica
+    admission_enabled: bool = False
+    admission_max_in_flight_speed: int = 16
+    admission_max_in_flight_balanced: int = 8
+    admission_max_in_flight_quality: int = 4
+    admission_max_queue: int = 64
+    admission_max_queue_time: float = 30.0
+    admission_max_queue_per_client: int | None = None
+
+    # Retry of transient Perplexica failures
+    retry_enabled: bool = False
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 10.0
+    retry_status_codes: list[int] = [429, 502, 503, 504]
+    retry_budget_ratio: float = 0.2
+    retry_budget_max_tokens: float = 10.0
+
+    # Hedging of slow searches
+    hedging_enabled: bool = False
+    hedging_percentile: float = 0.95
+    hedging_window: int = 200
+    hedging_min_samples: int = 20
+    hedging_initial_delay: float = 10.0
+    hedging_min_delay: float = 1.0
+    hedging_budget_ratio: float = 0.1
+    hedging_budget_max_tokens: float = 5.0
+    hedging_fallback_chat_model_provider_id: str | None = None
+    hedging_fallback_chat_model_key: str | None = None
+
+    # Circuit breaker around Perplexica
+    circuit_breaker_enabled: bool = False
+    circuit_breaker_window: float = 60.0
+    circuit_breaker_min_calls: int = 10
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_duration: float = 60.0
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_open_duration: float = 30.0
+    circuit_breaker_half_open_calls: int = 2
+
+    # Observability
+    metrics_enabled: bool = False
+    tracing_enabled: bool = False
+    tracing_exporter: Literal["otlp", "console"] = "otlp"
+    tracing_endpoint: str | None = None
+    tracing_service_name: str = "mcp-perplexica"
+    tracing_sample_ratio: float = 1.0
 
     # MCP Server configuration
     transport: Literal["stdio", "sse", "streamable-http"] = "stdio"
     host: str = "127.0.0.1"
     port: int = 8000
+    workers: int = 1
+    shutdown_timeout: int = 30
 
     # Default model configuration
     default_chat_model_provider_id: str = ""
@@ -45,7 +290,20 @@ class Settings(BaseSettings):
     default_embedding_model_provider_id: str = ""
     default_embedding_model_key: str = "openai/text-embedding-3-small"
 
+    # Model routing and fallback chains for searches naming no model
+    default_chat_model_fallbacks: list[str] = []
+    model_routes: dict[FocusMode, list[str]] = {}
+    model_fallback_max_failures: int = 3
+    model_fallback_ejection_time: float = 30.0
+    model_fallback_slow_latency: float | None = None
+
     # Default search configuration
     default_focus_mode: str = "webSearch"
     default_optimization_mode: str = "balanced"
     default_system_instructions: str | None = None
+
+    # Default response size controls
+    default_max_sources: int | None = None
+    default_snippet_max_chars: int | None = None
+    default_dedupe_sources: Literal["none", "url", "domain"] = "none"
+    default_output_format: Literal["markdown", "compact"] = "markdown"
@@ -1,53 +1,751 @@
 """Dependency injection - Factory functions for application components."""
 
-from application.use_cases import SearchUseCase
-from config import Settings
-from infrastructure.perplexica.adapter import PerplexicaAdapter
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import httpx
 from mcp.server.fastmcp import FastMCP
 
+from application.degradation import DegradationPolicy, LoadDegrader, LoadTrackingSearchAdapter
+from application.use_cases import BatchSearchUseCase, SearchUseCase
+from config import Settings
+from domain.entities import (
+    ChatModel,
+    EmbeddingModel,
+    ModelRoute,
+    ModelRoutes,
+    OptimizationMode,
+    SourceDedupe,
+    SourceLimits,
+)
+from domain.ports import SearchPort, TracerPort
+
+# Adapters are imported by their getters, so that starting the server only
+# loads the layers (and their libraries) that are enabled, when first used
+if TYPE_CHECKING:
+    from infrastructure.admission.adapter import AdmissionSearchAdapter
+    from infrastructure.cache.adapter import CachingSearchAdapter
+    from infrastructure.circuit_breaker.adapter import CircuitBreakerSearchAdapter
+    from infrastructure.hedging.adapter import HedgingSearchAdapter
+    from infrastructure.load_balancer.adapter import LoadBalancingSearchAdapter
+    from infrastructure.metrics.adapter import PrometheusMetrics
+    from infrastructure.perplexica.adapter import PerplexicaAdapter
+    from infrastructure.rate_limit.adapter import RateLimitingSearchAdapter
+    from infrastructure.retry.adapter import RetryingSearchAdapter
+    from infrastructure.routing.adapter import ModelRoutingSearchAdapter
+    from infrastructure.semantic_cache.adapter import SemanticCachingSearchAdapter
+    from infrastructure.sessions.adapter import MemorySessionStore
+
 settings = Settings()
 
+
+@asynccontextmanager
+async def app_lifespan() -> AsyncIterator[None]:
+    """Hold the shared search port open for the life of an HTTP server process.
+
+    The Perplexica adapters are opened at startup, so the first search
+    finds a warm connection pool, and the search port (clients, caches and
+    background refreshes) is drained and closed at shutdown, however many
+    MCP sessions came and went in between. The tracer is closed last, so
+    spans of the searches drained are exported too.
+
+    Yields:
+        None.
+    """
+    for adapter in get_perplexica_adapters():
+        await adapter.open()
+    try:
+        yield
+    finally:
+        await get_search_port().close()
+        await _close_tracer()
+
+
+async def _close_tracer() -> None:
+    """Export pending spans and shut down the tracer, if tracing is enabled."""
+    tracer = get_tracer()
+    if tracer is not None:
+        await tracer.close()
+
+
+@asynccontextmanager
+async def lifespan(_: FastMCP) -> AsyncIterator[None]:
+    """Close the search port when a stdio session, and so the process, ends.
+
+    FastMCP enters this lifespan once per MCP session. Over HTTP, sessions
+    come and go while the process-wide search port stays open (see
+    app_lifespan), so they leave it alone. In stdio mode the single session
+    lasts as long as the process; its client is created by the first
+    search, so that the server answers the client's initialize request
+    without waiting for it, and closed when the session ends.
+
+    Args:
+        _: The FastMCP server instance.
+
+    Yields:
+        None.
+    """
+    try:
+        yield
+    finally:
+        # Nothing to close if no search ever created the adapters
+        if settings.transport == "stdio" and get_perplexica_adapters.cache_info().currsize:
+            await get_search_port().close()
+            await _close_tracer()
+
+
 # Create MCP server
 mcp = FastMCP(
     name="mcp-perplexica",
     instructions="""
     MCP server for Perplexica search API.
-    
+
     This server provides web search capabilities through Perplexica,
     allowing you to search the web and get AI-generated responses
     with source citations.
-    
+
     Available tools:
     - search: Perform a web search using Perplexica
+    - batch_search: Perform several web searches concurrently
     """,
     host=settings.host,
-    port=settings.port
+    port=settings.port,
+    lifespan=lifespan,
+    # Several workers share the port, so no request may depend on an earlier one
+    stateless_http=settings.workers > 1,
 )
 
 
-def get_perplexica_adapter() -> PerplexicaAdapter:
-    """Create PerplexicaAdapter instance.
+@lru_cache(maxsize=1)
+def get_metrics() -> "PrometheusMetrics | None":
+    """Get the process-wide metrics recorder, if enabled.
+
+    Returns:
+        PrometheusMetrics instance, or None.
+    """
+    if not settings.metrics_enabled:
+        return None
+
+    from infrastructure.metrics.adapter import PrometheusMetrics
+
+    return PrometheusMetrics(
+        pool_max_connections=settings.perplexica_max_connections,
+        chat_models=_configured_chat_model_keys(),
+    )
+
+
+def _configured_chat_model_keys() -> set[str]:
+    """Collect the keys of every chat model named in the settings.
+
+    Returns:
+        Keys of the default, fallback, routed and hedging chat models.
+    """
+    specs = [
+        *settings.default_chat_model_fallbacks,
+        *(spec for chain in settings.model_routes.values() for spec in chain),
+    ]
+    keys = {settings.default_chat_model_key, *(_parse_chat_model(spec).key for spec in specs)}
+    if settings.hedging_fallback_chat_model_key:
+        keys.add(settings.hedging_fallback_chat_model_key)
+    return keys
+
+
+@lru_cache(maxsize=1)
+def get_tracer() -> TracerPort | None:
+    """Get the process-wide tracer, if tracing is enabled.
+
+    OpenTelemetry is an optional dependency, so it is only imported here,
+    once tracing has been asked for.
+
+    Returns:
+        OpenTelemetryTracer exporting through the global provider it
+        installed, or None.
+    """
+    if not settings.tracing_enabled:
+        return None
+
+    from infrastructure.tracing.adapter import OpenTelemetryTracer, configure_tracing
+
+    provider = configure_tracing(
+        service_name=settings.tracing_service_name,
+        exporter=settings.tracing_exporter,
+        endpoint=settings.tracing_endpoint,
+        sample_ratio=settings.tracing_sample_ratio,
+    )
+    return OpenTelemetryTracer(tracer_provider=provider)
+
+
+@lru_cache(maxsize=1)
+def get_perplexica_adapters() -> "tuple[PerplexicaAdapter, ...]":
+    """Get the process-wide PerplexicaAdapter instances, one per backend URL.
+
+    Each adapter owns a pooled HTTP client shared by every search, so they
+    are created once and reused for the lifetime of the server process.
+
+    Returns:
+        Configured PerplexicaAdapter instances.
+    """
+    from infrastructure.perplexica.adapter import PerplexicaAdapter
+
+    timeout = httpx.Timeout(
+        settings.perplexica_timeout,
+        connect=settings.perplexica_connect_timeout or settings.perplexica_timeout,
+        read=settings.perplexica_read_timeout or settings.perplexica_timeout,
+        write=settings.perplexica_write_timeout or settings.perplexica_timeout,
+        pool=settings.perplexica_pool_timeout or settings.perplexica_timeout,
+    )
+    limits = httpx.Limits(
+        max_connections=settings.perplexica_max_connections,
+        max_keepalive_connections=settings.perplexica_max_keepalive_connections,
+        keepalive_expiry=settings.perplexica_keepalive_expiry,
+    )
+    return tuple(
+        PerplexicaAdapter(
+            base_url=url,
+            timeout=timeout,
+            limits=limits,
+            http2=settings.perplexica_http2,
+            metrics=get_metrics(),
+            tracer=get_tracer(),
+        )
+        for url in settings.perplexica_urls or [settings.perplexica_url]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_load_balancer() -> "LoadBalancingSearchAdapter | None":
+    """Get the process-wide load balancer, if several backends are configured.
+
+    Returns:
+        LoadBalancingSearchAdapter over every Perplexica adapter, or None.
+    """
+    adapters = get_perplexica_adapters()
+    if len(adapters) < 2:
+        return None
+
+    from infrastructure.load_balancer.adapter import (
+        BalancingStrategy,
+        LoadBalancingSearchAdapter,
+    )
+
+    return LoadBalancingSearchAdapter(
+        backends=dict(zip(settings.perplexica_urls, adapters, strict=True)),
+        strategy=BalancingStrategy(settings.load_balancer_strategy),
+        max_failures=settings.load_balancer_max_failures,
+        ejection_time=settings.load_balancer_ejection_time,
+    )
+
+
+def get_upstream_port() -> SearchPort:
+    """Get the port talking to Perplexica itself.
+
+    Returns:
+        The load balancer, or the single Perplexica adapter.
+    """
+    return get_load_balancer() or get_perplexica_adapters()[0]
+
+
+def _first_enabled(*layers: Callable[[], SearchPort | None]) -> SearchPort:
+    """Return the outermost enabled layer, falling back to the upstream port.
+
+    Args:
+        layers: Getters of optional layers, outermost first.
+
+    Returns:
+        The first layer that is enabled, or the upstream port.
+    """
+    for layer in layers:
+        port = layer()
+        if port is not None:
+            return port
+    return get_upstream_port()
+
+
+@lru_cache(maxsize=1)
+def get_hedging_adapter() -> "HedgingSearchAdapter | None":
+    """Get the process-wide hedging layer, if enabled.
+
+    Returns:
+        HedgingSearchAdapter wrapping the upstream port, or None.
+
+    Raises:
+        ValueError: If hedges would repeat searches unchanged on the only backend.
+    """
+    if not settings.hedging_enabled:
+        return None
+
+    fallback = None
+    if settings.hedging_fallback_chat_model_key:
+        fallback = ChatModel(
+            provider_id=settings.hedging_fallback_chat_model_provider_id
+            or settings.default_chat_model_provider_id,
+            key=settings.hedging_fallback_chat_model_key,
+        )
+    elif get_load_balancer() is None:
+        raise ValueError(
+            "HEDGING_ENABLED needs HEDGING_FALLBACK_CHAT_MODEL_KEY or several PERPLEXICA_URLS: "
+            "a hedge repeating the search on the same backend only adds load to it"
+        )
+
+    from infrastructure.attempts import RetryBudget
+    from infrastructure.hedging.adapter import HedgingPolicy, HedgingSearchAdapter
+
+    policy = HedgingPolicy(
+        percentile=settings.hedging_percentile,
+        window=settings.hedging_window,
+        min_samples=settings.hedging_min_samples,
+        initial_delay=settings.hedging_initial_delay,
+        min_delay=settings.hedging_min_delay,
+        fallback_chat_model=fallback,
+    )
+    budget = RetryBudget(
+        ratio=settings.hedging_budget_ratio,
+        max_tokens=settings.hedging_budget_max_tokens,
+    )
+    return HedgingSearchAdapter(inner=get_upstream_port(), policy=policy, budget=budget)
+
+
+def _parse_chat_model(spec: str) -> ChatModel:
+    """Parse a chat model written as 'providerId:key', or a key of the default provider.
 
     Args:
-        settings: Optional settings instance. If not provided, loads from environment.
+        spec: The chat model specification.
+
+    Returns:
+        The chat model.
+    """
+    provider_id, separator, key = spec.partition(":")
+    if not separator:
+        return ChatModel(provider_id=settings.default_chat_model_provider_id, key=spec)
+    return ChatModel(provider_id=provider_id, key=key)
+
+
+@lru_cache(maxsize=1)
+def get_model_routes() -> ModelRoutes | None:
+    """Get the models used by searches that name none, if defaults are configured.
+
+    Returns:
+        ModelRoutes built from the default_* and model_routes settings, or None.
+    """
+    if not (
+        settings.default_chat_model_provider_id and settings.default_embedding_model_provider_id
+    ):
+        return None
+
+    embedding_model = EmbeddingModel(
+        provider_id=settings.default_embedding_model_provider_id,
+        key=settings.default_embedding_model_key,
+    )
+    default_chain = (
+        ChatModel(
+            provider_id=settings.default_chat_model_provider_id,
+            key=settings.default_chat_model_key,
+        ),
+        *map(_parse_chat_model, settings.default_chat_model_fallbacks),
+    )
+    return ModelRoutes(
+        default=ModelRoute(chat_models=default_chain, embedding_model=embedding_model),
+        by_focus_mode={
+            focus_mode: ModelRoute(
+                chat_models=tuple(map(_parse_chat_model, chain)),
+                embedding_model=embedding_model,
+            )
+            for focus_mode, chain in settings.model_routes.items()
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def get_model_router() -> "ModelRoutingSearchAdapter | None":
+    """Get the process-wide chat model fallback layer, if any route has fallbacks.
+
+    Returns:
+        ModelRoutingSearchAdapter wrapping the hedging layer, or None.
+    """
+    routes = get_model_routes()
+    if routes is None or all(
+        len(route.chat_models) < 2 for route in (routes.default, *routes.by_focus_mode.values())
+    ):
+        return None
+
+    from infrastructure.routing.adapter import ModelRoutingSearchAdapter
+
+    return ModelRoutingSearchAdapter(
+        inner=_first_enabled(get_hedging_adapter),
+        max_failures=settings.model_fallback_max_failures,
+        ejection_time=settings.model_fallback_ejection_time,
+        slow_latency=settings.model_fallback_slow_latency,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_retry_adapter() -> "RetryingSearchAdapter | None":
+    """Get the process-wide retry layer, if enabled.
+
+    Returns:
+        RetryingSearchAdapter wrapping the model router, or None.
+    """
+    if not settings.retry_enabled:
+        return None
+
+    from infrastructure.attempts import RetryBudget
+    from infrastructure.retry.adapter import RetryingSearchAdapter, RetryPolicy
+
+    policy = RetryPolicy(
+        max_attempts=settings.retry_max_attempts,
+        base_delay=settings.retry_base_delay,
+        max_delay=settings.retry_max_delay,
+        retry_on_status=frozenset(settings.retry_status_codes),
+    )
+    budget = RetryBudget(
+        ratio=settings.retry_budget_ratio,
+        max_tokens=settings.retry_budget_max_tokens,
+    )
+    return RetryingSearchAdapter(
+        inner=_first_enabled(get_model_router, get_hedging_adapter),
+        policy=policy,
+        budget=budget,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_circuit_breaker() -> "CircuitBreakerSearchAdapter | None":
+    """Get the process-wide circuit breaker, if enabled.
+
+    Returns:
+        CircuitBreakerSearchAdapter wrapping the retry layer, or None.
+    """
+    if not settings.circuit_breaker_enabled:
+        return None
+
+    from infrastructure.circuit_breaker.adapter import (
+        CircuitBreakerConfig,
+        CircuitBreakerSearchAdapter,
+    )
+
+    config = CircuitBreakerConfig(
+        window=settings.circuit_breaker_window,
+        min_calls=settings.circuit_breaker_min_calls,
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        slow_call_duration=settings.circuit_breaker_slow_call_duration,
+        slow_call_rate_threshold=settings.circuit_breaker_slow_call_rate,
+        open_duration=settings.circuit_breaker_open_duration,
+        half_open_max_calls=settings.circuit_breaker_half_open_calls,
+    )
+    return CircuitBreakerSearchAdapter(
+        inner=_first_enabled(get_retry_adapter, get_model_router, get_hedging_adapter),
+        config=config,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> "AdmissionSearchAdapter | None":
+    """Get the process-wide admission controller, if enabled.
+
+    Returns:
+        AdmissionSearchAdapter wrapping the circuit breaker, or None.
+    """
+    if not settings.admission_enabled:
+        return None
+
+    from infrastructure.admission.adapter import AdmissionLimits, AdmissionSearchAdapter
+
+    max_in_flight = {
+        OptimizationMode.SPEED: settings.admission_max_in_flight_speed,
+        OptimizationMode.BALANCED: settings.admission_max_in_flight_balanced,
+        OptimizationMode.QUALITY: settings.admission_max_in_flight_quality,
+    }
+    return AdmissionSearchAdapter(
+        inner=_first_enabled(
+            get_circuit_breaker, get_retry_adapter, get_model_router, get_hedging_adapter
+        ),
+        limits={
+            mode: AdmissionLimits(
+                max_in_flight=limit,
+                max_queue=settings.admission_max_queue,
+                max_queue_time=settings.admission_max_queue_time,
+                max_queue_per_client=settings.admission_max_queue_per_client,
+            )
+            for mode, limit in max_in_flight.items()
+        },
+        client_weights=settings.client_weights,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_load_tracker() -> LoadTrackingSearchAdapter | None:
+    """Get the process-wide layer reporting backend load to the degrader, if enabled.
+
+    It sits below the caches and single-flight, so only searches reaching
+    the backend count towards the load that searches are degraded by.
+
+    Returns:
+        LoadTrackingSearchAdapter wrapping the admission-controlled adapter, or None.
+    """
+    degrader = get_degrader()
+    if degrader is None:
+        return None
+    return LoadTrackingSearchAdapter(
+        inner=_first_enabled(
+            get_admission_controller,
+            get_circuit_breaker,
+            get_retry_adapter,
+            get_model_router,
+            get_hedging_adapter,
+        ),
+        degrader=degrader,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> "SemanticCachingSearchAdapter | None":
+    """Get the process-wide semantic cache, if enabled.
+
+    NumPy and the embedding and index libraries are optional dependencies,
+    so they are only imported here, once the semantic cache has been asked for.
+
+    Returns:
+        SemanticCachingSearchAdapter wrapping the load tracker or the
+        admission-controlled adapter, or None.
+    """
+    if not settings.semantic_cache_enabled:
+        return None
+
+    from infrastructure.semantic_cache.adapter import (
+        Embedder,
+        HashingEmbedder,
+        HnswIndex,
+        NumpyIndex,
+        SemanticCachingSearchAdapter,
+        SentenceTransformerEmbedder,
+    )
+
+    embedder: Embedder = (
+        SentenceTransformerEmbedder(model_name=settings.semantic_cache_model)
+        if settings.semantic_cache_embedder == "sentence-transformers"
+        else HashingEmbedder()
+    )
+    return SemanticCachingSearchAdapter(
+        inner=_first_enabled(
+            get_load_tracker,
+            get_admission_controller,
+            get_circuit_breaker,
+            get_retry_adapter,
+            get_model_router,
+            get_hedging_adapter,
+        ),
+        embedder=embedder,
+        threshold=settings.semantic_cache_threshold,
+        ttl=settings.semantic_cache_ttl,
+        max_entries=settings.semantic_cache_max_entries,
+        index_factory=HnswIndex if settings.semantic_cache_index == "hnsw" else NumpyIndex,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> "CachingSearchAdapter | None":
+    """Get the process-wide search cache, if caching is enabled.
+
+    Returns:
+        CachingSearchAdapter wrapping the semantic cache, the load tracker
+        or the admission-controlled adapter, or None.
+    """
+    if not settings.cache_enabled:
+        return None
+
+    from infrastructure.cache.adapter import (
+        CacheStore,
+        CachingSearchAdapter,
+        MemoryCacheStore,
+        SqliteCacheStore,
+    )
+
+    store: CacheStore
+    if settings.cache_path:
+        store = SqliteCacheStore(
+            path=settings.cache_path,
+            ttl=settings.cache_ttl,
+            max_entries=settings.cache_max_entries,
+            max_bytes=settings.cache_max_bytes,
+        )
+    else:
+        store = MemoryCacheStore(
+            ttl=settings.cache_ttl,
+            max_entries=settings.cache_max_entries,
+            max_bytes=settings.cache_max_bytes,
+        )
+    inner = _first_enabled(
+        get_semantic_cache,
+        get_load_tracker,
+        get_admission_controller,
+        get_circuit_breaker,
+        get_retry_adapter,
+        get_model_router,
+        get_hedging_adapter,
+    )
+    return CachingSearchAdapter(
+        inner=inner,
+        store=store,
+        stale_after=settings.cache_stale_after,
+        refresh_ahead=settings.cache_refresh_ahead,
+        refresh_ahead_hits=settings.cache_refresh_ahead_hits,
+        max_refreshes=settings.cache_max_refreshes,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shared_port() -> SearchPort:
+    """Get the process-wide search port shared by every client.
+
+    Layers, outermost first: single-flight, cache, semantic cache, load
+    tracking, admission control, circuit breaker, retry, model fallback, hedging,
+    load balancer, Perplexica adapters.
+
+    Returns:
+        The outermost SearchPort of the shared stack.
+    """
+    port = _first_enabled(
+        get_search_cache,
+        get_semantic_cache,
+        get_load_tracker,
+        get_admission_controller,
+        get_circuit_breaker,
+        get_retry_adapter,
+        get_model_router,
+        get_hedging_adapter,
+    )
+    if settings.singleflight_enabled:
+        from infrastructure.singleflight.adapter import SingleFlightSearchAdapter
+
+        port = SingleFlightSearchAdapter(inner=port)
+    return port
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> "RateLimitingSearchAdapter | None":
+    """Get the process-wide per-client rate limiter, if enabled.
+
+    Returns:
+        RateLimitingSearchAdapter wrapping the shared port, or None.
+    """
+    if not settings.rate_limit_enabled:
+        return None
+
+    from infrastructure.rate_limit.adapter import RateLimit, RateLimitingSearchAdapter
+
+    return RateLimitingSearchAdapter(
+        inner=get_shared_port(),
+        default=RateLimit(
+            rate=settings.rate_limit_per_minute / 60, burst=settings.rate_limit_burst
+        ),
+        by_focus_mode={
+            focus_mode: RateLimit(rate=per_minute / 60, burst=burst)
+            for focus_mode, (per_minute, burst) in settings.rate_limit_focus_modes.items()
+        },
+        client_weights=settings.client_weights,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_search_port() -> SearchPort:
+    """Get the process-wide search port with every enabled layer applied.
+
+    Each search is first checked against its client's rate limit, then
+    sent through the stack shared by every client (see get_shared_port).
 
     Returns:
-        Configured PerplexicaAdapter instance.
+        The outermost SearchPort of the configured stack.
     """
-    return PerplexicaAdapter(
-        base_url=settings.perplexica_url,
-        timeout=settings.perplexica_timeout,
+    return get_rate_limiter() or get_shared_port()
+
+
+def get_source_limits() -> SourceLimits:
+    """Get the source limits applied to searches that set none.
+
+    Returns:
+        SourceLimits built from the default_* settings.
+    """
+    return SourceLimits(
+        max_sources=settings.default_max_sources,
+        snippet_max_chars=settings.default_snippet_max_chars,
+        dedupe=SourceDedupe(settings.default_dedupe_sources),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_store() -> "MemorySessionStore | None":
+    """Get the process-wide store of conversation sessions, if enabled.
+
+    Returns:
+        MemorySessionStore, or None.
+    """
+    if not settings.sessions_enabled:
+        return None
+
+    from infrastructure.sessions.adapter import MemorySessionStore
+
+    return MemorySessionStore(
+        ttl=settings.session_ttl,
+        max_sessions=settings.session_max_sessions,
+        max_chars=settings.session_max_chars,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_degrader() -> LoadDegrader | None:
+    """Get the process-wide load tracker downgrading searches, if enabled.
+
+    Returns:
+        LoadDegrader shared by every search use case, or None.
+    """
+    if not settings.degradation_enabled:
+        return None
+    return LoadDegrader(
+        DegradationPolicy(
+            balanced_in_flight=settings.degradation_balanced_in_flight,
+            speed_in_flight=settings.degradation_speed_in_flight,
+            balanced_latency=settings.degradation_balanced_latency,
+            speed_latency=settings.degradation_speed_latency,
+            history_max_chars=settings.degradation_history_max_chars,
+        )
     )
 
 
 def get_search_use_case() -> SearchUseCase:
     """Create SearchUseCase instance with dependencies.
 
-    Args:
-        settings: Optional settings instance. If not provided, loads from environment.
+    Returns:
+        Configured SearchUseCase instance backed by the shared search port.
+    """
+    return SearchUseCase(
+        search_port=get_search_port(),
+        metrics=get_metrics(),
+        tracer=get_tracer(),
+        sessions=get_session_store(),
+        history_max_chars=settings.history_max_chars,
+        source_limits=get_source_limits(),
+        degrader=get_degrader(),
+        model_routes=get_model_routes(),
+    )
+
+
+def get_batch_search_use_case() -> BatchSearchUseCase:
+    """Create BatchSearchUseCase instance with dependencies.
 
     Returns:
-        Configured SearchUseCase instance.
+        Configured BatchSearchUseCase instance backed by the shared search port.
     """
-    adapter = get_perplexica_adapter()
-    return SearchUseCase(search_port=adapter)
+    return BatchSearchUseCase(
+        search_port=get_search_port(),
+        max_concurrency=settings.batch_max_concurrency,
+        timeout=settings.batch_timeout,
+        metrics=get_metrics(),
+        tracer=get_tracer(),
+        sessions=get_session_store(),
+        history_max_chars=settings.history_max_chars,
+        source_limits=get_source_limits(),
+        degrader=get_degrader(),
+        model_routes=get_model_routes(),
+    )
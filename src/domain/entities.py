@@ -23,6 +23,29 @@ class OptimizationMode(StrEnum):
     QUALITY = "quality"
 
 
+class SourceDedupe(StrEnum):
+    """How duplicate sources are recognised."""
+
+    NONE = "none"
+    URL = "url"
+    DOMAIN = "domain"
+
+
+@dataclass(frozen=True)
+class SourceLimits:
+    """Limits on the sources kept with a search result.
+
+    Attributes:
+        max_sources: Maximum number of sources kept, or None for all.
+        snippet_max_chars: Maximum snippet length, or None for full snippets.
+        dedupe: Which duplicate sources are dropped, keeping the first.
+    """
+
+    max_sources: int | None = None
+    snippet_max_chars: int | None = None
+    dedupe: SourceDedupe = SourceDedupe.NONE
+
+
 @dataclass(frozen=True)
 class ChatModel:
     """Configuration for the chat model used in search.
@@ -49,6 +72,44 @@ class EmbeddingModel:
     key: str
 
 
+@dataclass(frozen=True)
+class ModelRoute:
+    """Models a search is sent to when the client names none.
+
+    Attributes:
+        chat_models: Chat models in order of preference; the later ones are
+            fallbacks for when the earlier ones fail or are slow.
+        embedding_model: Configuration for the embedding model.
+    """
+
+    chat_models: tuple[ChatModel, ...]
+    embedding_model: EmbeddingModel
+
+
+@dataclass(frozen=True)
+class ModelRoutes:
+    """Routing table choosing the models of a search by its focus mode.
+
+    Attributes:
+        default: Route for focus modes without a route of their own.
+        by_focus_mode: Routes of specific focus modes.
+    """
+
+    default: ModelRoute
+    by_focus_mode: dict[FocusMode, ModelRoute] = field(default_factory=dict)
+
+    def route(self, focus_mode: FocusMode) -> ModelRoute:
+        """Return the route of a focus mode.
+
+        Args:
+            focus_mode: The search focus mode.
+
+        Returns:
+            The focus mode's route, or the default one.
+        """
+        return self.by_focus_mode.get(focus_mode, self.default)
+
+
 @dataclass(frozen=True)
 class HistoryEntry:
     """A single entry in conversation history.
@@ -62,6 +123,10 @@ class HistoryEntry:
     content: str
 
 
+# Client identity of searches whose client is unknown, such as stdio sessions
+ANONYMOUS_CLIENT = "anonymous"
+
+
 @dataclass(frozen=True)
 class SearchRequest:
     """Request to perform a search through Perplexica.
@@ -75,6 +140,15 @@ class SearchRequest:
         history: Conversation history for context.
         system_instructions: Optional custom system instructions.
         stream: Whether to stream the response.
+        bypass_cache: Whether to skip cached results and fetch a fresh one.
+        source_limits: Limits on the sources kept with the result.
+        chat_model_fallbacks: Chat models to try, in order, if chat_model fails
+            or is slow. Not part of request equality.
+        deadline: Optional time, on the monotonic clock (`time.monotonic()`),
+            by which the search must complete. Not part of request equality.
+        client_id: Identity of the client that sent the search, used for rate
+            limits and fair queuing; None is ANONYMOUS_CLIENT. Not part of
+            request equality.
     """
 
     query: str
@@ -85,6 +159,11 @@ class SearchRequest:
     history: tuple[HistoryEntry, ...] = field(default_factory=tuple)
     system_instructions: str | None = None
     stream: bool = False
+    bypass_cache: bool = False
+    source_limits: SourceLimits = SourceLimits()
+    chat_model_fallbacks: tuple[ChatModel, ...] = field(default=(), compare=False)
+    deadline: float | None = field(default=None, compare=False)
+    client_id: str | None = field(default=None, compare=False)
 
 
 @dataclass(frozen=True)
@@ -102,6 +181,25 @@ class Source:
     snippet: str | None = None
 
 
+@dataclass(frozen=True)
+class SearchMetadata:
+    """Details about how a search result was obtained.
+
+    Attributes:
+        attempts: Number of upstream attempts made to obtain the result.
+        hedged: Whether the result came from a hedged duplicate attempt.
+        degraded_to: Optimization mode the search ran with instead of the
+            requested one, when the server downgraded it under load.
+        chat_model: Fallback chat model that produced the result, when it is
+            not the one the search was sent with.
+    """
+
+    attempts: int = 1
+    hedged: bool = False
+    degraded_to: OptimizationMode | None = None
+    chat_model: ChatModel | None = None
+
+
 @dataclass(frozen=True)
 class SearchResult:
     """Result from a Perplexica search.
@@ -109,7 +207,40 @@ class SearchResult:
     Attributes:
         message: The generated response message.
         sources: List of sources used to generate the response.
+        metadata: Details about how the result was obtained.
     """
 
     message: str
     sources: tuple[Source, ...] = field(default_factory=tuple)
+    metadata: SearchMetadata = field(default_factory=SearchMetadata)
+
+
+@dataclass(frozen=True)
+class SearchChunk:
+    """A partial result emitted while a search is streaming.
+
+    Attributes:
+        message: Text appended to the response message by this chunk.
+        sources: Sources announced by this chunk, if any.
+        degraded_to: Optimization mode the search runs with instead of the
+            requested one, set on the first chunk when the server downgraded it.
+    """
+
+    message: str = ""
+    sources: tuple[Source, ...] = field(default_factory=tuple)
+    degraded_to: OptimizationMode | None = None
+
+
+@dataclass(frozen=True)
+class BatchSearchItem:
+    """Outcome of one search within a batch.
+
+    Attributes:
+        query: The query this item answers.
+        result: The search result, if the search succeeded.
+        error: Human-readable error message, if the search failed.
+    """
+
+    query: str
+    result: SearchResult | None = None
+    error: str | None = None
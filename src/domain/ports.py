@@ -1,8 +1,10 @@
 """Domain ports - Abstract interfaces (ABC) for external dependencies."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import AbstractContextManager
 
-from src.domain.entities import SearchRequest, SearchResult
+from domain.entities import HistoryEntry, SearchChunk, SearchRequest, SearchResult
 
 
 class SearchPort(ABC):
@@ -27,6 +29,168 @@ class SearchPort(ABC):
         """
         ...
 
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Execute a search request, yielding partial results as they arrive.
+
+        The default implementation waits for `search` and yields the whole
+        result as a single chunk. Adapters able to stream override it.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the search operation fails.
+        """
+        result = await self.search(request)
+        yield SearchChunk(message=result.message, sources=result.sources)
+
+    async def close(self) -> None:
+        """Release resources held by the implementation.
+
+        The default implementation holds nothing. Adapters owning
+        connections, and decorators wrapping another port, override it.
+        """
+        return None
+
+
+class SessionStorePort(ABC):
+    """Port for server-side conversation history, keyed by session id.
+
+    Clients of a session send only their new turn; the store supplies the
+    turns that came before. Implementations bound what they keep, so the
+    history returned may have lost its oldest entries.
+    """
+
+    @abstractmethod
+    async def get_history(self, session_id: str) -> tuple[HistoryEntry, ...]:
+        """Return the stored history of a session, oldest entry first.
+
+        Args:
+            session_id: The session id chosen by the client, scoped to that client.
+
+        Returns:
+            The session history; empty for unknown or expired sessions.
+        """
+        ...
+
+    @abstractmethod
+    async def append(self, session_id: str, entries: Sequence[HistoryEntry]) -> None:
+        """Add entries to the end of a session's history, creating it if needed.
+
+        Args:
+            session_id: The session id chosen by the client, scoped to that client.
+            entries: The entries to add, oldest first.
+        """
+        ...
+
+
+class MetricsPort(ABC):
+    """Port for recording search metrics.
+
+    The use case measures searches end to end and search adapters measure
+    their upstream calls. Each measurement is a context manager that counts
+    the call as in flight while open and, on exit, records its duration and
+    the error it raised, if any.
+    """
+
+    @abstractmethod
+    def measure_search(self, request: SearchRequest) -> AbstractContextManager[None]:
+        """Measure an end-to-end search.
+
+        Args:
+            request: The search request being executed.
+
+        Returns:
+            Context manager wrapping the search.
+        """
+        ...
+
+    @abstractmethod
+    def measure_upstream(
+        self, request: SearchRequest, backend: str
+    ) -> AbstractContextManager[None]:
+        """Measure one call to an upstream search backend.
+
+        Args:
+            request: The search request being sent.
+            backend: Name of the backend called (its base URL).
+
+        Returns:
+            Context manager wrapping the upstream call.
+        """
+        ...
+
+
+# Values a span attribute may hold
+AttributeValue = str | bool | int | float
+
+
+class SpanPort(ABC):
+    """A unit of traced work, open while its context manager is."""
+
+    @abstractmethod
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Attach an attribute to the span.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+        ...
+
+    @abstractmethod
+    def add_event(self, name: str) -> None:
+        """Record a timestamped event on the span.
+
+        Args:
+            name: Event name.
+        """
+        ...
+
+
+class TracerPort(ABC):
+    """Port for tracing searches across layers.
+
+    Spans opened while another is open become its children, and the
+    current trace context can be injected into outgoing request headers so
+    the upstream service continues the same trace.
+    """
+
+    @abstractmethod
+    def span(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> AbstractContextManager[SpanPort]:
+        """Open a span as a child of the current one.
+
+        Args:
+            name: Span name.
+            attributes: Initial span attributes.
+
+        Returns:
+            Context manager yielding the span; errors raised inside it are
+            recorded on the span.
+        """
+        ...
+
+    @abstractmethod
+    def inject(self, headers: dict[str, str]) -> None:
+        """Add the current trace context to outgoing request headers.
+
+        Args:
+            headers: Headers to update in place.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Flush spans not yet exported and release the exporter.
+
+        The default implementation holds nothing.
+        """
+        return None
+
 
 class SearchError(Exception):
     """Base exception for search-related errors.
@@ -34,15 +198,78 @@ class SearchError(Exception):
     Attributes:
         message: Human-readable error message.
         cause: Optional underlying exception that caused this error.
+        status_code: HTTP status the backend answered with, if it answered
+            with an error status.
     """
 
-    def __init__(self, message: str, cause: Exception | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        cause: Exception | None = None,
+        status_code: int | None = None,
+    ) -> None:
         """Initialize SearchError.
 
         Args:
             message: Human-readable error message.
             cause: Optional underlying exception.
+            status_code: HTTP error status the backend answered with, if any.
         """
         super().__init__(message)
         self.message = message
         self.cause = cause
+        self.status_code = status_code
+
+
+class SearchUnavailableError(SearchError):
+    """Raised when a search is refused because capacity is exhausted.
+
+    The search was never sent upstream, so retrying later is safe.
+
+    Attributes:
+        retry_after: Optional hint, in seconds, of when to retry.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        cause: Exception | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Initialize SearchUnavailableError.
+
+        Args:
+            message: Human-readable error message.
+            cause: Optional underlying exception.
+            retry_after: Optional hint, in seconds, of when to retry.
+        """
+        super().__init__(message, cause)
+        self.retry_after = retry_after
+
+
+class SearchDeadlineError(SearchError):
+    """Raised when a search runs out of the time its client allowed it.
+
+    The deadline was chosen by the client, so the failure says nothing
+    about the health of the backend.
+    """
+
+
+def is_backend_failure(error: SearchError) -> bool:
+    """Decide whether a search error says something about the backend's health.
+
+    Client errors (4xx other than 429) and SearchDeadlineError are caused
+    by the request, and SearchUnavailableError by local back-pressure, so
+    none of them counts.
+
+    Args:
+        error: The search error raised by a search port.
+
+    Returns:
+        True if the error should count against the backend.
+    """
+    if isinstance(error, SearchUnavailableError | SearchDeadlineError):
+        return False
+    if error.status_code is not None:
+        return error.status_code >= 500 or error.status_code == 429
+    return True
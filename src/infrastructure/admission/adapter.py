@@ -0,0 +1,332 @@
+"""Admission adapter - Concurrency limits and bounded fair queuing for SearchPort."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass, field
+
+from domain.entities import (
+    ANONYMOUS_CLIENT,
+    OptimizationMode,
+    SearchChunk,
+    SearchRequest,
+    SearchResult,
+)
+from domain.ports import SearchPort, SearchUnavailableError
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    """Admission limits applied to one optimization mode.
+
+    Attributes:
+        max_in_flight: Maximum number of searches running upstream at once.
+        max_queue: Maximum number of searches waiting for a free slot.
+        max_queue_time: Maximum seconds a search may wait for a free slot.
+        max_queue_per_client: Maximum number of one client's searches waiting
+            for a free slot, or None to only apply max_queue.
+    """
+
+    max_in_flight: int
+    max_queue: int
+    max_queue_time: float
+    max_queue_per_client: int | None = None
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Snapshot of one optimization mode's admission state.
+
+    Attributes:
+        in_flight: Searches currently running upstream.
+        queue_depth: Searches currently waiting for a free slot.
+        queued_clients: Clients with searches waiting for a free slot.
+        admitted: Searches admitted since startup.
+        rejected: Searches rejected because the queue was full or timed out.
+        avg_wait_time: Mean seconds admitted searches spent queued.
+        max_wait_time: Longest seconds an admitted search spent queued.
+    """
+
+    in_flight: int
+    queue_depth: int
+    queued_clients: int
+    admitted: int
+    rejected: int
+    avg_wait_time: float
+    max_wait_time: float
+
+
+@dataclass(order=True)
+class _Waiter:
+    """A search waiting for a free slot.
+
+    Attributes:
+        finish: Virtual finish time; the waiter with the earliest is served first.
+        sequence: Arrival order, breaking ties between equal finish times.
+        client: Client that sent the search.
+        future: Resolved when a slot is handed over to the search.
+    """
+
+    finish: float
+    sequence: int
+    client: str = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class _Limiter:
+    """Slot limiter with a bounded, time-limited, weighted fair wait queue.
+
+    Waiting searches are served by self-clocked weighted fair queuing: each
+    gets a virtual finish time one over its client's weight past the later
+    of its client's previous finish time and the finish time last served.
+    A client queuing many searches thus only delays its own, while the
+    searches of other clients interleave with them in proportion to their
+    weights. A single client is served in FIFO order.
+    """
+
+    def __init__(
+        self,
+        limits: AdmissionLimits,
+        clock: Callable[[], float],
+        client_weights: Mapping[str, float],
+    ) -> None:
+        """Initialize _Limiter.
+
+        Args:
+            limits: Limits to enforce.
+            clock: Time source, in seconds.
+            client_weights: Share of the slots given to each client; unlisted
+                clients weigh 1.
+        """
+        self.limits = limits
+        self._clock = clock
+        self._client_weights = client_weights
+        self._waiters: list[_Waiter] = []
+        self._queued: dict[str, int] = {}
+        self._finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def stats(self) -> AdmissionStats:
+        """Snapshot the limiter's counters.
+
+        Returns:
+            Current AdmissionStats.
+        """
+        return AdmissionStats(
+            in_flight=self.in_flight,
+            queue_depth=len(self._waiters),
+            queued_clients=len(self._queued),
+            admitted=self.admitted,
+            rejected=self.rejected,
+            avg_wait_time=self.total_wait_time / self.admitted if self.admitted else 0.0,
+            max_wait_time=self.max_wait_time,
+        )
+
+    def _admit(self, wait_time: float) -> None:
+        """Record an admitted search."""
+        self.admitted += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def _enqueue(self, client: str) -> _Waiter:
+        """Queue a search of a client behind its earlier ones.
+
+        Args:
+            client: Client that sent the search.
+
+        Returns:
+            The queued waiter.
+        """
+        weight = self._client_weights.get(client, 1.0)
+        finish = max(self._virtual_time, self._finish.get(client, 0.0)) + 1 / weight
+        self._finish[client] = finish
+        waiter = _Waiter(
+            finish=finish,
+            sequence=next(self._sequence),
+            client=client,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self._queued[client] = self._queued.get(client, 0) + 1
+        return waiter
+
+    def _dequeued(self, waiter: _Waiter) -> None:
+        """Account for a waiter that left the queue."""
+        self._queued[waiter.client] -= 1
+        if not self._queued[waiter.client]:
+            del self._queued[waiter.client]
+        if not self._waiters:
+            # An empty queue owes no client anything
+            self._finish.clear()
+
+    async def acquire(self, mode: OptimizationMode, client: str) -> None:
+        """Take a slot, queuing for one if every slot is busy.
+
+        Args:
+            mode: The optimization mode, for error messages.
+            client: Client that sent the search.
+
+        Raises:
+            SearchUnavailableError: If the queue, or the client's share of
+                it, is full or the wait times out.
+        """
+        if self.in_flight < self.limits.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self._admit(0.0)
+            return
+
+        if len(self._waiters) >= self.limits.max_queue:
+            self.rejected += 1
+            raise SearchUnavailableError(
+                message=f"Search capacity for '{mode}' mode is saturated, try again later",
+                retry_after=self.limits.max_queue_time,
+            )
+        max_per_client = self.limits.max_queue_per_client
+        if max_per_client is not None and self._queued.get(client, 0) >= max_per_client:
+            self.rejected += 1
+            raise SearchUnavailableError(
+                message=(
+                    f"Client '{client}' already has {max_per_client} '{mode}' searches "
+                    "waiting, try again later"
+                ),
+                retry_after=self.limits.max_queue_time,
+            )
+
+        waiter = self._enqueue(client)
+        started = self._clock()
+        try:
+            async with asyncio.timeout(self.limits.max_queue_time):
+                await waiter.future
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was handed over just as we gave up: pass it on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._dequeued(waiter)
+            if isinstance(e, TimeoutError):
+                self.rejected += 1
+                raise SearchUnavailableError(
+                    message=(
+                        f"Timed out after {self.limits.max_queue_time}s waiting "
+                        f"for a free '{mode}' search slot"
+                    ),
+                    cause=e,
+                    retry_after=self.limits.max_queue_time,
+                ) from e
+            raise
+
+        self._admit(self._clock() - started)
+
+    def release(self) -> None:
+        """Give a slot back, handing it directly to the next waiter in fair order."""
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            self._dequeued(waiter)
+            self._virtual_time = waiter.finish
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class AdmissionSearchAdapter(SearchPort):
+    """SearchPort decorator applying admission control per optimization mode.
+
+    At most `max_in_flight` searches of a mode run upstream at once. Further
+    searches queue for up to `max_queue_time` seconds, and are rejected
+    immediately with SearchUnavailableError once `max_queue` searches, or
+    `max_queue_per_client` of the same client, are already waiting.
+
+    Queued searches are served fairly across the clients named by their
+    `client_id`, in proportion to the clients' weights, so that a client
+    sending many searches cannot starve the others; each client's own
+    searches are served in FIFO order.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _limiters: Slot limiter for each optimization mode.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        limits: Mapping[OptimizationMode, AdmissionLimits],
+        client_weights: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize AdmissionSearchAdapter.
+
+        Args:
+            inner: The search port to protect.
+            limits: Admission limits for each optimization mode.
+            client_weights: Share of the queued slots given to each client;
+                unlisted clients weigh 1.
+            clock: Time source, in seconds.
+        """
+        self._inner = inner
+        weights = dict(client_weights or {})
+        self._limiters = {
+            mode: _Limiter(limits[mode], clock, weights) for mode in OptimizationMode
+        }
+
+    @property
+    def stats(self) -> dict[OptimizationMode, AdmissionStats]:
+        """Current queue depth, in-flight count and wait times per mode."""
+        return {mode: limiter.stats() for mode, limiter in self._limiters.items()}
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search once a slot for its optimization mode is free.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchUnavailableError: If no slot became available in time.
+            SearchError: If the wrapped search fails.
+        """
+        limiter = self._limiters[request.optimization_mode]
+        client = request.client_id or ANONYMOUS_CLIENT
+        await limiter.acquire(request.optimization_mode, client)
+        try:
+            return await self._inner.search(request)
+        finally:
+            limiter.release()
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, holding a slot until the stream ends.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchUnavailableError: If no slot became available in time.
+            SearchError: If the wrapped search fails.
+        """
+        limiter = self._limiters[request.optimization_mode]
+        client = request.client_id or ANONYMOUS_CLIENT
+        await limiter.acquire(request.optimization_mode, client)
+        try:
+            async for chunk in self._inner.search_stream(request):
+                yield chunk
+        finally:
+            limiter.release()
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
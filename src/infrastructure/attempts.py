@@ -0,0 +1,76 @@
+"""Bookkeeping shared by adapters that send a search upstream more than once."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Backends serving the current search's attempts; the set is shared, not copied,
+# by the tasks each attempt runs in
+_attempt_backends: ContextVar[set[str] | None] = ContextVar("attempt_backends", default=None)
+
+
+class RetryBudget:
+    """Caps extra attempts (retries, hedges) to a fraction of overall traffic.
+
+    Every search deposits `ratio` tokens and every extra attempt withdraws
+    one, so at steady state they add at most `ratio` extra load. When the
+    backend degrades the budget drains and failures are no longer
+    multiplied into a retry storm.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0) -> None:
+        """Initialize RetryBudget.
+
+        Args:
+            ratio: Tokens deposited per search, i.e. allowed extra attempts per search.
+            max_tokens: Maximum tokens the budget can hold (burst of extra attempts).
+        """
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        """Credit the budget for a new search."""
+        self.tokens = min(self._max_tokens, self.tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Take one extra attempt from the budget.
+
+        Returns:
+            True if an extra attempt may be made, False if the budget is empty.
+        """
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@contextmanager
+def distinct_backends(backends: set[str]) -> Iterator[None]:
+    """Spread attempts of one search over distinct backends where possible.
+
+    Attempts started as tasks inside the block record the backend chosen
+    for them in `backends`, and avoid those already recorded there, so
+    every attempt of the search should be started with the same set.
+
+    Args:
+        backends: Backends serving the search's attempts, shared between them.
+
+    Yields:
+        None.
+    """
+    token = _attempt_backends.set(backends)
+    try:
+        yield
+    finally:
+        _attempt_backends.reset(token)
+
+
+def attempt_backends() -> set[str] | None:
+    """Get the backends already serving the current search's attempts.
+
+    Returns:
+        The shared set to avoid and record backends in, or None outside
+        distinct_backends().
+    """
+    return _attempt_backends.get()
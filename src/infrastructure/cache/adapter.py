@@ -0,0 +1,556 @@
+"""Cache adapter - Response caching decorator for SearchPort."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Protocol
+
+from domain.entities import (
+    ChatModel,
+    OptimizationMode,
+    SearchChunk,
+    SearchMetadata,
+    SearchRequest,
+    SearchResult,
+    Source,
+)
+from domain.ports import SearchError, SearchPort
+
+# Request fields that change how (or for whom) a search is delivered, not what it returns
+_UNCACHED_FIELDS = frozenset(
+    {"stream", "bypass_cache", "deadline", "client_id", "chat_model_fallbacks"}
+)
+
+# Metadata of results served from the cache: no upstream attempt was made for them
+_HIT_METADATA = SearchMetadata(attempts=0)
+
+# Keys whose hit counts are tracked for refresh-ahead, least recently hit dropped first
+_MAX_TRACKED_KEYS = 4096
+
+
+def cache_key(request: SearchRequest) -> str:
+    """Compute a canonical cache key for a search request.
+
+    Every field that influences the answer (query, models, modes, history
+    and system instructions) is part of the key.
+
+    Args:
+        request: The search request.
+
+    Returns:
+        Hex SHA-256 digest of the canonical request encoding.
+    """
+    data = {
+        f.name: getattr(request, f.name)
+        for f in fields(request)
+        if f.name not in _UNCACHED_FIELDS
+    }
+    canonical = json.dumps(data, sort_keys=True, default=asdict, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _encode_result(result: SearchResult) -> str:
+    """Serialize a search result to JSON."""
+    return json.dumps(asdict(result), ensure_ascii=False, separators=(",", ":"))
+
+
+def _decode_result(payload: str) -> SearchResult:
+    """Deserialize a search result from JSON."""
+    data = json.loads(payload)
+    metadata = data.get("metadata", {})
+    if metadata.get("degraded_to") is not None:
+        metadata["degraded_to"] = OptimizationMode(metadata["degraded_to"])
+    if metadata.get("chat_model") is not None:
+        metadata["chat_model"] = ChatModel(**metadata["chat_model"])
+    return SearchResult(
+        message=data["message"],
+        sources=tuple(Source(**source) for source in data["sources"]),
+        metadata=SearchMetadata(**metadata),
+    )
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that went to the wrapped port.
+        evictions: Entries dropped because they expired or exceeded limits.
+        stale_hits: Hits served past the soft TTL while being revalidated.
+        refreshes: Background refreshes that replaced an entry.
+        refresh_failures: Background refreshes whose search failed.
+        refreshes_skipped: Refreshes not started because too many were running.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    refreshes_skipped: int = 0
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A live cached result.
+
+    Attributes:
+        result: The cached search result.
+        age: Seconds since the result was stored.
+    """
+
+    result: SearchResult
+    age: float
+
+
+class CacheStore(Protocol):
+    """Storage backend for cached search results.
+
+    Attributes:
+        evictions: Entries dropped because they expired or exceeded limits.
+    """
+
+    evictions: int
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the live entry for key, or None if absent or expired."""
+        ...
+
+    async def put(self, key: str, result: SearchResult) -> None:
+        """Store a result, evicting entries over the store's limits."""
+        ...
+
+    async def close(self) -> None:
+        """Release the backend's resources."""
+        ...
+
+
+class MemoryCacheStore:
+    """In-process LRU store bounded by TTL, entry count and payload bytes.
+
+    Attributes:
+        evictions: Entries dropped because they expired or exceeded limits.
+        _entries: Entries in LRU order, mapped to (stored_at, size, result).
+        _bytes: Total payload size of the stored entries.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize MemoryCacheStore.
+
+        Args:
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum number of stored entries.
+            max_bytes: Maximum total payload size in bytes.
+            clock: Time source, in seconds.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, int, SearchResult]] = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the live entry for key, or None if absent or expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached entry, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, size, result = entry
+        age = self._clock() - stored_at
+        if age >= self._ttl:
+            del self._entries[key]
+            self._bytes -= size
+            self.evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return CacheEntry(result=result, age=age)
+
+    async def put(self, key: str, result: SearchResult) -> None:
+        """Store a result, evicting least recently used entries over limits.
+
+        Args:
+            key: The cache key.
+            result: The result to store.
+        """
+        size = len(_encode_result(result).encode())
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+
+        self._entries[key] = (self._clock(), size, result)
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            _, (_, old_size, _) = self._entries.popitem(last=False)
+            self._bytes -= old_size
+            self.evictions += 1
+
+    async def close(self) -> None:
+        """Nothing to release; entries outlive individual sessions."""
+
+
+class SqliteCacheStore:
+    """On-disk LRU store backed by SQLite, surviving process restarts.
+
+    Expiry uses wall-clock time so entries stay valid across restarts.
+    SQLite calls run in a worker thread to keep the event loop free.
+
+    Attributes:
+        evictions: Entries dropped because they expired or exceeded limits.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize SqliteCacheStore.
+
+        Args:
+            path: Path of the SQLite database file.
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum number of stored entries.
+            max_bytes: Maximum total payload size in bytes.
+            clock: Wall-clock time source, in seconds.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._path = path
+        self._lock = asyncio.Lock()
+        self._db: sqlite3.Connection | None = None
+        self.evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get or open the database connection, creating the table if needed.
+
+        Returns:
+            The SQLite connection.
+        """
+        if self._db is None:
+            self._db = sqlite3.connect(self._path, check_same_thread=False)
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """
+            )
+            self._db.commit()
+        return self._db
+
+    def _get(self, key: str) -> CacheEntry | None:
+        """Blocking implementation of get()."""
+        db = self._connection()
+        now = self._clock()
+        row = db.execute(
+            "SELECT expires_at, payload FROM search_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        expires_at, payload = row
+        if expires_at <= now:
+            db.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+            db.commit()
+            self.evictions += 1
+            return None
+
+        db.execute("UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key))
+        db.commit()
+        return CacheEntry(result=_decode_result(payload), age=now - (expires_at - self._ttl))
+
+    def _put(self, key: str, result: SearchResult) -> None:
+        """Blocking implementation of put()."""
+        db = self._connection()
+        now = self._clock()
+        payload = _encode_result(result)
+        db.execute(
+            "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+            (key, now + self._ttl, now, len(payload.encode()), payload),
+        )
+
+        while True:
+            count, total = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+            ).fetchone()
+            if count <= self._max_entries and total <= self._max_bytes:
+                break
+            db.execute(
+                "DELETE FROM search_cache WHERE key = "
+                "(SELECT key FROM search_cache ORDER BY last_access LIMIT 1)"
+            )
+            self.evictions += 1
+
+        db.commit()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the live entry for key, or None if absent or expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached entry, or None.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, result: SearchResult) -> None:
+        """Store a result, evicting least recently used entries over limits.
+
+        Args:
+            key: The cache key.
+            result: The result to store.
+        """
+        async with self._lock:
+            await asyncio.to_thread(self._put, key, result)
+
+    async def close(self) -> None:
+        """Close the database connection; it is reopened on next use."""
+        async with self._lock:
+            if self._db is not None:
+                await asyncio.to_thread(self._db.close)
+                self._db = None
+
+
+class CachingSearchAdapter(SearchPort):
+    """SearchPort decorator answering identical searches from a cache.
+
+    Results are keyed on a canonical hash of the SearchRequest. Requests
+    flagged with `bypass_cache` skip the lookup but still refresh the entry.
+
+    With `stale_after` set, entries older than it are still served (until
+    the store's TTL drops them) while one background search per key
+    revalidates them. Keys hit `refresh_ahead_hits` times are refreshed
+    before going stale, once `refresh_ahead` of `stale_after` has passed.
+    At most `max_refreshes` refreshes run at once; further ones are skipped
+    rather than queued, so revalidation never competes with live searches
+    for more than that many upstream slots.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _store: Storage backend for cached results.
+        _stale_after: Age in seconds after which hits are revalidated, or None.
+        _refresh_ahead: Fraction of stale_after after which hot keys are refreshed.
+        _refresh_ahead_hits: Hits after which a key counts as hot.
+        _max_refreshes: Maximum background refreshes running at once.
+        _refreshing: Running background refreshes, by cache key.
+        _key_hits: Hits per key since it was last stored, least recent first.
+        _hits: Lookups answered from the cache.
+        _misses: Lookups that went to the wrapped port.
+        _stale_hits: Hits served past stale_after.
+        _refreshes: Background refreshes that replaced an entry.
+        _refresh_failures: Background refreshes whose search failed.
+        _refreshes_skipped: Refreshes not started because max_refreshes were running.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        store: CacheStore,
+        stale_after: float | None = None,
+        refresh_ahead: float = 0.8,
+        refresh_ahead_hits: int = 3,
+        max_refreshes: int = 2,
+    ) -> None:
+        """Initialize CachingSearchAdapter.
+
+        Args:
+            inner: The search port to cache results from.
+            store: Storage backend for cached results.
+            stale_after: Age in seconds after which cached results are served
+                stale and revalidated in the background. None disables
+                revalidation.
+            refresh_ahead: Fraction of stale_after after which hot keys are
+                refreshed before going stale.
+            refresh_ahead_hits: Hits since the last store after which a key
+                is refreshed ahead of time.
+            max_refreshes: Maximum background refreshes running at once.
+        """
+        self._inner = inner
+        self._store = store
+        self._stale_after = stale_after
+        self._refresh_ahead = refresh_ahead
+        self._refresh_ahead_hits = refresh_ahead_hits
+        self._max_refreshes = max_refreshes
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self._key_hits: OrderedDict[str, int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._refreshes_skipped = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss, eviction and revalidation counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._store.evictions,
+            stale_hits=self._stale_hits,
+            refreshes=self._refreshes,
+            refresh_failures=self._refresh_failures,
+            refreshes_skipped=self._refreshes_skipped,
+        )
+
+    async def _lookup(self, request: SearchRequest) -> tuple[str, SearchResult | None]:
+        """Look up a request in the cache and update hit/miss counters.
+
+        Stale and hot entries are scheduled for a background refresh.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            The cache key and the cached result, if any, with its metadata
+            reset since no upstream attempt produced it.
+        """
+        key = cache_key(request)
+        entry = None if request.bypass_cache else await self._store.get(key)
+
+        if entry is None:
+            self._misses += 1
+            self._key_hits.pop(key, None)
+            return key, None
+
+        self._hits += 1
+        if self._stale_after is not None:
+            self._revalidate(key, request, entry, self._stale_after)
+        return key, replace(entry.result, metadata=_HIT_METADATA)
+
+    def _revalidate(
+        self, key: str, request: SearchRequest, entry: CacheEntry, stale_after: float
+    ) -> None:
+        """Refresh an entry in the background if it is stale or hot and aging.
+
+        Args:
+            key: The cache key.
+            request: The search request that hit the entry.
+            entry: The cached entry.
+            stale_after: Age in seconds after which the entry is stale.
+        """
+        hits = self._key_hits.pop(key, 0) + 1
+        self._key_hits[key] = hits
+        if len(self._key_hits) > _MAX_TRACKED_KEYS:
+            self._key_hits.popitem(last=False)
+
+        if entry.age >= stale_after:
+            self._stale_hits += 1
+        elif hits < self._refresh_ahead_hits or entry.age < self._refresh_ahead * stale_after:
+            return
+
+        if key in self._refreshing:
+            return
+        if len(self._refreshing) >= self._max_refreshes:
+            self._refreshes_skipped += 1
+            return
+
+        fresh = replace(request, stream=False, bypass_cache=True, deadline=None)
+        task = asyncio.create_task(self._refresh(key, fresh))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, request: SearchRequest) -> None:
+        """Search again and replace the cached entry.
+
+        Args:
+            key: The cache key.
+            request: The search request to repeat.
+        """
+        try:
+            result = await self._inner.search(request)
+        except SearchError:
+            self._refresh_failures += 1
+            return
+
+        await self._store.put(key, result)
+        self._key_hits.pop(key, None)
+        self._refreshes += 1
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Return a cached result, or search and cache the answer.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        key, cached = await self._lookup(request)
+        if cached is not None:
+            return cached
+
+        result = await self._inner.search(request)
+        await self._store.put(key, result)
+        return result
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, replaying cached results as a single chunk.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        key, cached = await self._lookup(request)
+        if cached is not None:
+            yield SearchChunk(message=cached.message, sources=cached.sources)
+            return
+
+        message_parts: list[str] = []
+        sources: tuple[Source, ...] = ()
+        async for chunk in self._inner.search_stream(request):
+            message_parts.append(chunk.message)
+            sources = chunk.sources or sources
+            yield chunk
+
+        await self._store.put(key, SearchResult(message="".join(message_parts), sources=sources))
+
+    async def close(self) -> None:
+        """Cancel background refreshes, then close the cache store and the wrapped port."""
+        refreshes = list(self._refreshing.values())
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
+        await self._store.close()
+        await self._inner.close()
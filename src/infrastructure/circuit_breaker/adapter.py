@@ -0,0 +1,260 @@
+"""Circuit breaker adapter - Fails fast while Perplexica is unhealthy."""
+
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from domain.entities import SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort, SearchUnavailableError, is_backend_failure
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Thresholds controlling when the breaker trips and recovers.
+
+    Attributes:
+        window: Length in seconds of the sliding window of recorded calls.
+        min_calls: Calls needed in the window before the breaker may trip.
+        failure_rate_threshold: Failure ratio in the window that trips the breaker.
+        slow_call_duration: Seconds after which a call counts as slow.
+        slow_call_rate_threshold: Slow-call ratio in the window that trips the breaker.
+        open_duration: Seconds the breaker stays open before probing recovery.
+        half_open_max_calls: Trial calls allowed, and needed to close, when half-open.
+    """
+
+    window: float = 60.0
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_duration: float = 60.0
+    slow_call_rate_threshold: float = 0.8
+    open_duration: float = 30.0
+    half_open_max_calls: int = 2
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Snapshot of the breaker state.
+
+    Attributes:
+        state: Current breaker state.
+        calls: Calls recorded in the sliding window.
+        failure_rate: Failure ratio in the sliding window.
+        slow_call_rate: Slow-call ratio in the sliding window.
+        rejected: Calls rejected without reaching Perplexica.
+    """
+
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    rejected: int
+
+
+class CircuitBreakerSearchAdapter(SearchPort):
+    """SearchPort decorator that stops calling Perplexica while it is failing.
+
+    While closed, calls are recorded in a sliding time window; once enough
+    of them fail or are slow the breaker opens and every search fails fast
+    with SearchUnavailableError. After `open_duration` the breaker turns
+    half-open and lets a few trial searches through: if they all succeed it
+    closes, if any fails it opens again.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _config: Trip and recovery thresholds.
+        _calls: Recent calls as (finished_at, failed, slow) tuples.
+        _state: Current breaker state.
+        _opened_at: When the breaker last opened.
+        _trials: Trial calls started while half-open.
+        _trial_successes: Trial calls that succeeded while half-open.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        config: CircuitBreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize CircuitBreakerSearchAdapter.
+
+        Args:
+            inner: The search port to protect.
+            config: Trip and recovery thresholds. Defaults to CircuitBreakerConfig().
+            clock: Time source, in seconds.
+        """
+        self._inner = inner
+        self._config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current breaker state, moving from open to half-open when due."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._config.open_duration
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+        return self._state
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """Current state and sliding-window rates."""
+        self._prune()
+        calls = len(self._calls)
+        failures = sum(failed for _, failed, _ in self._calls)
+        slow = sum(is_slow for _, _, is_slow in self._calls)
+        return CircuitBreakerStats(
+            state=self.state,
+            calls=calls,
+            failure_rate=failures / calls if calls else 0.0,
+            slow_call_rate=slow / calls if calls else 0.0,
+            rejected=self._rejected,
+        )
+
+    def _prune(self) -> None:
+        """Drop calls that fell out of the sliding window."""
+        horizon = self._clock() - self._config.window
+        while self._calls and self._calls[0][0] < horizon:
+            self._calls.popleft()
+
+    def _open(self) -> None:
+        """Trip the breaker."""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._calls.clear()
+
+    def _acquire(self) -> None:
+        """Let a call through, or reject it if the breaker does not allow it.
+
+        Raises:
+            SearchUnavailableError: If the breaker is open or out of trials.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and self._trials < self._config.half_open_max_calls:
+            self._trials += 1
+            return
+
+        self._rejected += 1
+        retry_after = max(0.0, self._opened_at + self._config.open_duration - self._clock())
+        raise SearchUnavailableError(
+            message="Perplexica is unavailable (circuit breaker open), try again later",
+            retry_after=retry_after,
+        )
+
+    def _abandon(self) -> None:
+        """Give back a trial slot for a call that ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._trials -= 1
+
+    def _record(self, started: float, failed: bool) -> None:
+        """Record the outcome of a call and update the breaker state.
+
+        Args:
+            started: When the call started.
+            failed: Whether the call failed.
+        """
+        now = self._clock()
+        if self._state is CircuitState.HALF_OPEN:
+            if failed:
+                self._open()
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self._config.half_open_max_calls:
+                self._state = CircuitState.CLOSED
+            return
+        if self._state is CircuitState.OPEN:
+            return
+
+        self._calls.append((now, failed, now - started >= self._config.slow_call_duration))
+        stats = self.stats
+        if stats.calls >= self._config.min_calls and (
+            stats.failure_rate >= self._config.failure_rate_threshold
+            or stats.slow_call_rate >= self._config.slow_call_rate_threshold
+        ):
+            self._open()
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search unless the breaker is open.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchUnavailableError: If the breaker rejects the call.
+            SearchError: If the wrapped search fails.
+        """
+        self._acquire()
+        started = self._clock()
+        try:
+            result = await self._inner.search(request)
+        except SearchError as e:
+            self._record(started, failed=is_backend_failure(e))
+            raise
+        except BaseException:
+            self._abandon()
+            raise
+        self._record(started, failed=False)
+        return result
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search unless the breaker is open.
+
+        The call is judged on its time to first chunk, since a stream's
+        total duration mostly reflects answer length.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchUnavailableError: If the breaker rejects the call.
+            SearchError: If the wrapped search fails.
+        """
+        self._acquire()
+        started = self._clock()
+        recorded = False
+        try:
+            async for chunk in self._inner.search_stream(request):
+                if not recorded:
+                    self._record(started, failed=False)
+                    recorded = True
+                yield chunk
+        except SearchError as e:
+            if not recorded:
+                self._record(started, failed=is_backend_failure(e))
+            raise
+        except BaseException:
+            if not recorded:
+                self._abandon()
+            raise
+        if not recorded:
+            self._record(started, failed=False)
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
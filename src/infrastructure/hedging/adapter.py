@@ -0,0 +1,325 @@
+"""Hedging adapter - Duplicates slow searches to cut tail latency."""
+
+import asyncio
+import bisect
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
+
+from domain.entities import ChatModel, SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchPort
+from infrastructure.attempts import RetryBudget, distinct_backends
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """When a slow search is duplicated, and how.
+
+    Attributes:
+        percentile: Percentile of recent latencies after which a search is hedged.
+        window: Number of recent latencies the percentile is computed over.
+        min_samples: Latencies needed before the percentile is trusted.
+        initial_delay: Seconds before hedging while there are too few samples.
+        min_delay: Lower bound in seconds for the hedging delay.
+        fallback_chat_model: Chat model used by the hedged attempt, or None to
+            repeat the search unchanged, which only helps when it is load
+            balanced over several backends.
+    """
+
+    percentile: float = 0.95
+    window: int = 200
+    min_samples: int = 20
+    initial_delay: float = 10.0
+    min_delay: float = 1.0
+    fallback_chat_model: ChatModel | None = None
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Snapshot of hedging activity.
+
+    Attributes:
+        hedges: Hedged attempts sent since startup.
+        hedge_wins: Searches answered by the hedged attempt.
+        budget_exhausted: Hedges skipped because the budget was empty.
+        budget_tokens: Hedges currently available in the budget.
+        delay: Seconds after which the next search would be hedged.
+    """
+
+    hedges: int
+    hedge_wins: int
+    budget_exhausted: int
+    budget_tokens: float
+    delay: float
+
+
+@dataclass
+class _Stream:
+    """A streaming attempt whose chunks are read in a task of its own.
+
+    Attributes:
+        pump: Task iterating the upstream stream into the queue.
+        queue: Chunks, then the exception or None closing the stream.
+        first: The first item taken from the queue.
+    """
+
+    pump: asyncio.Task[None]
+    queue: asyncio.Queue[SearchChunk | Exception | None]
+    first: SearchChunk | Exception | None = None
+
+
+class HedgingSearchAdapter(SearchPort):
+    """SearchPort decorator sending a second attempt when a search is slow.
+
+    A search still running after the `percentile` of recent latencies is
+    duplicated, with the policy's fallback chat model if it has one. A load
+    balancer below sends the duplicate to another backend than the first
+    attempt's whenever one is available. The first attempt to
+    succeed (for streams, to yield a chunk) wins and the other is cancelled;
+    a failing attempt leaves the other to finish. Hedges are limited by a
+    RetryBudget, so at steady state they add at most its ratio of load.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _policy: When and how searches are hedged.
+        _budget: Budget capping the overall hedge rate.
+        _latencies: Recent latencies, in arrival order.
+        _sorted: The same latencies, sorted.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        policy: HedgingPolicy | None = None,
+        budget: RetryBudget | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize HedgingSearchAdapter.
+
+        Args:
+            inner: The search port to hedge calls to.
+            policy: Hedging policy. Defaults to HedgingPolicy().
+            budget: Hedge budget. Defaults to RetryBudget(ratio=0.1, max_tokens=5).
+            clock: Time source, in seconds.
+        """
+        self._inner = inner
+        self._policy = policy or HedgingPolicy()
+        self._budget = budget or RetryBudget(ratio=0.1, max_tokens=5.0)
+        self._clock = clock
+        self._latencies: deque[float] = deque()
+        self._sorted: list[float] = []
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    @property
+    def stats(self) -> HedgingStats:
+        """Current hedging counters, budget level and delay."""
+        return HedgingStats(
+            hedges=self._hedges,
+            hedge_wins=self._hedge_wins,
+            budget_exhausted=self._budget_exhausted,
+            budget_tokens=self._budget.tokens,
+            delay=self._delay(),
+        )
+
+    def _delay(self) -> float:
+        """Compute how long a search may run before it is hedged.
+
+        Returns:
+            The percentile of recent latencies, bounded below by min_delay.
+        """
+        if len(self._sorted) < self._policy.min_samples:
+            return max(self._policy.min_delay, self._policy.initial_delay)
+        index = min(len(self._sorted) - 1, int(self._policy.percentile * len(self._sorted)))
+        return max(self._policy.min_delay, self._sorted[index])
+
+    def _record(self, latency: float) -> None:
+        """Add the latency of a successful search to the window.
+
+        Args:
+            latency: Seconds the caller waited for the search.
+        """
+        self._latencies.append(latency)
+        bisect.insort(self._sorted, latency)
+        if len(self._latencies) > self._policy.window:
+            oldest = self._latencies.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+
+    def _hedge_request(self, request: SearchRequest) -> SearchRequest:
+        """Build the request of the hedged attempt.
+
+        Args:
+            request: The original search request.
+
+        Returns:
+            The request, with the fallback chat model if one is configured.
+        """
+        if self._policy.fallback_chat_model is None:
+            return request
+        return replace(request, chat_model=self._policy.fallback_chat_model)
+
+    @staticmethod
+    def _discard(task: asyncio.Task[T]) -> None:
+        """Retrieve the outcome of a losing attempt and release what it holds.
+
+        Args:
+            task: The finished attempt.
+        """
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if isinstance(result, _Stream):
+            result.pump.cancel()
+
+    async def _race(
+        self, request: SearchRequest, attempt: Callable[[SearchRequest], Coroutine[Any, Any, T]]
+    ) -> tuple[T, bool]:
+        """Run an attempt, hedge it once it is slow, and return the first success.
+
+        Args:
+            request: The search request.
+            attempt: Starts one attempt of the search.
+
+        Returns:
+            The winning attempt's value, and whether it was the hedge.
+
+        Raises:
+            SearchError: If every attempt fails.
+        """
+        self._budget.deposit()
+        started = self._clock()
+        backends: set[str] = set()
+        with distinct_backends(backends):
+            primary = asyncio.create_task(attempt(request))
+        pending = {primary}
+        done: set[asyncio.Task[T]] = set()
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self._delay())
+            if pending:
+                if self._budget.withdraw():
+                    self._hedges += 1
+                    with distinct_backends(backends):
+                        hedge = asyncio.create_task(attempt(self._hedge_request(request)))
+                    pending.add(hedge)
+                else:
+                    self._budget_exhausted += 1
+
+            failure: BaseException | None = None
+            while True:
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if task.exception() is None:
+                        self._record(self._clock() - started)
+                        hedged = task is not primary
+                        self._hedge_wins += hedged
+                        done.discard(task)
+                        return task.result(), hedged
+                    failure = failure or task.exception()
+                done.clear()
+                if not pending and failure is not None:
+                    raise failure
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Losers are not awaited, so the winner is returned without waiting
+            # for them to unwind; their outcome is retrieved once they finish
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(self._discard)
+            for task in done:
+                # An attempt that finished alongside the winner still owns a stream
+                self._discard(task)
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search, hedging it if it runs longer than usual.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult whose metadata records whether the hedge answered.
+
+        Raises:
+            SearchError: If every attempt fails.
+        """
+        result, hedged = await self._race(request, self._inner.search)
+        if not hedged:
+            return result
+        return replace(result, metadata=replace(result.metadata, hedged=True))
+
+    async def _pump(
+        self, request: SearchRequest, queue: asyncio.Queue[SearchChunk | Exception | None]
+    ) -> None:
+        """Read an upstream stream into a queue, ending with its error or None.
+
+        Every exception is forwarded, so the reader is never left waiting on
+        a stream that has stopped.
+
+        Args:
+            request: The search request.
+            queue: Receives the chunks.
+        """
+        try:
+            async for chunk in self._inner.search_stream(request):
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    async def _open_stream(self, request: SearchRequest) -> _Stream:
+        """Start a streaming attempt and wait for its first item.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            The running stream, once it has produced a chunk or ended.
+
+        Raises:
+            SearchError: If the stream fails before its first chunk.
+        """
+        queue: asyncio.Queue[SearchChunk | Exception | None] = asyncio.Queue(maxsize=16)
+        stream = _Stream(pump=asyncio.create_task(self._pump(request, queue)), queue=queue)
+        try:
+            stream.first = await queue.get()
+        except asyncio.CancelledError:
+            stream.pump.cancel()
+            raise
+        if isinstance(stream.first, Exception):
+            raise stream.first
+        return stream
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, hedging it if its first chunk is slower than usual.
+
+        Latency is measured to the first chunk. Once a chunk has been
+        yielded the caller is committed to that attempt.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If every attempt fails before its first chunk, or the
+                winning stream fails later.
+        """
+        stream, _ = await self._race(request, self._open_stream)
+        try:
+            item = stream.first
+            while item is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                item = await stream.queue.get()
+        finally:
+            stream.pump.cancel()
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
@@ -0,0 +1,235 @@
+"""Load balancer adapter - Spreads searches across several Perplexica backends."""
+
+import itertools
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+
+from domain.entities import SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort, is_backend_failure
+from infrastructure.attempts import attempt_backends
+
+
+class BalancingStrategy(StrEnum):
+    """How the next backend is chosen."""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_IN_FLIGHT = "least_in_flight"
+    EWMA = "ewma"
+
+
+@dataclass(frozen=True)
+class BackendStats:
+    """Snapshot of one backend's state.
+
+    Attributes:
+        name: Backend name (its base URL).
+        healthy: Whether the backend currently receives traffic.
+        in_flight: Searches currently running on the backend.
+        ewma_latency: Smoothed latency in seconds, None before the first call.
+        consecutive_failures: Failures since the last success.
+    """
+
+    name: str
+    healthy: bool
+    in_flight: int
+    ewma_latency: float | None
+    consecutive_failures: int
+
+
+@dataclass
+class _Backend:
+    """Mutable bookkeeping for one backend.
+
+    Attributes:
+        name: Backend name (its base URL).
+        port: Search port talking to the backend.
+        in_flight: Searches currently running on the backend.
+        ewma_latency: Smoothed latency in seconds, None before the first call.
+        consecutive_failures: Failures since the last success.
+        ejected_until: Time until which the backend receives no traffic.
+    """
+
+    name: str
+    port: SearchPort
+    in_flight: int = 0
+    ewma_latency: float | None = None
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+
+class LoadBalancingSearchAdapter(SearchPort):
+    """SearchPort spreading searches over a pool of backends.
+
+    Backends failing `max_failures` times in a row are ejected for
+    `ejection_time` seconds, after which they are re-admitted and a single
+    further failure ejects them again. If every backend is ejected, traffic
+    goes to all of them rather than failing outright.
+
+    Attempts of one search started under `distinct_backends` (such as a
+    hedge and the attempt it duplicates) go to different backends while
+    there are enough healthy ones.
+
+    Attributes:
+        _backends: Bookkeeping for each backend, in configuration order.
+        _strategy: How the next backend is chosen.
+        _counter: Rotating counter used for round-robin and tie-breaking.
+    """
+
+    def __init__(
+        self,
+        backends: Mapping[str, SearchPort],
+        strategy: BalancingStrategy = BalancingStrategy.LEAST_IN_FLIGHT,
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        ewma_alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize LoadBalancingSearchAdapter.
+
+        Args:
+            backends: Search ports to balance over, by name.
+            strategy: How the next backend is chosen.
+            max_failures: Consecutive failures that eject a backend.
+            ejection_time: Seconds an ejected backend receives no traffic.
+            ewma_alpha: Weight of the newest sample in the latency average.
+            clock: Time source, in seconds.
+        """
+        self._backends = [_Backend(name=name, port=port) for name, port in backends.items()]
+        self._strategy = strategy
+        self._max_failures = max_failures
+        self._ejection_time = ejection_time
+        self._ewma_alpha = ewma_alpha
+        self._clock = clock
+        self._counter = itertools.count()
+
+    @property
+    def stats(self) -> list[BackendStats]:
+        """Current state of every backend."""
+        now = self._clock()
+        return [
+            BackendStats(
+                name=backend.name,
+                healthy=backend.ejected_until <= now,
+                in_flight=backend.in_flight,
+                ewma_latency=backend.ewma_latency,
+                consecutive_failures=backend.consecutive_failures,
+            )
+            for backend in self._backends
+        ]
+
+    def _select(self) -> _Backend:
+        """Choose the backend for the next search.
+
+        Backends already serving another attempt of the same search are
+        avoided unless no other is healthy.
+
+        Returns:
+            The chosen backend.
+        """
+        now = self._clock()
+        candidates = [b for b in self._backends if b.ejected_until <= now] or self._backends
+        taken = attempt_backends()
+        if taken:
+            candidates = [b for b in candidates if b.name not in taken] or candidates
+        offset = next(self._counter)
+        # Rotate so ties are broken round-robin rather than always by position
+        rotated = [candidates[(offset + i) % len(candidates)] for i in range(len(candidates))]
+
+        match self._strategy:
+            case BalancingStrategy.ROUND_ROBIN:
+                backend = rotated[0]
+            case BalancingStrategy.LEAST_IN_FLIGHT:
+                backend = min(rotated, key=lambda b: b.in_flight)
+            case BalancingStrategy.EWMA:
+                # Unmeasured backends score 0 so they get probed first
+                backend = min(rotated, key=lambda b: (b.ewma_latency or 0.0) * (b.in_flight + 1))
+        if taken is not None:
+            taken.add(backend.name)
+        return backend
+
+    def _record(self, backend: _Backend, started: float, error: SearchError | None) -> None:
+        """Update a backend's latency and health after a call.
+
+        Args:
+            backend: The backend that served the call.
+            started: When the call started.
+            error: The error the call raised, if any.
+        """
+        if error is not None and is_backend_failure(error):
+            backend.consecutive_failures += 1
+            if backend.consecutive_failures >= self._max_failures:
+                backend.ejected_until = self._clock() + self._ejection_time
+                # Re-admitted backends are ejected again on their next failure
+                backend.consecutive_failures = self._max_failures - 1
+            return
+
+        latency = self._clock() - started
+        backend.consecutive_failures = 0
+        backend.ewma_latency = (
+            latency
+            if backend.ewma_latency is None
+            else self._ewma_alpha * latency + (1 - self._ewma_alpha) * backend.ewma_latency
+        )
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search on the selected backend.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchError: If the backend's search fails.
+        """
+        backend = self._select()
+        backend.in_flight += 1
+        started = self._clock()
+        try:
+            result = await backend.port.search(request)
+        except SearchError as e:
+            self._record(backend, started, e)
+            raise
+        finally:
+            backend.in_flight -= 1
+        self._record(backend, started, None)
+        return result
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search from the selected backend.
+
+        Latency is measured to the first chunk.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the backend's search fails.
+        """
+        backend = self._select()
+        backend.in_flight += 1
+        started = self._clock()
+        recorded = False
+        try:
+            async for chunk in backend.port.search_stream(request):
+                if not recorded:
+                    self._record(backend, started, None)
+                    recorded = True
+                yield chunk
+        except SearchError as e:
+            if not recorded:
+                self._record(backend, started, e)
+            raise
+        finally:
+            backend.in_flight -= 1
+
+    async def close(self) -> None:
+        """Close every backend."""
+        for backend in self._backends:
+            await backend.port.close()
@@ -0,0 +1,199 @@
+"""Metrics adapter - Prometheus implementation of MetricsPort."""
+
+import asyncio
+import json
+import time
+from collections.abc import Collection, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+from domain.entities import SearchRequest
+from domain.ports import MetricsPort, SearchError, SearchUnavailableError
+
+# Searches take from under a second (speed mode) to minutes (quality mode)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+LABELS = ("focus_mode", "optimization_mode", "chat_model", "outcome")
+# Label value of chat models the server was not configured with; clients choose
+# the model of each search, so naming every one would let them grow series unboundedly
+OTHER_CHAT_MODEL = "other"
+
+
+def error_class(error: BaseException) -> str:
+    """Classify a failure for the error counter.
+
+    Args:
+        error: The exception raised by a search.
+
+    Returns:
+        One of 'unavailable', 'timeout', 'connect', 'http_status', 'parse'
+        or 'other'.
+    """
+    if isinstance(error, SearchUnavailableError):
+        return "unavailable"
+    cause = error.cause if isinstance(error, SearchError) else error
+    match cause:
+        case httpx.TimeoutException() | TimeoutError():
+            return "timeout"
+        case httpx.TransportError():
+            return "connect"
+        case httpx.HTTPStatusError():
+            return "http_status"
+        case json.JSONDecodeError() | KeyError() | TypeError() | ValueError():
+            return "parse"
+        case _:
+            return "other"
+
+
+class PrometheusMetrics(MetricsPort):
+    """MetricsPort recording Prometheus histograms, counters and gauges.
+
+    Metrics live in their own registry so several instances (tests, several
+    servers in one process) never clash; `exposition` renders it in the
+    Prometheus text format.
+
+    The `chat_model` label names only the chat models the server was
+    configured with; searches with any other model are labelled 'other'.
+
+    Attributes:
+        registry: Registry holding every metric of this instance.
+        _chat_models: Chat model keys that get their own label value.
+    """
+
+    content_type = CONTENT_TYPE_LATEST
+
+    def __init__(
+        self, pool_max_connections: int | None = None, chat_models: Collection[str] = ()
+    ) -> None:
+        """Initialize PrometheusMetrics.
+
+        Args:
+            pool_max_connections: Connection limit of each backend's pool,
+                exported so pool usage can be read as a ratio.
+            chat_models: Keys of the configured chat models, the only ones
+                labelled by name.
+        """
+        self.registry = CollectorRegistry()
+        self._chat_models = frozenset(chat_models)
+        self._search_latency = Histogram(
+            "mcp_perplexica_search_duration_seconds",
+            "End-to-end search latency.",
+            LABELS,
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self._upstream_latency = Histogram(
+            "mcp_perplexica_upstream_duration_seconds",
+            "Latency of calls to Perplexica.",
+            LABELS,
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self._errors = Counter(
+            "mcp_perplexica_errors",
+            "Failed searches by stage and error class.",
+            ("stage", "error_class", "status"),
+            registry=self.registry,
+        )
+        self._searches_in_flight = Gauge(
+            "mcp_perplexica_searches_in_flight",
+            "Searches currently being executed.",
+            registry=self.registry,
+        )
+        self._upstream_in_flight = Gauge(
+            "mcp_perplexica_upstream_in_flight",
+            "Calls currently open to each Perplexica backend, i.e. pooled connections in use.",
+            ("backend",),
+            registry=self.registry,
+        )
+        if pool_max_connections is not None:
+            Gauge(
+                "mcp_perplexica_pool_max_connections",
+                "Connection limit of each backend's pool.",
+                registry=self.registry,
+            ).set(pool_max_connections)
+
+    def exposition(self) -> bytes:
+        """Render every metric in the Prometheus text format."""
+        return generate_latest(self.registry)
+
+    def _labels(self, request: SearchRequest, outcome: str) -> dict[str, str]:
+        """Label values describing a request and how it ended."""
+        chat_model = request.chat_model.key
+        return {
+            "focus_mode": request.focus_mode.value,
+            "optimization_mode": request.optimization_mode.value,
+            "chat_model": chat_model if chat_model in self._chat_models else OTHER_CHAT_MODEL,
+            "outcome": outcome,
+        }
+
+    def _record_error(self, stage: str, error: Exception) -> None:
+        """Count a failure."""
+        cause = error.cause if isinstance(error, SearchError) else error
+        status = (
+            str(cause.response.status_code) if isinstance(cause, httpx.HTTPStatusError) else ""
+        )
+        self._errors.labels(stage=stage, error_class=error_class(error), status=status).inc()
+
+    @contextmanager
+    def _measure(
+        self, stage: str, histogram: Histogram, gauge: Gauge, request: SearchRequest
+    ) -> Iterator[None]:
+        """Time a call, count it in flight and record its failure."""
+        gauge.inc()
+        started = time.perf_counter()
+        outcome = "success"
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            outcome = "error"
+            self._record_error(stage, e)
+            raise
+        finally:
+            gauge.dec()
+            histogram.labels(**self._labels(request, outcome)).observe(
+                time.perf_counter() - started
+            )
+
+    def measure_search(self, request: SearchRequest) -> AbstractContextManager[None]:
+        """Measure an end-to-end search.
+
+        Args:
+            request: The search request being executed.
+
+        Returns:
+            Context manager wrapping the search.
+        """
+        return self._measure(
+            "search", self._search_latency, self._searches_in_flight, request
+        )
+
+    def measure_upstream(
+        self, request: SearchRequest, backend: str
+    ) -> AbstractContextManager[None]:
+        """Measure one call to a Perplexica backend.
+
+        Args:
+            request: The search request being sent.
+            backend: Name of the backend called (its base URL).
+
+        Returns:
+            Context manager wrapping the upstream call.
+        """
+        return self._measure(
+            "upstream",
+            self._upstream_latency,
+            self._upstream_in_flight.labels(backend=backend),
+            request,
+        )
@@ -1,41 +1,176 @@
 """Perplexica adapter - HTTP client implementation of SearchPort."""
 
-from typing import Any
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import urlsplit
 
 import httpx
 
-from domain.entities import SearchRequest, SearchResult, Source
-from domain.ports import SearchError, SearchPort
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional `fast-json` extra
+    orjson = None  # type: ignore[assignment]
+
+from domain.entities import (
+    ChatModel,
+    EmbeddingModel,
+    FocusMode,
+    OptimizationMode,
+    SearchChunk,
+    SearchRequest,
+    SearchResult,
+    Source,
+    SourceDedupe,
+    SourceLimits,
+)
+from domain.ports import (
+    MetricsPort,
+    SearchDeadlineError,
+    SearchError,
+    SearchPort,
+    SpanPort,
+    TracerPort,
+)
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """JSON encoder and decoder used for Perplexica request and response bodies.
+
+    Attributes:
+        name: Short name of the implementation.
+        dumps: Encodes a payload to UTF-8 JSON bytes.
+        loads: Decodes JSON from bytes or str.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_dumps(payload: Any) -> bytes:
+    """Encode a payload with the standard library, as compactly as orjson does."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+STDLIB_CODEC = JsonCodec(name="json", dumps=_stdlib_dumps, loads=json.loads)
+ORJSON_CODEC = (
+    JsonCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads) if orjson else None
+)
+
+
+# Source limits that keep every source as Perplexica returned it
+_NO_LIMITS = SourceLimits()
+
+# Pre-encoded payload templates kept per adapter, oldest dropped first
+_MAX_TEMPLATES = 256
+
+# Fields of SearchRequest that only vary with the model and mode configuration
+_TemplateKey = tuple[ChatModel, EmbeddingModel, FocusMode, OptimizationMode, str | None]
+
+
+def default_codec() -> JsonCodec:
+    """Return the fastest available JSON codec: orjson if installed, else stdlib."""
+    return ORJSON_CODEC or STDLIB_CODEC
+
+
+def _dedupe_key(url: str, dedupe: SourceDedupe) -> str:
+    """Identity of a source for de-duplication: its URL or its domain."""
+    if dedupe is SourceDedupe.DOMAIN:
+        return (urlsplit(url).hostname or url).removeprefix("www.")
+    return url
+
+
+def _truncate(snippet: str | None, max_chars: int | None) -> str | None:
+    """Cut a snippet to max_chars, marking the cut with an ellipsis."""
+    if snippet is None or max_chars is None or len(snippet) <= max_chars:
+        return snippet
+    if max_chars == 0:
+        return None
+    return snippet[: max_chars - 1] + "…"
 
 
 class PerplexicaAdapter(SearchPort):
     """HTTP client adapter for Perplexica search API.
 
     This adapter implements the SearchPort interface by making HTTP
-    requests to the Perplexica API.
+    requests to the Perplexica API. A single pooled HTTP client is shared
+    by every search made through the adapter, so one instance should live
+    for the whole server process and be closed on shutdown.
 
     Attributes:
         _base_url: Base URL of the Perplexica API.
         _client: HTTP client for making requests.
-        _timeout: Request timeout in seconds.
+        _timeout: Connect, read, write and pool timeouts.
+        _limits: Connection pool limits for the HTTP client.
+        _http2: Whether the HTTP client negotiates HTTP/2.
+        _metrics: Optional recorder of upstream latency and errors.
+        _tracer: Optional tracer spanning each call to Perplexica.
+        _codec: JSON codec for request and response bodies.
+        _templates: Encoded configuration part of request payloads, by
+            models, modes and system instructions.
     """
 
     def __init__(
         self,
         base_url: str,
-        timeout: float = 120.0,
+        timeout: float | httpx.Timeout = 120.0,
         client: httpx.AsyncClient | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        metrics: MetricsPort | None = None,
+        tracer: TracerPort | None = None,
+        codec: JsonCodec | None = None,
     ) -> None:
         """Initialize PerplexicaAdapter.
 
         Args:
             base_url: Base URL of the Perplexica API (e.g., 'http://localhost:3000').
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds, or per-phase httpx.Timeout.
             client: Optional pre-configured HTTP client.
+            limits: Optional connection pool limits. Defaults to httpx limits.
+            http2: Whether to enable HTTP/2 (requires the `h2` package).
+            metrics: Optional recorder of upstream latency and errors.
+            tracer: Optional tracer spanning each call to Perplexica.
+            codec: JSON codec for request and response bodies. Defaults to
+                orjson when installed, else the standard library.
         """
         self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
+        self._timeout = httpx.Timeout(timeout)
         self._client = client
+        self._limits = limits or httpx.Limits()
+        self._http2 = http2
+        self._metrics = metrics
+        self._tracer = tracer
+        self._codec = codec or default_codec()
+        self._templates: dict[_TemplateKey, bytes] = {}
+
+    async def __aenter__(self) -> Self:
+        """Open the pooled HTTP client.
+
+        Returns:
+            The adapter itself.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pooled HTTP client."""
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the pooled HTTP client ahead of the first search."""
+        await self._get_client()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client.
@@ -44,67 +179,284 @@ class PerplexicaAdapter(SearchPort):
             Configured HTTP client.
         """
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self._timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+            )
         return self._client
 
-    def _build_request_payload(self, request: SearchRequest) -> dict[str, Any]:
-        """Build the request payload for Perplexica API.
+    def _request_timeout(self, request: SearchRequest) -> httpx.Timeout:
+        """Cap every timeout phase by the time left before the request deadline.
 
         Args:
             request: The domain search request.
 
         Returns:
-            Dictionary payload matching Perplexica API format.
+            Per-request timeouts; the configured ones if there is no deadline.
+
+        Raises:
+            SearchDeadlineError: If the deadline has already passed.
         """
-        payload: dict[str, Any] = {
-            "chatModel": {
-                "providerId": request.chat_model.provider_id,
-                "key": request.chat_model.key,
-            },
-            "embeddingModel": {
-                "providerId": request.embedding_model.provider_id,
-                "key": request.embedding_model.key,
+        if request.deadline is None:
+            return self._timeout
+
+        remaining = request.deadline - time.monotonic()
+        if remaining <= 0:
+            raise SearchDeadlineError(
+                message="Search deadline exceeded before contacting Perplexica"
+            )
+
+        def cap(value: float | None) -> float:
+            return remaining if value is None else min(value, remaining)
+
+        return httpx.Timeout(
+            connect=cap(self._timeout.connect),
+            read=cap(self._timeout.read),
+            write=cap(self._timeout.write),
+            pool=cap(self._timeout.pool),
+        )
+
+    @staticmethod
+    def _request_error(request: SearchRequest, error: httpx.RequestError) -> SearchError:
+        """Wrap a transport error, telling apart timeouts set by the request deadline.
+
+        Args:
+            request: The domain search request.
+            error: The transport error raised by httpx.
+
+        Returns:
+            SearchDeadlineError if the call timed out at the request deadline,
+            otherwise a SearchError.
+        """
+        if (
+            isinstance(error, httpx.TimeoutException)
+            and request.deadline is not None
+            and time.monotonic() >= request.deadline
+        ):
+            return SearchDeadlineError(
+                message="Search deadline exceeded while waiting for Perplexica", cause=error
+            )
+        return SearchError(message=f"Failed to connect to Perplexica API: {error}", cause=error)
+
+    def _measure(self, request: SearchRequest) -> AbstractContextManager[None]:
+        """Measure a call to Perplexica, if metrics are recorded."""
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.measure_upstream(request, self._base_url)
+
+    def _span(self, request: SearchRequest) -> AbstractContextManager[SpanPort | None]:
+        """Open a span for a call to Perplexica, if calls are traced."""
+        if self._tracer is None:
+            return nullcontext()
+        return self._tracer.span(
+            "perplexica.search",
+            {
+                "http.request.method": "POST",
+                "url.full": f"{self._base_url}/api/search",
+                "search.stream": request.stream,
             },
-            "optimizationMode": request.optimization_mode.value,
-            "focusMode": request.focus_mode.value,
-            "query": request.query,
-            "history": [
-                [entry.role, entry.content] for entry in request.history
-            ],
-            "stream": request.stream,
-        }
+        )
+
+    def _headers(self) -> dict[str, str]:
+        """Request headers, carrying the trace context when calls are traced."""
+        headers = {"Content-Type": "application/json"}
+        if self._tracer is not None:
+            self._tracer.inject(headers)
+        return headers
+
+    @staticmethod
+    def _extensions(span: SpanPort | None) -> dict[str, Any]:
+        """httpx extensions recording connection events on the span.
+
+        The events (pool acquisition, connect, send, receive) break the call
+        down so time spent waiting for a pooled connection is visible.
+        """
+        if span is None:
+            return {}
+
+        async def trace(event_name: str, _: dict[str, Any]) -> None:
+            span.add_event(event_name)
+
+        return {"trace": trace}
+
+    @staticmethod
+    def _record_response(span: SpanPort | None, response: httpx.Response) -> None:
+        """Attach request and response details to the span."""
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", response.status_code)
+        request_size = response.request.headers.get("Content-Length")
+        if request_size is not None:
+            span.set_attribute("http.request.body.size", int(request_size))
+
+    def _template(self, request: SearchRequest) -> bytes:
+        """Get the encoded configuration part of the request payload.
 
-        if request.system_instructions is not None:
-            payload["systemInstructions"] = request.system_instructions
+        Nearly every search repeats the same models, modes and system
+        instructions, so that part is encoded once and reused: an unclosed
+        JSON object ending in a comma, ready for the per-request fields.
 
-        return payload
+        Args:
+            request: The domain search request.
+
+        Returns:
+            The encoded payload prefix.
+        """
+        key = (
+            request.chat_model,
+            request.embedding_model,
+            request.focus_mode,
+            request.optimization_mode,
+            request.system_instructions,
+        )
+        template = self._templates.get(key)
+        if template is None:
+            static: dict[str, Any] = {
+                "chatModel": {
+                    "providerId": request.chat_model.provider_id,
+                    "key": request.chat_model.key,
+                },
+                "embeddingModel": {
+                    "providerId": request.embedding_model.provider_id,
+                    "key": request.embedding_model.key,
+                },
+                "optimizationMode": request.optimization_mode.value,
+                "focusMode": request.focus_mode.value,
+            }
+            if request.system_instructions is not None:
+                static["systemInstructions"] = request.system_instructions
+
+            template = self._codec.dumps(static)[:-1] + b","
+            if len(self._templates) >= _MAX_TEMPLATES:
+                del self._templates[next(iter(self._templates))]
+            self._templates[key] = template
+        return template
+
+    def _encode_payload(self, request: SearchRequest, stream: bool) -> bytes:
+        """Encode the request body in the Perplexica API format.
 
-    def _parse_response(self, data: dict[str, Any]) -> SearchResult:
+        Only the query and history are encoded per request; they are
+        spliced into the cached configuration template.
+
+        Args:
+            request: The domain search request.
+            stream: Whether to ask Perplexica for a streamed answer.
+
+        Returns:
+            The JSON request body.
+        """
+        dumps = self._codec.dumps
+        history = (
+            dumps([[entry.role, entry.content] for entry in request.history])
+            if request.history
+            else b"[]"
+        )
+        return b"".join(
+            (
+                self._template(request),
+                b'"query":',
+                dumps(request.query),
+                b',"history":',
+                history,
+                b',"stream":true}' if stream else b',"stream":false}',
+            )
+        )
+
+    @staticmethod
+    def _parse_sources(
+        sources_data: list[dict[str, Any]], limits: SourceLimits = _NO_LIMITS
+    ) -> tuple[Source, ...]:
+        """Parse Perplexica source objects into domain entities.
+
+        Duplicates and sources past the limit are skipped before a Source
+        is built for them, and snippets are cut while parsing.
+
+        Args:
+            sources_data: Raw source objects from Perplexica API.
+            limits: Limits on the sources kept.
+
+        Returns:
+            Tuple of Source domain entities.
+        """
+        if limits == _NO_LIMITS:
+            # A list comprehension with positional arguments is the cheapest
+            # way to build dozens of sources per answer
+            return tuple(
+                [
+                    Source(source.get("title", ""), source.get("url", ""), source.get("snippet"))
+                    for source in sources_data
+                ]
+            )
+
+        sources: list[Source] = []
+        seen: set[str] = set()
+        for source in sources_data:
+            if limits.max_sources is not None and len(sources) >= limits.max_sources:
+                break
+            url = source.get("url", "")
+            if limits.dedupe is not SourceDedupe.NONE:
+                key = _dedupe_key(url, limits.dedupe)
+                if key in seen:
+                    continue
+                seen.add(key)
+            snippet = _truncate(source.get("snippet"), limits.snippet_max_chars)
+            sources.append(Source(source.get("title", ""), url, snippet))
+        return tuple(sources)
+
+    def _parse_response(
+        self, data: dict[str, Any], limits: SourceLimits = _NO_LIMITS
+    ) -> SearchResult:
         """Parse Perplexica API response into domain entity.
 
         Args:
             data: Raw response data from Perplexica API.
+            limits: Limits on the sources kept.
 
         Returns:
             SearchResult domain entity.
         """
         message = data.get("message", "")
-
-        sources_data = data.get("sources", [])
-        sources = tuple(
-            Source(
-                title=source.get("title", ""),
-                url=source.get("url", ""),
-                snippet=source.get("snippet"),
-            )
-            for source in sources_data
-        )
+        sources = self._parse_sources(data.get("sources", []), limits)
 
         return SearchResult(message=message, sources=sources)
 
+    def _parse_stream_line(
+        self, line: str, limits: SourceLimits = _NO_LIMITS
+    ) -> SearchChunk | None:
+        """Parse one NDJSON line of a Perplexica stream.
+
+        Args:
+            line: A single line of the streamed response body.
+            limits: Limits on the sources kept.
+
+        Returns:
+            The chunk carried by the event, or None for events without
+            content (blank lines, 'init', 'done').
+
+        Raises:
+            SearchError: If Perplexica reports an error event.
+        """
+        if not line.strip():
+            return None
+
+        event = self._codec.loads(line)
+        match event.get("type"):
+            case "response":
+                return SearchChunk(message=event.get("data", ""))
+            case "sources":
+                return SearchChunk(sources=self._parse_sources(event.get("data", []), limits))
+            case "error":
+                raise SearchError(message=f"Perplexica stream error: {event.get('data')}")
+            case _:
+                return None
+
     async def search(self, request: SearchRequest) -> SearchResult:
         """Execute a search request against Perplexica API.
 
+        Streaming requests are consumed through `search_stream` and
+        assembled into a single result.
+
         Args:
             request: The search request containing query and configuration.
 
@@ -114,35 +466,106 @@ class PerplexicaAdapter(SearchPort):
         Raises:
             SearchError: If the search operation fails.
         """
+        if request.stream:
+            message_parts: list[str] = []
+            sources: tuple[Source, ...] = ()
+            async for chunk in self.search_stream(request):
+                message_parts.append(chunk.message)
+                sources = chunk.sources or sources
+            return SearchResult(message="".join(message_parts), sources=sources)
+
         client = await self._get_client()
         url = f"{self._base_url}/api/search"
-        payload = self._build_request_payload(request)
+        content = self._encode_payload(request, stream=False)
+        timeout = self._request_timeout(request)
 
-        try:
-            response = await client.post(
-                url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            data = response.json()
-            return self._parse_response(data)
-
-        except httpx.HTTPStatusError as e:
-            raise SearchError(
-                message=f"Perplexica API returned error: {e.response.status_code}",
-                cause=e,
-            ) from e
-        except httpx.RequestError as e:
-            raise SearchError(
-                message=f"Failed to connect to Perplexica API: {e}",
-                cause=e,
-            ) from e
-        except Exception as e:
-            raise SearchError(
-                message=f"Unexpected error during search: {e}",
-                cause=e,
-            ) from e
+        with self._span(request) as span, self._measure(request):
+            try:
+                response = await client.post(
+                    url,
+                    content=content,
+                    headers=self._headers(),
+                    timeout=timeout,
+                    extensions=self._extensions(span),
+                )
+                self._record_response(span, response)
+                response.raise_for_status()
+                data = self._codec.loads(response.content)
+                result = self._parse_response(data, request.source_limits)
+                if span is not None:
+                    span.set_attribute("http.response.body.size", len(response.content))
+                    span.set_attribute("search.source_count", len(result.sources))
+                return result
+
+            except httpx.HTTPStatusError as e:
+                raise SearchError(
+                    message=f"Perplexica API returned error: {e.response.status_code}",
+                    cause=e,
+                    status_code=e.response.status_code,
+                ) from e
+            except httpx.RequestError as e:
+                raise self._request_error(request, e) from e
+            except Exception as e:
+                raise SearchError(
+                    message=f"Unexpected error during search: {e}",
+                    cause=e,
+                ) from e
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search request from Perplexica API.
+
+        Perplexica answers streaming requests with newline-delimited JSON
+        events; each line is parsed as soon as it arrives so partial answers
+        reach the caller while the LLM is still generating.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the search operation fails.
+        """
+        client = await self._get_client()
+        url = f"{self._base_url}/api/search"
+        content = self._encode_payload(request, stream=True)
+        timeout = self._request_timeout(request)
+
+        with self._span(request) as span, self._measure(request):
+            try:
+                async with client.stream(
+                    "POST",
+                    url,
+                    content=content,
+                    headers=self._headers(),
+                    timeout=timeout,
+                    extensions=self._extensions(span),
+                ) as response:
+                    self._record_response(span, response)
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        chunk = self._parse_stream_line(line, request.source_limits)
+                        if chunk is not None:
+                            if span is not None and chunk.sources:
+                                span.set_attribute("search.source_count", len(chunk.sources))
+                            yield chunk
+
+            except SearchError:
+                raise
+            except httpx.HTTPStatusError as e:
+                raise SearchError(
+                    message=f"Perplexica API returned error: {e.response.status_code}",
+                    cause=e,
+                    status_code=e.response.status_code,
+                ) from e
+            except httpx.RequestError as e:
+                raise self._request_error(request, e) from e
+            except Exception as e:
+                raise SearchError(
+                    message=f"Unexpected error during search: {e}",
+                    cause=e,
+                ) from e
 
     async def close(self) -> None:
         """Close the HTTP client connection."""
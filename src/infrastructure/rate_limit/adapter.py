@@ -0,0 +1,256 @@
+"""Rate limit adapter - Per-client token buckets in front of SearchPort."""
+
+import time
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
+
+from domain.entities import (
+    ANONYMOUS_CLIENT,
+    FocusMode,
+    SearchChunk,
+    SearchRequest,
+    SearchResult,
+)
+from domain.ports import SearchPort, SearchUnavailableError
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket refilled at a steady rate.
+
+    Attributes:
+        rate: Searches per second a client may sustain.
+        burst: Searches a client may send at once after being idle; at least 1,
+            since a search needs a whole token.
+    """
+
+    rate: float
+    burst: float
+
+    def __post_init__(self) -> None:
+        """Reject limits that would never refill or never allow a search.
+
+        Raises:
+            ValueError: If rate is not positive or burst is below 1.
+        """
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError(f"Rate limit needs a positive rate and a burst of 1 or more, got {self}")
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Snapshot of the rate limiter's counters.
+
+    Attributes:
+        clients: Clients whose bucket is currently tracked.
+        allowed: Searches allowed since startup.
+        throttled: Searches refused since startup.
+        throttled_by_client: Searches refused since startup, for the clients
+            refused most often.
+    """
+
+    clients: int
+    allowed: int
+    throttled: int
+    throttled_by_client: dict[str, int]
+
+
+@dataclass
+class _Bucket:
+    """Mutable state of one client's token bucket.
+
+    Attributes:
+        tokens: Searches the client may send right now.
+        updated: When tokens was last refilled.
+    """
+
+    tokens: float
+    updated: float
+
+
+class RateLimitingSearchAdapter(SearchPort):
+    """SearchPort decorator applying token-bucket rate limits per client.
+
+    Each client, identified by the `client_id` of its searches, draws one
+    token per search from a bucket holding up to `burst` tokens and refilled
+    at `rate` tokens per second. Focus modes given their own limit have a
+    separate bucket per client; the others share the client's default
+    bucket. A client's weight multiplies both its rate and its burst.
+
+    Searches finding their bucket empty are refused with a
+    SearchUnavailableError telling when the next token is due.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _default: Limit of focus modes without their own.
+        _by_focus_mode: Limits of focus modes that have their own bucket.
+        _client_weights: Multiplier of each client's limits.
+        _max_clients: Buckets, and clients counted in _throttled, kept at most.
+        _top_clients: Clients listed in the stats' throttled_by_client.
+        _buckets: Bucket of each client and limited focus mode, least
+            recently used first.
+        _throttled: Searches refused, by client.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        default: RateLimit,
+        by_focus_mode: Mapping[FocusMode, RateLimit] | None = None,
+        client_weights: Mapping[str, float] | None = None,
+        max_clients: int = 10_000,
+        top_clients: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize RateLimitingSearchAdapter.
+
+        Args:
+            inner: The search port to protect.
+            default: Limit of focus modes without their own.
+            by_focus_mode: Limits of focus modes that have their own bucket.
+            client_weights: Multiplier of each client's limits; unlisted
+                clients weigh 1.
+            max_clients: Buckets kept at most. Past it, buckets that have
+                refilled, and so are indistinguishable from new ones, are
+                forgotten, then the least recently used one. Refusals are
+                counted by client for as many clients.
+            top_clients: Clients listed in the stats' throttled_by_client.
+            clock: Time source, in seconds.
+
+        Raises:
+            ValueError: If a client weight is not positive, or scales a burst
+                below 1.
+        """
+        smallest_burst = min(limit.burst for limit in [default, *(by_focus_mode or {}).values()])
+        for client, weight in (client_weights or {}).items():
+            if weight <= 0:
+                raise ValueError(f"Weight of client '{client}' must be positive, got {weight}")
+            if smallest_burst * weight < 1:
+                raise ValueError(
+                    f"Weight {weight} of client '{client}' scales a burst of {smallest_burst} "
+                    "below 1, so the client could never search"
+                )
+        self._inner = inner
+        self._default = default
+        self._by_focus_mode: dict[FocusMode | None, RateLimit] = dict(
+            (by_focus_mode or {}).items()
+        )
+        self._client_weights = dict(client_weights or {})
+        self._max_clients = max_clients
+        self._top_clients = top_clients
+        self._clock = clock
+        self._buckets: OrderedDict[tuple[str, FocusMode | None], _Bucket] = OrderedDict()
+        self._allowed = 0
+        self._throttled: Counter[str] = Counter()
+        self._throttled_total = 0
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """Clients tracked and searches allowed and refused."""
+        return RateLimitStats(
+            clients=len({client for client, _ in self._buckets}),
+            allowed=self._allowed,
+            throttled=self._throttled_total,
+            throttled_by_client=dict(self._throttled.most_common(self._top_clients)),
+        )
+
+    def _limit(self, client: str, focus_mode: FocusMode | None) -> RateLimit:
+        """Compute the limit of a client's bucket, scaled by its weight."""
+        limit = self._by_focus_mode.get(focus_mode, self._default)
+        weight = self._client_weights.get(client, 1.0)
+        return RateLimit(rate=limit.rate * weight, burst=limit.burst * weight)
+
+    def _prune(self, now: float) -> None:
+        """Make room for a new bucket.
+
+        Buckets that have refilled completely are forgotten. If none has,
+        the least recently used bucket is, so the buckets stay bounded even
+        when every client is busy.
+        """
+        for key, bucket in list(self._buckets.items()):
+            limit = self._limit(*key)
+            if bucket.tokens + (now - bucket.updated) * limit.rate >= limit.burst:
+                del self._buckets[key]
+        if len(self._buckets) >= self._max_clients:
+            self._buckets.popitem(last=False)
+
+    def _count_throttled(self, client: str) -> None:
+        """Count a refused search, by client while fewer than max_clients are counted."""
+        self._throttled_total += 1
+        if client in self._throttled or len(self._throttled) < self._max_clients:
+            self._throttled[client] += 1
+
+    def _take(self, request: SearchRequest) -> None:
+        """Draw a token from the bucket of a search's client.
+
+        Args:
+            request: The search request.
+
+        Raises:
+            SearchUnavailableError: If the client's bucket is empty.
+        """
+        client = request.client_id or ANONYMOUS_CLIENT
+        focus_mode = request.focus_mode if request.focus_mode in self._by_focus_mode else None
+        limit = self._limit(client, focus_mode)
+        now = self._clock()
+
+        bucket = self._buckets.get((client, focus_mode))
+        if bucket is None:
+            if len(self._buckets) >= self._max_clients:
+                self._prune(now)
+            bucket = self._buckets[client, focus_mode] = _Bucket(tokens=limit.burst, updated=now)
+        else:
+            self._buckets.move_to_end((client, focus_mode))
+        bucket.tokens = min(limit.burst, bucket.tokens + (now - bucket.updated) * limit.rate)
+        bucket.updated = now
+
+        if bucket.tokens < 1:
+            self._count_throttled(client)
+            scope = f"'{focus_mode}' searches" if focus_mode else "searches"
+            raise SearchUnavailableError(
+                message=(
+                    f"Rate limit of {limit.rate * 60:g} {scope} per minute "
+                    f"exceeded for client '{client}'"
+                ),
+                retry_after=(1 - bucket.tokens) / limit.rate,
+            )
+        bucket.tokens -= 1
+        self._allowed += 1
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search if its client has not exceeded its rate limit.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchUnavailableError: If the client exceeded its rate limit.
+            SearchError: If the wrapped search fails.
+        """
+        self._take(request)
+        return await self._inner.search(request)
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search if its client has not exceeded its rate limit.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchUnavailableError: If the client exceeded its rate limit.
+            SearchError: If the wrapped search fails.
+        """
+        self._take(request)
+        async for chunk in self._inner.search_stream(request):
+            yield chunk
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
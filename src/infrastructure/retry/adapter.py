@@ -0,0 +1,240 @@
+"""Retry adapter - Retries transient upstream failures for SearchPort."""
+
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from domain.entities import SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort
+from infrastructure.attempts import RetryBudget
+
+# Failures where the request most likely never reached the LLM. Read and
+# protocol errors are left out: they happen after the request was sent, so
+# retrying them could pay for the same search twice
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.WriteError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failures to retry and how long to wait between attempts.
+
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first one.
+        base_delay: Backoff delay in seconds before the first retry.
+        max_delay: Upper bound in seconds for any single backoff delay.
+        retry_on_status: HTTP status codes worth retrying.
+        retry_on_exceptions: Transport exceptions worth retrying.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    retry_on_status: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_on_exceptions: tuple[type[Exception], ...] = field(
+        default=DEFAULT_RETRY_EXCEPTIONS
+    )
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Snapshot of retry activity.
+
+    Attributes:
+        retries: Retries performed since startup.
+        budget_exhausted: Retries skipped because the budget was empty.
+        budget_tokens: Retries currently available in the budget.
+    """
+
+    retries: int
+    budget_exhausted: int
+    budget_tokens: float
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        response: The HTTP response.
+
+    Returns:
+        Seconds to wait, or None if the header is absent or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class RetryingSearchAdapter(SearchPort):
+    """SearchPort decorator retrying transient upstream failures.
+
+    Retries use exponential backoff with full jitter, honour Retry-After
+    headers, and are limited by a shared RetryBudget. The number of
+    attempts is recorded in the result metadata.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _policy: Which failures to retry and how long to wait.
+        _budget: Shared budget capping the overall retry rate.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        policy: RetryPolicy | None = None,
+        budget: RetryBudget | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize RetryingSearchAdapter.
+
+        Args:
+            inner: The search port to retry calls to.
+            policy: Retry policy. Defaults to RetryPolicy().
+            budget: Retry budget. Defaults to RetryBudget().
+            sleep: Coroutine used to wait between attempts.
+            jitter: Source of uniform random numbers in [0, 1).
+        """
+        self._inner = inner
+        self._policy = policy or RetryPolicy()
+        self._budget = budget or RetryBudget()
+        self._sleep = sleep
+        self._jitter = jitter
+        self._retries = 0
+        self._budget_exhausted = 0
+
+    @property
+    def stats(self) -> RetryStats:
+        """Current retry counters and budget level."""
+        return RetryStats(
+            retries=self._retries,
+            budget_exhausted=self._budget_exhausted,
+            budget_tokens=self._budget.tokens,
+        )
+
+    def _is_retryable(self, error: SearchError) -> bool:
+        """Decide whether a failure is transient.
+
+        Args:
+            error: The search error raised by the wrapped port.
+
+        Returns:
+            True if the underlying cause matches the retry policy.
+        """
+        cause = error.cause
+        if isinstance(cause, httpx.HTTPStatusError):
+            return cause.response.status_code in self._policy.retry_on_status
+        return isinstance(cause, self._policy.retry_on_exceptions)
+
+    def _backoff(
+        self, request: SearchRequest, attempt: int, error: SearchError
+    ) -> float | None:
+        """Compute the delay before the next attempt.
+
+        Args:
+            request: The search request, whose deadline bounds the retries.
+            attempt: Number of attempts made so far.
+            error: The failure of the last attempt.
+
+        Returns:
+            Seconds to wait, or None if no retry should be made.
+        """
+        if attempt >= self._policy.max_attempts or not self._is_retryable(error):
+            return None
+
+        ceiling = min(self._policy.max_delay, self._policy.base_delay * 2 ** (attempt - 1))
+        delay = ceiling * self._jitter()
+        if isinstance(error.cause, httpx.HTTPStatusError):
+            retry_after = _retry_after(error.cause.response)
+            if retry_after is not None:
+                if retry_after > self._policy.max_delay:
+                    return None
+                delay = max(delay, retry_after)
+
+        if request.deadline is not None and time.monotonic() + delay >= request.deadline:
+            return None
+        if not self._budget.withdraw():
+            self._budget_exhausted += 1
+            return None
+        self._retries += 1
+        return delay
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search, retrying transient failures.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult whose metadata records the number of attempts.
+
+        Raises:
+            SearchError: If the last attempt fails or the failure is not retryable.
+        """
+        self._budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                result = await self._inner.search(request)
+            except SearchError as e:
+                delay = self._backoff(request, attempt, e)
+                if delay is None:
+                    raise
+                await self._sleep(delay)
+                attempt += 1
+                continue
+            return replace(result, metadata=replace(result.metadata, attempts=attempt))
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, retrying transient failures before the first chunk.
+
+        Once a chunk has been yielded the caller has seen partial output,
+        so later failures are raised rather than retried.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the stream fails and cannot be retried.
+        """
+        self._budget.deposit()
+        attempt = 1
+        while True:
+            started = False
+            try:
+                async for chunk in self._inner.search_stream(request):
+                    started = True
+                    yield chunk
+                return
+            except SearchError as e:
+                delay = None if started else self._backoff(request, attempt, e)
+                if delay is None:
+                    raise
+            await self._sleep(delay)
+            attempt += 1
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
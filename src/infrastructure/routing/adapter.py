@@ -0,0 +1,264 @@
+"""Model routing adapter - Falls back to other chat models when one fails or is slow."""
+
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+
+from domain.entities import ChatModel, SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort, is_backend_failure
+
+
+@dataclass(frozen=True)
+class ModelStats:
+    """Snapshot of one chat model's state.
+
+    Attributes:
+        provider_id: Provider of the chat model.
+        key: Key of the chat model.
+        healthy: Whether the model is currently tried.
+        ewma_latency: Smoothed latency in seconds, None before the first success.
+        consecutive_failures: Failures since the last success.
+        fallbacks: Searches this model answered as a fallback.
+    """
+
+    provider_id: str
+    key: str
+    healthy: bool
+    ewma_latency: float | None
+    consecutive_failures: int
+    fallbacks: int
+
+
+@dataclass
+class _Model:
+    """Mutable bookkeeping for one chat model.
+
+    Attributes:
+        ewma_latency: Smoothed latency in seconds, None before the first success.
+        consecutive_failures: Failures since the last success.
+        ejected_until: Time until which the model is only tried as a last resort.
+        fallbacks: Searches this model answered as a fallback.
+    """
+
+    ewma_latency: float | None = None
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    fallbacks: int = 0
+
+
+class ModelRoutingSearchAdapter(SearchPort):
+    """SearchPort decorator trying a search's fallback chat models in turn.
+
+    A search carrying `chat_model_fallbacks` is sent to the first usable
+    model of its chain, and to the next one when a model fails with an
+    error counting against the backend (5xx, 429, timeouts). Models failing
+    `max_failures` times in a row are ejected for `ejection_time` seconds,
+    and models whose smoothed latency exceeds `slow_latency` are tried after
+    the others. If every model is ejected, the chain is tried in order.
+
+    Searches without fallbacks, such as those naming their own chat model,
+    are passed through untracked. Streams fall back only before their first
+    chunk.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _models: Bookkeeping for each chat model seen.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        slow_latency: float | None = None,
+        ewma_alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize ModelRoutingSearchAdapter.
+
+        Args:
+            inner: The search port to route calls to.
+            max_failures: Consecutive failures that eject a model.
+            ejection_time: Seconds an ejected model is only tried as a last resort.
+            slow_latency: Smoothed latency in seconds past which a model is
+                tried after the others, or None to ignore latency.
+            ewma_alpha: Weight of the newest sample in the latency average.
+            clock: Time source, in seconds.
+        """
+        self._inner = inner
+        self._max_failures = max_failures
+        self._ejection_time = ejection_time
+        self._slow_latency = slow_latency
+        self._ewma_alpha = ewma_alpha
+        self._clock = clock
+        self._models: dict[ChatModel, _Model] = {}
+
+    @property
+    def stats(self) -> list[ModelStats]:
+        """Current state of every chat model seen."""
+        now = self._clock()
+        return [
+            ModelStats(
+                provider_id=chat_model.provider_id,
+                key=chat_model.key,
+                healthy=model.ejected_until <= now,
+                ewma_latency=model.ewma_latency,
+                consecutive_failures=model.consecutive_failures,
+                fallbacks=model.fallbacks,
+            )
+            for chat_model, model in self._models.items()
+        ]
+
+    def _model(self, chat_model: ChatModel) -> _Model:
+        """Return the bookkeeping of a chat model, creating it on first use."""
+        model = self._models.get(chat_model)
+        if model is None:
+            model = self._models[chat_model] = _Model()
+        return model
+
+    def _is_slow(self, chat_model: ChatModel) -> bool:
+        """Whether a chat model's smoothed latency exceeds slow_latency."""
+        latency = self._model(chat_model).ewma_latency
+        if self._slow_latency is None or latency is None:
+            return False
+        return latency > self._slow_latency
+
+    def _chain(self, request: SearchRequest) -> list[ChatModel]:
+        """Order the chat models a search may be sent to.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            Usable models in preference order, slow ones last; the whole chain
+            if none is usable.
+        """
+        chain = [request.chat_model, *request.chat_model_fallbacks]
+        now = self._clock()
+        healthy = [m for m in chain if self._model(m).ejected_until <= now]
+        fast = [m for m in healthy if not self._is_slow(m)]
+        slow = [m for m in healthy if self._is_slow(m)]
+        return fast + slow or chain
+
+    def _record(self, chat_model: ChatModel, started: float, error: SearchError | None) -> None:
+        """Update a chat model's latency and health after a call.
+
+        Args:
+            chat_model: The model that served the call.
+            started: When the call started.
+            error: The error the call raised, if any.
+        """
+        model = self._model(chat_model)
+        if error is not None:
+            model.consecutive_failures += 1
+            if model.consecutive_failures >= self._max_failures:
+                model.ejected_until = self._clock() + self._ejection_time
+                # Re-admitted models are ejected again on their next failure
+                model.consecutive_failures = self._max_failures - 1
+            return
+
+        latency = self._clock() - started
+        model.consecutive_failures = 0
+        model.ewma_latency = (
+            latency
+            if model.ewma_latency is None
+            else self._ewma_alpha * latency + (1 - self._ewma_alpha) * model.ewma_latency
+        )
+
+    def _routed(self, request: SearchRequest, chat_model: ChatModel) -> SearchRequest:
+        """Build the request sent to one model of the chain."""
+        if chat_model == request.chat_model:
+            return request
+        return replace(request, chat_model=chat_model)
+
+    async def _attempt(self, request: SearchRequest, chat_model: ChatModel) -> SearchResult:
+        """Send a search to one model of its chain and record the outcome.
+
+        Args:
+            request: The search request.
+            chat_model: The chat model to send it to.
+
+        Returns:
+            SearchResult whose metadata names the model if it is a fallback.
+
+        Raises:
+            SearchError: If the search fails.
+        """
+        started = self._clock()
+        try:
+            result = await self._inner.search(self._routed(request, chat_model))
+        except SearchError as e:
+            if is_backend_failure(e):
+                self._record(chat_model, started, e)
+            raise
+        self._record(chat_model, started, None)
+        if chat_model == request.chat_model:
+            return result
+        self._model(chat_model).fallbacks += 1
+        return replace(result, metadata=replace(result.metadata, chat_model=chat_model))
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Execute a search, falling back along its chat model chain.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult whose metadata names the fallback model that answered.
+
+        Raises:
+            SearchError: If every model fails, or a failure is caused by the request.
+        """
+        if not request.chat_model_fallbacks:
+            return await self._inner.search(request)
+        chain = self._chain(request)
+        for chat_model in chain[:-1]:
+            try:
+                return await self._attempt(request, chat_model)
+            except SearchError as e:
+                if not is_backend_failure(e):
+                    raise
+        return await self._attempt(request, chain[-1])
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, falling back along its chain before the first chunk.
+
+        Latency is measured to the first chunk.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If every model fails, or the stream fails after its
+                first chunk.
+        """
+        if not request.chat_model_fallbacks:
+            async for chunk in self._inner.search_stream(request):
+                yield chunk
+            return
+        chain = self._chain(request)
+        for position, chat_model in enumerate(chain):
+            started = self._clock()
+            recorded = False
+            try:
+                async for chunk in self._inner.search_stream(self._routed(request, chat_model)):
+                    if not recorded:
+                        self._record(chat_model, started, None)
+                        recorded = True
+                        if chat_model != request.chat_model:
+                            self._model(chat_model).fallbacks += 1
+                    yield chunk
+                return
+            except SearchError as e:
+                if recorded or not is_backend_failure(e):
+                    raise
+                self._record(chat_model, started, e)
+                if position == len(chain) - 1:
+                    raise
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
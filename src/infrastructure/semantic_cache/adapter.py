@@ -0,0 +1,533 @@
+"""Semantic cache adapter - Answers near-duplicate searches for SearchPort.
+
+Requires the optional `semantic-cache` extra (NumPy); the HNSW index also
+needs `hnswlib` and the sentence-transformers embedder `sentence-transformers`.
+"""
+
+import asyncio
+import re
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+
+from domain.entities import SearchChunk, SearchRequest, SearchResult, Source, SourceLimits
+from domain.ports import SearchPort
+
+# Words that carry no meaning for matching paraphrased questions
+_STOPWORDS = frozenset(
+    [
+        "a", "an", "and", "are", "be", "can", "could", "did", "do", "does",
+        "for", "from", "how", "i", "in", "is", "it", "me", "of", "on", "or",
+        "please", "s", "tell", "that", "the", "this", "to", "was", "what",
+        "whats", "when", "where", "which", "who", "why", "will", "with",
+        "would", "you",
+    ]
+)
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Partition a cached result may be reused in: (focus mode, chat model,
+# embedding model, optimization mode, system instructions, source limits)
+Partition = tuple[str, str, str, str, str | None, SourceLimits]
+
+
+class Embedder(Protocol):
+    """Turns query text into unit-length vectors."""
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a query.
+
+        Args:
+            text: The query text.
+
+        Returns:
+            L2-normalized float32 vector.
+        """
+        ...
+
+
+class HashingEmbedder:
+    """Dependency-free embedder hashing words and character trigrams.
+
+    Stopwords are dropped and a trailing plural or possessive 's' is
+    stripped, so rephrasings sharing their content words land close
+    together. It captures lexical overlap only; use a sentence-transformers
+    model to match paraphrases with different vocabulary.
+    """
+
+    def __init__(self, dimension: int = 1024) -> None:
+        """Initialize HashingEmbedder.
+
+        Args:
+            dimension: Number of hash buckets (vector length).
+        """
+        self.dimension = dimension
+
+    def _features(self, text: str) -> list[str]:
+        """Extract word and trigram features from text."""
+        words = [
+            word[:-1] if len(word) > 3 and word.endswith("s") else word
+            for word in _TOKEN.findall(text.lower())
+            if word not in _STOPWORDS
+        ]
+        features = [f"w:{word}" for word in words]
+        for word in words:
+            padded = f" {word} "
+            features.extend(f"t:{padded[i : i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a query.
+
+        Args:
+            text: The query text.
+
+        Returns:
+            L2-normalized float32 vector.
+        """
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature in self._features(text):
+            # Whole words weigh more than the trigrams spelling them
+            vector[zlib.crc32(feature.encode()) % self.dimension] += (
+                2.0 if feature.startswith("w:") else 1.0
+            )
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SentenceTransformerEmbedder:
+    """Embedder running a local sentence-transformers model.
+
+    The model is loaded on first use and run in a worker thread.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+        """Initialize SentenceTransformerEmbedder.
+
+        Args:
+            model_name: Name or path of the sentence-transformers model.
+        """
+        self._model_name = model_name
+        self._model: Any = None
+
+    def _encode(self, text: str) -> np.ndarray:
+        """Load the model if needed and embed text."""
+        if self._model is None:
+            # Only installed with the `semantic-cache-models` extra
+            from sentence_transformers import (  # type: ignore[import-not-found]
+                SentenceTransformer,
+            )
+
+            self._model = SentenceTransformer(self._model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a query.
+
+        Args:
+            text: The query text.
+
+        Returns:
+            L2-normalized float32 vector.
+        """
+        return await asyncio.to_thread(self._encode, text)
+
+
+class VectorIndex(Protocol):
+    """Nearest-neighbour index over unit-length vectors."""
+
+    def add(self, key: int, vector: np.ndarray) -> None:
+        """Add a vector under a key."""
+        ...
+
+    def remove(self, key: int) -> None:
+        """Remove the vector stored under a key."""
+        ...
+
+    def nearest(self, vector: np.ndarray, k: int = 1) -> list[tuple[int, float]]:
+        """Find the most similar vectors.
+
+        Args:
+            vector: The query vector.
+            k: Number of vectors to return at most.
+
+        Returns:
+            Their keys and cosine similarities, most similar first; empty if
+            the index is.
+        """
+        ...
+
+
+class NumpyIndex:
+    """Exact brute-force index, one matrix product per lookup."""
+
+    def __init__(self) -> None:
+        """Initialize NumpyIndex."""
+        self._vectors: dict[int, np.ndarray] = {}
+        self._keys: list[int] = []
+        self._matrix: np.ndarray | None = None
+
+    def add(self, key: int, vector: np.ndarray) -> None:
+        """Add a vector under a key."""
+        self._vectors[key] = vector
+        self._matrix = None
+
+    def remove(self, key: int) -> None:
+        """Remove the vector stored under a key."""
+        if self._vectors.pop(key, None) is not None:
+            self._matrix = None
+
+    def nearest(self, vector: np.ndarray, k: int = 1) -> list[tuple[int, float]]:
+        """Find the most similar vectors.
+
+        Args:
+            vector: The query vector.
+            k: Number of vectors to return at most.
+
+        Returns:
+            Their keys and cosine similarities, most similar first; empty if
+            the index is.
+        """
+        if not self._vectors:
+            return []
+        if self._matrix is None:
+            # Rebuilt lazily so bursts of inserts cost a single stack
+            self._keys = list(self._vectors)
+            self._matrix = np.stack([self._vectors[key] for key in self._keys])
+        scores = self._matrix @ vector
+        best = np.argsort(-scores)[:k]
+        return [(self._keys[i], float(scores[i])) for i in best]
+
+
+class HnswIndex:
+    """Approximate HNSW index (hnswlib), for partitions too large to scan.
+
+    The graph is built on the first insert, sized from that vector, and
+    slots of removed vectors are reused by later inserts.
+    """
+
+    def __init__(self, capacity: int = 1024, ef: int = 64, m: int = 16) -> None:
+        """Initialize HnswIndex.
+
+        Args:
+            capacity: Initial number of vectors the index can hold; it grows
+                as needed.
+            ef: Search breadth, trading speed for recall.
+            m: Graph connectivity, trading memory for recall.
+        """
+        self._capacity = capacity
+        self._ef = ef
+        self._m = m
+        self._index: Any = None
+        self._size = 0
+
+    def add(self, key: int, vector: np.ndarray) -> None:
+        """Add a vector under a key."""
+        if self._index is None:
+            import hnswlib
+
+            self._index = hnswlib.Index(space="cosine", dim=len(vector))
+            self._index.init_index(
+                max_elements=self._capacity,
+                ef_construction=max(self._ef, 100),
+                M=self._m,
+                allow_replace_deleted=True,
+            )
+            self._index.set_ef(self._ef)
+        if self._size >= self._index.get_max_elements():
+            self._index.resize_index(self._index.get_max_elements() * 2)
+        self._index.add_items(vector[np.newaxis], np.array([key]), replace_deleted=True)
+        self._size += 1
+
+    def remove(self, key: int) -> None:
+        """Remove the vector stored under a key."""
+        if self._index is None:
+            return
+        try:
+            self._index.mark_deleted(key)
+        except RuntimeError:
+            return
+        self._size -= 1
+
+    def nearest(self, vector: np.ndarray, k: int = 1) -> list[tuple[int, float]]:
+        """Find the most similar vectors.
+
+        Args:
+            vector: The query vector.
+            k: Number of vectors to return at most.
+
+        Returns:
+            Their keys and cosine similarities, most similar first; empty if
+            the index is.
+        """
+        if self._size == 0:
+            return []
+        keys, distances = self._index.knn_query(vector[np.newaxis], k=min(k, self._size))
+        return [
+            (int(key), 1.0 - float(distance))
+            for key, distance in zip(keys[0], distances[0], strict=True)
+        ]
+
+
+@dataclass(frozen=True)
+class SemanticCacheStats:
+    """Snapshot of semantic cache activity.
+
+    Attributes:
+        hits: Lookups answered from a similar past query.
+        misses: Lookups that went to the wrapped port.
+        hit_rate: Share of lookups that hit.
+        entries: Results currently cached.
+        evictions: Results dropped to respect the size limit.
+        mean_hit_similarity: Mean similarity of the matches that hit.
+        similarity_histogram: Lookups by best similarity found, in ten
+            buckets of 0.1 from [0, 0.1) to [0.9, 1.0].
+    """
+
+    hits: int
+    misses: int
+    hit_rate: float
+    entries: int
+    evictions: int
+    mean_hit_similarity: float
+    similarity_histogram: tuple[int, ...]
+
+
+@dataclass
+class _Entry:
+    """A cached result and where it is indexed.
+
+    Attributes:
+        partition: Partition whose index holds the entry's vector.
+        result: The cached search result.
+        expires_at: When the entry stops being served.
+    """
+
+    partition: Partition
+    result: SearchResult
+    expires_at: float
+
+
+class SemanticCachingSearchAdapter(SearchPort):
+    """SearchPort decorator answering searches similar to past ones.
+
+    Queries are embedded and compared with past queries of the same
+    partition (focus mode, chat and embedding models, optimization mode,
+    system instructions and source limits); the stored result of the most similar one is
+    returned when the cosine similarity reaches `threshold`. Searches with
+    history are never matched, since the conversation changes what the
+    query means. Entries expire after `ttl` seconds and the least recently
+    used are evicted beyond `max_entries`. Expired entries are skipped by
+    lookups and purged every `purge_interval` seconds.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _embedder: Turns queries into vectors.
+        _index_factory: Creates the vector index of a new partition.
+        _indexes: Vector index of each partition.
+        _entries: Cached results by id, least recently used first.
+    """
+
+    def __init__(
+        self,
+        inner: SearchPort,
+        embedder: Embedder,
+        threshold: float = 0.85,
+        ttl: float = 3600.0,
+        max_entries: int = 1000,
+        index_factory: Callable[[], VectorIndex] = NumpyIndex,
+        candidates: int = 4,
+        purge_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize SemanticCachingSearchAdapter.
+
+        Args:
+            inner: The search port to cache results from.
+            embedder: Turns queries into vectors.
+            threshold: Minimum cosine similarity for a cached result to be served.
+            ttl: Seconds a cached result stays valid.
+            max_entries: Maximum number of cached results.
+            index_factory: Creates the vector index of a new partition.
+            candidates: Most similar entries a lookup considers, so that an
+                expired nearest entry does not hide a live one behind it.
+            purge_interval: Seconds between purges of expired entries.
+            clock: Time source, in seconds.
+        """
+        self._inner = inner
+        self._embedder = embedder
+        self._threshold = threshold
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._index_factory = index_factory
+        self._candidates = candidates
+        self._purge_interval = purge_interval
+        self._clock = clock
+        self._next_purge = clock() + purge_interval
+        self._indexes: dict[Partition, VectorIndex] = {}
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_id = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._hit_similarity = 0.0
+        self._histogram = [0] * 10
+
+    @property
+    def stats(self) -> SemanticCacheStats:
+        """Current hit rate, size and similarity distribution."""
+        lookups = self._hits + self._misses
+        return SemanticCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            hit_rate=self._hits / lookups if lookups else 0.0,
+            entries=len(self._entries),
+            evictions=self._evictions,
+            mean_hit_similarity=self._hit_similarity / self._hits if self._hits else 0.0,
+            similarity_histogram=tuple(self._histogram),
+        )
+
+    @staticmethod
+    def _partition(request: SearchRequest) -> Partition:
+        """Partition whose results may answer a request."""
+        return (
+            request.focus_mode.value,
+            f"{request.chat_model.provider_id}/{request.chat_model.key}",
+            f"{request.embedding_model.provider_id}/{request.embedding_model.key}",
+            request.optimization_mode.value,
+            request.system_instructions,
+            request.source_limits,
+        )
+
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry and its vector."""
+        entry = self._entries.pop(entry_id)
+        self._indexes[entry.partition].remove(entry_id)
+
+    def _purge(self, now: float) -> None:
+        """Drop every expired entry, at most once per purge interval."""
+        if now < self._next_purge:
+            return
+        self._next_purge = now + self._purge_interval
+        for entry_id, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                self._remove(entry_id)
+
+    async def _lookup(
+        self, request: SearchRequest
+    ) -> tuple[np.ndarray | None, SearchResult | None]:
+        """Find a cached result for a similar query.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            The query vector (None if the request is not cacheable) and the
+            cached result, if any.
+        """
+        if request.history:
+            return None, None
+
+        vector = await self._embedder.embed(request.query)
+        now = self._clock()
+        self._purge(now)
+        index = self._indexes.get(self._partition(request))
+        match: tuple[int, float] | None = None
+        for candidate in index.nearest(vector, self._candidates) if index is not None else []:
+            if self._entries[candidate[0]].expires_at > now:
+                match = candidate
+                break
+            self._remove(candidate[0])
+
+        similarity = match[1] if match is not None else 0.0
+        self._histogram[min(9, max(0, int(similarity * 10)))] += 1
+        if request.bypass_cache or match is None or similarity < self._threshold:
+            self._misses += 1
+            return vector, None
+
+        self._hits += 1
+        self._hit_similarity += similarity
+        self._entries.move_to_end(match[0])
+        return vector, self._entries[match[0]].result
+
+    def _store(self, request: SearchRequest, vector: np.ndarray, result: SearchResult) -> None:
+        """Cache a result under its query vector.
+
+        Args:
+            request: The search request that produced the result.
+            vector: The query vector.
+            result: The result to cache.
+        """
+        partition = self._partition(request)
+        index = self._indexes.setdefault(partition, self._index_factory())
+        for key, similarity in index.nearest(vector):
+            if similarity >= self._threshold:
+                # Refresh rather than keep two answers to the same question
+                self._remove(key)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        index.add(entry_id, vector)
+        self._entries[entry_id] = _Entry(
+            partition=partition, result=result, expires_at=self._clock() + self._ttl
+        )
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Return the result of a similar past search, or search and cache.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult containing the response message and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        vector, cached = await self._lookup(request)
+        if cached is not None:
+            return cached
+
+        result = await self._inner.search(request)
+        if vector is not None:
+            self._store(request, vector, result)
+        return result
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search, replaying a similar cached result as a single chunk.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        vector, cached = await self._lookup(request)
+        if cached is not None:
+            yield SearchChunk(message=cached.message, sources=cached.sources)
+            return
+
+        message_parts: list[str] = []
+        sources: tuple[Source, ...] = ()
+        async for chunk in self._inner.search_stream(request):
+            message_parts.append(chunk.message)
+            sources = chunk.sources or sources
+            yield chunk
+
+        if vector is not None:
+            result = SearchResult(message="".join(message_parts), sources=sources)
+            self._store(request, vector, result)
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
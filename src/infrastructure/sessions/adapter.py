@@ -0,0 +1,156 @@
+"""Sessions adapter - In-memory implementation of SessionStorePort."""
+
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from domain.entities import HistoryEntry
+from domain.ports import SessionStorePort
+
+
+@dataclass
+class SessionStats:
+    """Counters describing the session store.
+
+    Attributes:
+        sessions: Sessions currently stored.
+        evictions: Sessions dropped because they expired or exceeded limits.
+        trimmed_entries: History entries dropped to stay within max_chars.
+    """
+
+    sessions: int = 0
+    evictions: int = 0
+    trimmed_entries: int = 0
+
+
+@dataclass
+class _Session:
+    """History of one session.
+
+    Attributes:
+        entries: History entries, oldest first.
+        chars: Total content length of the entries.
+        touched_at: Time of the last read or write.
+    """
+
+    entries: deque[HistoryEntry] = field(default_factory=deque)
+    chars: int = 0
+    touched_at: float = 0.0
+
+
+class MemorySessionStore(SessionStorePort):
+    """In-process session store bounded by idle TTL, session count and size.
+
+    Sessions are kept in least recently used order: idle ones expire after
+    `ttl`, the least recently used is dropped past `max_sessions`, and the
+    oldest turns of a session are dropped once its content exceeds
+    `max_chars`, which bounds memory to about max_sessions * max_chars.
+
+    Attributes:
+        _ttl: Seconds a session stays alive without being used.
+        _max_sessions: Maximum number of stored sessions.
+        _max_chars: Maximum total content length of one session's history.
+        _clock: Time source, in seconds.
+        _sessions: Sessions in least recently used order.
+        _evictions: Sessions dropped because they expired or exceeded limits.
+        _trimmed_entries: History entries dropped to stay within max_chars.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_sessions: int,
+        max_chars: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize MemorySessionStore.
+
+        Args:
+            ttl: Seconds a session stays alive without being used.
+            max_sessions: Maximum number of stored sessions.
+            max_chars: Maximum total content length of one session's history.
+            clock: Time source, in seconds.
+        """
+        self._ttl = ttl
+        self._max_sessions = max_sessions
+        self._max_chars = max_chars
+        self._clock = clock
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._evictions = 0
+        self._trimmed_entries = 0
+
+    @property
+    def stats(self) -> SessionStats:
+        """Current session count and eviction counters."""
+        return SessionStats(
+            sessions=len(self._sessions),
+            evictions=self._evictions,
+            trimmed_entries=self._trimmed_entries,
+        )
+
+    def _touch(self, session_id: str, now: float) -> _Session | None:
+        """Drop expired sessions and mark a session as used.
+
+        Args:
+            session_id: The session to mark.
+            now: The current time.
+
+        Returns:
+            The live session, or None if it does not exist.
+        """
+        # Sessions are ordered by last use, so expired ones are at the front
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest.touched_at < self._ttl:
+                break
+            self._sessions.popitem(last=False)
+            self._evictions += 1
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.touched_at = now
+            self._sessions.move_to_end(session_id)
+        return session
+
+    async def get_history(self, session_id: str) -> tuple[HistoryEntry, ...]:
+        """Return the stored history of a session, oldest entry first.
+
+        Args:
+            session_id: The session id chosen by the client, scoped to that client.
+
+        Returns:
+            The session history; empty for unknown or expired sessions.
+        """
+        session = self._touch(session_id, self._clock())
+        return tuple(session.entries) if session is not None else ()
+
+    async def append(self, session_id: str, entries: Sequence[HistoryEntry]) -> None:
+        """Add entries to a session, trimming its oldest turns over max_chars.
+
+        Trimming drops whole turns: the answers following a dropped human
+        entry go with it, so the history never opens with an orphaned answer.
+
+        Args:
+            session_id: The session id chosen by the client, scoped to that client.
+            entries: The entries to add, oldest first.
+        """
+        now = self._clock()
+        session = self._touch(session_id, now)
+        if session is None:
+            session = self._sessions[session_id] = _Session(touched_at=now)
+
+        session.entries.extend(entries)
+        session.chars += sum(len(entry.content) for entry in entries)
+        trimmed = False
+        while session.entries and (
+            session.chars > self._max_chars
+            or (trimmed and session.entries[0].role != "human")
+        ):
+            session.chars -= len(session.entries.popleft().content)
+            self._trimmed_entries += 1
+            trimmed = True
+
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+            self._evictions += 1
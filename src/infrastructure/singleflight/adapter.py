@@ -0,0 +1,117 @@
+"""Single-flight adapter - Coalesces concurrent identical searches."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+
+from domain.entities import SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchPort
+
+
+@dataclass
+class _InFlight:
+    """A shared upstream search and the number of callers awaiting it.
+
+    Attributes:
+        task: The upstream search shared by every waiter.
+        waiters: Number of callers currently awaiting the task.
+    """
+
+    task: asyncio.Task[SearchResult]
+    waiters: int = 0
+
+
+class SingleFlightSearchAdapter(SearchPort):
+    """SearchPort decorator sharing one upstream call between equal requests.
+
+    Concurrent searches with an equal SearchRequest await the same upstream
+    call and all receive its SearchResult (or its SearchError). Cancelling
+    one caller leaves the shared call running for the others; it is only
+    cancelled once every caller has gone.
+
+    Streaming searches are passed through, since each caller consumes its
+    own chunk sequence.
+
+    Requests differing only in their deadline are coalesced. The shared call
+    runs without a deadline; each caller enforces its own while waiting,
+    and the call is cancelled once every caller has given up.
+
+    Attributes:
+        _inner: The wrapped search port.
+        _in_flight: Upstream calls currently running, by request.
+    """
+
+    def __init__(self, inner: SearchPort) -> None:
+        """Initialize SingleFlightSearchAdapter.
+
+        Args:
+            inner: The search port to deduplicate calls to.
+        """
+        self._inner = inner
+        self._in_flight: dict[SearchRequest, _InFlight] = {}
+
+    def _start(self, request: SearchRequest) -> _InFlight:
+        """Start a shared upstream call for a request.
+
+        Args:
+            request: The search request.
+
+        Returns:
+            The in-flight call, removed from the table once it finishes.
+        """
+        shared = replace(request, deadline=None)
+        call = _InFlight(task=asyncio.create_task(self._inner.search(shared)))
+        self._in_flight[request] = call
+
+        def forget(_: asyncio.Task[SearchResult]) -> None:
+            if self._in_flight.get(request) is call:
+                del self._in_flight[request]
+
+        call.task.add_done_callback(forget)
+        return call
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Join the in-flight call for an equal request, or start one.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Returns:
+            SearchResult shared by every concurrent caller.
+
+        Raises:
+            SearchError: If the shared search fails.
+        """
+        call = self._in_flight.get(request) or self._start(request)
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1:
+                # Forget the call first, so that a caller arriving before the
+                # task has finished cancelling starts a fresh one
+                if self._in_flight.get(request) is call:
+                    del self._in_flight[request]
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+        """Stream a search from the wrapped port without coalescing.
+
+        Args:
+            request: The search request containing query and configuration.
+
+        Yields:
+            SearchChunk objects carrying message text and sources.
+
+        Raises:
+            SearchError: If the wrapped search fails.
+        """
+        async for chunk in self._inner.search_stream(request):
+            yield chunk
+
+    async def close(self) -> None:
+        """Close the wrapped port."""
+        await self._inner.close()
@@ -0,0 +1,143 @@
+"""Tracing adapter - OpenTelemetry implementation of TracerPort.
+
+Requires the optional `tracing` extra (opentelemetry-api and -sdk, plus
+opentelemetry-exporter-otlp-proto-http for the OTLP exporter).
+"""
+
+import asyncio
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Literal
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+
+from domain.ports import AttributeValue, SpanPort, TracerPort
+
+
+class OpenTelemetrySpan(SpanPort):
+    """SpanPort wrapping an OpenTelemetry span.
+
+    Attributes:
+        _span: The wrapped OpenTelemetry span.
+    """
+
+    def __init__(self, span: trace.Span) -> None:
+        """Initialize OpenTelemetrySpan.
+
+        Args:
+            span: The OpenTelemetry span to wrap.
+        """
+        self._span = span
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Attach an attribute to the span.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+        self._span.set_attribute(key, value)
+
+    def add_event(self, name: str) -> None:
+        """Record a timestamped event on the span.
+
+        Args:
+            name: Event name.
+        """
+        self._span.add_event(name)
+
+
+class OpenTelemetryTracer(TracerPort):
+    """TracerPort creating OpenTelemetry spans and W3C trace-context headers.
+
+    Attributes:
+        _tracer: OpenTelemetry tracer spans are created from.
+        _provider: Provider given at construction, shut down by close().
+    """
+
+    def __init__(self, tracer_provider: trace.TracerProvider | None = None) -> None:
+        """Initialize OpenTelemetryTracer.
+
+        Args:
+            tracer_provider: Provider to create spans with. Defaults to the
+                globally configured one.
+        """
+        self._tracer = trace.get_tracer("mcp-perplexica", tracer_provider=tracer_provider)
+        self._provider = tracer_provider
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> Iterator[SpanPort]:
+        """Open a span as a child of the current one.
+
+        Args:
+            name: Span name.
+            attributes: Initial span attributes.
+
+        Yields:
+            The open span; errors raised inside it are recorded on the span.
+        """
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield OpenTelemetrySpan(span)
+
+    def inject(self, headers: dict[str, str]) -> None:
+        """Add the current W3C trace context to outgoing request headers.
+
+        Args:
+            headers: Headers to update in place.
+        """
+        propagate.inject(headers)
+
+    async def close(self) -> None:
+        """Export pending spans and shut down the provider given at construction.
+
+        Shutting down flushes the batch span processor, which may block on
+        the exporter, so it runs in a worker thread.
+        """
+        if isinstance(self._provider, TracerProvider):
+            await asyncio.to_thread(self._provider.shutdown)
+
+
+def configure_tracing(
+    service_name: str,
+    exporter: Literal["otlp", "console"] = "otlp",
+    endpoint: str | None = None,
+    sample_ratio: float = 1.0,
+) -> TracerProvider:
+    """Install a global tracer provider exporting spans in batches.
+
+    Args:
+        service_name: Service name reported with every span.
+        exporter: Where spans are sent: an OTLP/HTTP collector or stdout.
+        endpoint: OTLP traces endpoint. Defaults to the standard
+            OTEL_EXPORTER_OTLP_* environment variables.
+        sample_ratio: Share of new traces recorded; continued traces follow
+            their parent's decision.
+
+    Returns:
+        The installed tracer provider.
+    """
+    span_exporter: SpanExporter
+    if exporter == "console":
+        span_exporter = ConsoleSpanExporter()
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        span_exporter = OTLPSpanExporter(endpoint=endpoint)
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBasedTraceIdRatio(sample_ratio),
+    )
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    return provider
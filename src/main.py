@@ -1,12 +1,196 @@
-"""MCP server main entry point."""
+"""MCP server main entry point.
 
-from config import Settings
-from dependencies import mcp
+Usage:
+    python main.py
+    python main.py --profile-startup
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.applications import Starlette
 
 # Import api module to register MCP tools via decorators
 import application.api  # noqa: F401
+from dependencies import app_lifespan, mcp, settings
+
+
+def create_app() -> Starlette:
+    """Build the ASGI application served by one HTTP server process.
+
+    The process holds the shared Perplexica adapters open for its whole
+    life, rather than per MCP session, so it keeps one warm connection
+    pool. On shutdown the MCP transport stops first, then the search port
+    is drained and closed.
+
+    Returns:
+        The Starlette app for the configured HTTP transport.
+    """
+    app = mcp.sse_app() if settings.transport == "sse" else mcp.streamable_http_app()
+    transport_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def process_lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with app_lifespan(), transport_lifespan(app):
+            yield
+
+    app.router.lifespan_context = process_lifespan
+    return app
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """Time spent importing one module while the server starts.
+
+    Attributes:
+        module: Fully qualified module name.
+        self_time: Seconds spent in the module itself.
+        cumulative: Seconds spent in the module and the imports it triggered.
+    """
+
+    module: str
+    self_time: float
+    cumulative: float
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the report written to stderr by `python -X importtime`.
+
+    Args:
+        output: The interpreter's stderr.
+
+    Returns:
+        One entry per imported module, in import order.
+    """
+    times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        times.append(
+            ImportTime(
+                module=module.strip(),
+                self_time=int(self_us) / 1e6,
+                cumulative=int(cumulative_us) / 1e6,
+            )
+        )
+    return times
+
+
+def profile_startup(top: int = 25) -> str:
+    """Measure the cold start of the server in a fresh interpreter.
+
+    Imports this module, with the configuration and MCP tools it loads, in
+    a child process run with `-X importtime`, so nothing already imported
+    by the current process hides the cost.
+
+    Args:
+        top: Number of modules to list, slowest cumulative import first.
+
+    Returns:
+        A report of the total start time and the slowest imports.
+    """
+    start = time.perf_counter()
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    times = sorted(parse_import_times(child.stderr), key=lambda t: t.cumulative, reverse=True)
+    lines = [
+        f"cold start: {elapsed * 1000:.0f} ms wall, {len(times)} modules imported",
+        f"{'cumulative':>12} {'self':>10}  module",
+    ]
+    lines += [
+        f"{t.cumulative * 1000:9.1f} ms {t.self_time * 1000:7.1f} ms  {t.module}"
+        for t in times[:top]
+    ]
+    return "\n".join(lines)
+
+
+def _per_process_features() -> list[str]:
+    """List the enabled features whose state a single worker process holds.
+
+    Returns:
+        The settings enabling them, in the order they are documented.
+    """
+    features = {
+        "SESSIONS_ENABLED": settings.sessions_enabled,
+        "METRICS_ENABLED": settings.metrics_enabled,
+        "RATE_LIMIT_ENABLED": settings.rate_limit_enabled,
+        "ADMISSION_ENABLED": settings.admission_enabled,
+    }
+    return [name for name, enabled in features.items() if enabled]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the MCP server with the configured transport.
+
+    The sse and streamable-http transports are served by uvicorn, through
+    create_app. With WORKERS above 1, streamable-http is served by that
+    many worker processes sharing the listening socket. Searches are then
+    stateless: any worker can answer any request, so features whose state
+    must cover every request are refused. The MCP sessions of the sse
+    transport and server-side conversation sessions would need every
+    request of a session to reach the same process; metrics, rate limits
+    and admission limits would each only see one worker's share.
+
+    Args:
+        argv: Command line arguments, defaulting to sys.argv.
+
+    Raises:
+        SystemExit: If several workers are requested with a configuration
+            that keeps its state in one process.
+    """
+    parser = argparse.ArgumentParser(description="MCP server for the Perplexica search API")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report the time spent importing each module at startup, then exit",
+    )
+    args = parser.parse_args(argv)
+    if args.profile_startup:
+        print(profile_startup())
+        return
+
+    if settings.transport == "stdio":
+        mcp.run(transport="stdio")
+        return
+
+    if settings.workers > 1 and settings.transport == "sse":
+        raise SystemExit(
+            "WORKERS > 1 requires TRANSPORT=streamable-http: sse sessions live in one process"
+        )
+    if settings.workers > 1 and (per_process := _per_process_features()):
+        raise SystemExit(
+            f"WORKERS > 1 cannot be combined with {', '.join(per_process)}: "
+            "their state lives in one process"
+        )
+
+    import uvicorn
+
+    uvicorn.run(
+        "main:create_app",
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        timeout_graceful_shutdown=settings.shutdown_timeout,
+        log_level=mcp.settings.log_level.lower(),
+    )
 
-settings = Settings()
 
 if __name__ == "__main__":
-    mcp.run(transport=settings.transport)
\ No newline at end of file
+    main()
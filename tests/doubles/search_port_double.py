@@ -1,5 +1,7 @@
 """Test doubles for testing."""
 
+import asyncio
+
 from domain.entities import SearchRequest, SearchResult, Source
 from domain.ports import SearchError, SearchPort
 
@@ -14,18 +16,22 @@ class SearchPortDouble(SearchPort):
         calls: List of SearchRequest objects received.
         response: The canned response to return.
         error: Optional error to raise instead of returning response.
+        errors: Errors raised by successive calls before falling back to error.
+        gate: Optional event that search() waits on before answering.
     """
 
     def __init__(
         self,
         response: SearchResult | None = None,
         error: SearchError | None = None,
+        gate: asyncio.Event | None = None,
     ) -> None:
         """Initialize SearchPortDouble.
 
         Args:
             response: The canned response to return from search().
             error: Optional error to raise from search().
+            gate: Optional event that search() waits on before answering.
         """
         self.calls: list[SearchRequest] = []
         self.response = response or SearchResult(
@@ -39,6 +45,8 @@ class SearchPortDouble(SearchPort):
             ),
         )
         self.error = error
+        self.errors: list[SearchError] = []
+        self.gate = gate
 
     async def search(self, request: SearchRequest) -> SearchResult:
         """Record the call and return canned response.
@@ -54,11 +62,22 @@ class SearchPortDouble(SearchPort):
         """
         self.calls.append(request)
 
+        if self.gate:
+            await self.gate.wait()
+
+        if self.errors:
+            raise self.errors.pop(0)
+
         if self.error:
             raise self.error
 
         return self.response
 
+    def release(self) -> None:
+        """Let the searches waiting on the gate answer."""
+        assert self.gate is not None, "release() needs a gate"
+        self.gate.set()
+
     def assert_called_once(self) -> None:
         """Assert that search was called exactly once."""
         assert len(self.calls) == 1, f"Expected 1 call, got {len(self.calls)}"
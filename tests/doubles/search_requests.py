@@ -0,0 +1,48 @@
+"""Factories of search requests and errors for testing."""
+
+import httpx
+
+from domain.entities import ChatModel, EmbeddingModel, SearchRequest
+from domain.ports import SearchError
+
+
+def make_request(
+    query: str = "test query", client_id: str | None = None, stream: bool = False
+) -> SearchRequest:
+    """Create a minimal domain search request.
+
+    Args:
+        query: The search query.
+        client_id: The client sending the search, if known.
+        stream: Whether the search is streamed.
+
+    Returns:
+        The search request.
+    """
+    return SearchRequest(
+        query=query,
+        chat_model=ChatModel(provider_id="p1", key="m1"),
+        embedding_model=EmbeddingModel(provider_id="p2", key="m2"),
+        client_id=client_id,
+        stream=stream,
+    )
+
+
+def status_error(status_code: int, headers: dict[str, str] | None = None) -> SearchError:
+    """Create a SearchError caused by an HTTP error status.
+
+    Args:
+        status_code: The response status.
+        headers: The response headers.
+
+    Returns:
+        The search error, with the HTTPStatusError as its cause.
+    """
+    request = httpx.Request("POST", "http://perplexica/api/search")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    cause = httpx.HTTPStatusError("error", request=request, response=response)
+    return SearchError(
+        message=f"Perplexica API returned error: {status_code}",
+        cause=cause,
+        status_code=status_code,
+    )
@@ -0,0 +1,179 @@
+"""Unit tests for the admission-control search adapter."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from domain.entities import OptimizationMode
+from domain.ports import SearchUnavailableError
+from infrastructure.admission.adapter import AdmissionLimits, AdmissionSearchAdapter
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request
+
+
+async def admission_order(
+    *queued: tuple[str, str], client_weights: dict[str, float] | None = None
+) -> list[str]:
+    """Queue searches behind a running one and return the order they run in.
+
+    Args:
+        queued: Query and client of each search to queue, in arrival order.
+        client_weights: Share of the queued slots given to each client.
+
+    Returns:
+        Queries of the queued searches, in the order they were sent upstream.
+    """
+    search_port_double = SearchPortDouble(gate=asyncio.Event())
+    limits = {
+        mode: AdmissionLimits(max_in_flight=1, max_queue=10, max_queue_time=5.0)
+        for mode in OptimizationMode
+    }
+    adapter = AdmissionSearchAdapter(
+        inner=search_port_double, limits=limits, client_weights=client_weights
+    )
+    running = asyncio.create_task(adapter.search(make_request("running")))
+    await asyncio.sleep(0)
+    tasks = []
+    for query, client_id in queued:
+        tasks.append(asyncio.create_task(adapter.search(make_request(query, client_id))))
+        await asyncio.sleep(0)
+
+    search_port_double.release()
+    await asyncio.gather(running, *tasks)
+    return [call.query for call in search_port_double.calls[1:]]
+
+
+class TestAdmissionSearchAdapter:
+    """Tests for AdmissionSearchAdapter."""
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double that blocks until released."""
+        return SearchPortDouble(gate=asyncio.Event())
+
+    @pytest.fixture
+    def adapter(self, search_port_double: SearchPortDouble) -> AdmissionSearchAdapter:
+        """Create an adapter allowing one balanced search plus one queued."""
+        limits = {
+            mode: AdmissionLimits(max_in_flight=1, max_queue=1, max_queue_time=5.0)
+            for mode in OptimizationMode
+        }
+        return AdmissionSearchAdapter(inner=search_port_double, limits=limits)
+
+    async def test_queued_search_runs_when_slot_frees(
+        self, adapter: AdmissionSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should hold searches over the limit until a slot is released."""
+        first = asyncio.create_task(adapter.search(make_request("a")))
+        second = asyncio.create_task(adapter.search(make_request("b")))
+        await asyncio.sleep(0)
+
+        stats = adapter.stats[OptimizationMode.BALANCED]
+        assert (stats.in_flight, stats.queue_depth) == (1, 1)
+        assert len(search_port_double.calls) == 1
+
+        search_port_double.release()
+        await asyncio.gather(first, second)
+
+        stats = adapter.stats[OptimizationMode.BALANCED]
+        assert (stats.in_flight, stats.queue_depth, stats.admitted) == (0, 0, 2)
+
+    async def test_rejects_when_queue_is_full(
+        self, adapter: AdmissionSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should fail fast once the wait queue is full."""
+        tasks = [asyncio.create_task(adapter.search(make_request())) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(SearchUnavailableError, match="saturated"):
+            await adapter.search(make_request())
+
+        search_port_double.release()
+        await asyncio.gather(*tasks)
+        assert adapter.stats[OptimizationMode.BALANCED].rejected == 1
+
+    async def test_rejects_after_max_queue_time(self) -> None:
+        """Should reject a queued search that waits too long."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        limits = {
+            mode: AdmissionLimits(max_in_flight=1, max_queue=1, max_queue_time=0.01)
+            for mode in OptimizationMode
+        }
+        adapter = AdmissionSearchAdapter(inner=search_port_double, limits=limits)
+        running = asyncio.create_task(adapter.search(make_request()))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SearchUnavailableError, match="Timed out"):
+            await adapter.search(make_request())
+
+        search_port_double.release()
+        await running
+        assert adapter.stats[OptimizationMode.BALANCED].queue_depth == 0
+
+    async def test_modes_have_independent_limits(
+        self, adapter: AdmissionSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should not let one mode's load block another mode."""
+        balanced = asyncio.create_task(adapter.search(make_request()))
+        speed = asyncio.create_task(
+            adapter.search(replace(make_request(), optimization_mode=OptimizationMode.SPEED))
+        )
+        await asyncio.sleep(0)
+
+        assert len(search_port_double.calls) == 2
+        search_port_double.release()
+        await asyncio.gather(balanced, speed)
+
+
+class TestFairQueuing:
+    """Tests for the weighted fair queue of AdmissionSearchAdapter."""
+
+    async def test_light_client_is_not_starved(self) -> None:
+        """Should serve a light client's search between a heavy client's."""
+        order = await admission_order(
+            ("heavy 1", "heavy"),
+            ("heavy 2", "heavy"),
+            ("heavy 3", "heavy"),
+            ("light 1", "light"),
+        )
+
+        assert order == ["heavy 1", "light 1", "heavy 2", "heavy 3"]
+
+    async def test_clients_are_served_in_proportion_to_weights(self) -> None:
+        """Should serve twice as many searches of a client weighing 2."""
+        order = await admission_order(
+            ("small 1", "small"),
+            ("small 2", "small"),
+            ("big 1", "big"),
+            ("big 2", "big"),
+            ("big 3", "big"),
+            ("big 4", "big"),
+            client_weights={"big": 2.0},
+        )
+
+        assert order == ["big 1", "small 1", "big 2", "big 3", "small 2", "big 4"]
+
+    async def test_rejects_client_over_its_queue_share(self) -> None:
+        """Should refuse a client's search once it has max_queue_per_client waiting."""
+        limits = {
+            mode: AdmissionLimits(
+                max_in_flight=1, max_queue=10, max_queue_time=5.0, max_queue_per_client=1
+            )
+            for mode in OptimizationMode
+        }
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        adapter = AdmissionSearchAdapter(inner=search_port_double, limits=limits)
+        tasks = [
+            asyncio.create_task(adapter.search(make_request("running", "heavy"))),
+            asyncio.create_task(adapter.search(make_request("queued", "heavy"))),
+            asyncio.create_task(adapter.search(make_request("other", "light"))),
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(SearchUnavailableError, match="'heavy' already has 1"):
+            await adapter.search(make_request("rejected", "heavy"))
+
+        assert adapter.stats[OptimizationMode.BALANCED].queued_clients == 2
+        search_port_double.release()
+        await asyncio.gather(*tasks)
@@ -0,0 +1,126 @@
+"""Unit tests for the benchmark harness."""
+
+import pytest
+
+from benchmarks.fake_perplexica import FakePerplexicaConfig, serve
+from benchmarks.micro import codec_scenarios
+from benchmarks.report import (
+    BenchmarkReport,
+    LatencySummary,
+    find_regressions,
+    load_baseline,
+    percentile,
+    save_baseline,
+)
+from domain.ports import SearchError
+from infrastructure.perplexica.adapter import PerplexicaAdapter
+from tests.doubles.search_requests import make_request
+
+
+def make_report(throughput: float = 100.0, p99: float = 0.2, errors: int = 0) -> BenchmarkReport:
+    """Create a report with the given headline numbers."""
+    return BenchmarkReport(
+        name="stdio-c10",
+        transport="stdio",
+        concurrency=10,
+        latency=LatencySummary(
+            requests=100,
+            errors=errors,
+            duration=1.0,
+            throughput=throughput,
+            mean=0.1,
+            p50=0.1,
+            p95=0.15,
+            p99=p99,
+            max=0.3,
+        ),
+    )
+
+
+class TestReport:
+    """Tests for latency summaries and baselines."""
+
+    def test_percentile_interpolates(self) -> None:
+        """Should interpolate between the closest ranks."""
+        samples = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        assert percentile(samples, 50) == 3.0
+        assert percentile(samples, 90) == 4.6
+        assert percentile([], 99) == 0.0
+
+    def test_summary_counts_errors(self) -> None:
+        """Should count errors in requests but not in latencies."""
+        summary = LatencySummary.from_samples([0.1, 0.3], errors=2, duration=2.0)
+
+        assert summary.requests == 4
+        assert summary.error_rate == 0.5
+        assert summary.throughput == 1.0
+        assert summary.max == 0.3
+
+    def test_baseline_round_trip(self, tmp_path) -> None:
+        """Should load the report that was saved."""
+        report = make_report()
+
+        save_baseline(report, tmp_path)
+
+        assert load_baseline(report.name, tmp_path) == report
+        assert load_baseline("missing", tmp_path) is None
+
+    def test_regressions_beyond_tolerance(self) -> None:
+        """Should flag metrics worse than the baseline by more than the tolerance."""
+        baseline = make_report()
+
+        assert find_regressions(make_report(throughput=90.0, p99=0.22), baseline) == []
+        regressions = find_regressions(make_report(throughput=70.0, p99=0.3), baseline)
+        assert len(regressions) == 2
+        assert regressions[0].startswith("throughput")
+        assert regressions[1].startswith("p99")
+
+
+class TestFakePerplexica:
+    """Tests for the fake Perplexica server, driven by the real adapter."""
+
+    async def test_answers_search(self) -> None:
+        """Should answer with a message and the configured number of sources."""
+        config = FakePerplexicaConfig(latency_ms=1, latency_sigma=0, sources=2)
+        async with serve(config) as (handler, url), PerplexicaAdapter(url) as adapter:
+            result = await adapter.search(make_request())
+
+        assert result.message == "Answer to test query."
+        assert len(result.sources) == 2
+        assert handler.requests == 1
+
+    async def test_streams_ndjson(self) -> None:
+        """Should stream sources and every response chunk."""
+        config = FakePerplexicaConfig(latency_ms=1, latency_sigma=0, stream_chunks=3)
+        async with serve(config) as (_, url), PerplexicaAdapter(url) as adapter:
+            chunks = [chunk async for chunk in adapter.search_stream(make_request(stream=True))]
+
+        assert len(chunks[0].sources) == 3
+        assert [chunk.message for chunk in chunks[1:]] == [
+            f"Part {i} of the answer to test query. " for i in range(3)
+        ]
+
+    async def test_injects_errors(self) -> None:
+        """Should fail requests with the configured status."""
+        config = FakePerplexicaConfig(latency_ms=1, latency_sigma=0, error_rate=1.0)
+        async with serve(config) as (_, url), PerplexicaAdapter(url) as adapter:
+            with pytest.raises(SearchError) as exc_info:
+                await adapter.search(make_request())
+
+        assert "503" in exc_info.value.message
+
+
+class TestMicrobenchmarks:
+    """Tests for the hot path microbenchmarks."""
+
+    def test_codec_scenarios_report_cpu_per_call(self) -> None:
+        """Should time every scenario for each installed codec."""
+        results = codec_scenarios(iterations=5, sources=3, message_bytes=200)
+
+        assert {result.name for result in results} >= {
+            "encode request [json]",
+            "parse answer [json]",
+            "adapter.search [json]",
+        }
+        assert all(result.cpu_per_call >= 0 for result in results)
@@ -0,0 +1,326 @@
+"""Unit tests for the caching search adapter."""
+
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from domain.entities import (
+    ChatModel,
+    HistoryEntry,
+    SearchMetadata,
+    SearchResult,
+)
+from domain.ports import SearchError
+from infrastructure.cache.adapter import (
+    CachingSearchAdapter,
+    MemoryCacheStore,
+    SqliteCacheStore,
+    cache_key,
+)
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_ignores_delivery_flags(self) -> None:
+        """Should produce the same key regardless of stream and bypass flags."""
+        request = make_request()
+
+        assert cache_key(request) == cache_key(
+            replace(request, stream=True, bypass_cache=True)
+        )
+
+    def test_ignores_chat_model_fallbacks(self) -> None:
+        """Should share the key of requests that differ only in fallback models."""
+        request = make_request()
+        fallback = ChatModel(provider_id="openai", key="gpt-4o-mini")
+
+        assert cache_key(request) == cache_key(replace(request, chat_model_fallbacks=(fallback,)))
+
+    def test_includes_history_and_instructions(self) -> None:
+        """Should produce different keys for different context."""
+        request = make_request()
+
+        assert cache_key(request) != cache_key(
+            replace(request, history=(HistoryEntry(role="human", content="Hi"),))
+        )
+        assert cache_key(request) != cache_key(
+            replace(request, system_instructions="Be brief")
+        )
+
+
+class TestCachingSearchAdapter:
+    """Tests for CachingSearchAdapter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def adapter(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> CachingSearchAdapter:
+        """Create a caching adapter over an in-memory store."""
+        store = MemoryCacheStore(ttl=60, max_entries=2, max_bytes=10_000, clock=clock)
+        return CachingSearchAdapter(inner=search_port_double, store=store)
+
+    async def test_identical_search_is_served_from_cache(
+        self, adapter: CachingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should call the wrapped port once for identical requests."""
+        first = await adapter.search(make_request())
+        second = await adapter.search(make_request())
+
+        search_port_double.assert_called_once()
+        assert (first.message, first.sources) == (second.message, second.sources)
+        assert (adapter.stats.hits, adapter.stats.misses) == (1, 1)
+
+    async def test_hit_resets_metadata(
+        self, adapter: CachingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should not report how the cached result was originally obtained."""
+        search_port_double.response = SearchResult(
+            message="Paris",
+            metadata=SearchMetadata(
+                attempts=3,
+                hedged=True,
+                chat_model=ChatModel(provider_id="openai", key="gpt-4o-mini"),
+            ),
+        )
+        await adapter.search(make_request())
+
+        cached = await adapter.search(make_request())
+
+        assert cached.message == "Paris"
+        assert cached.metadata == SearchMetadata(attempts=0)
+
+    async def test_bypass_cache_refreshes_entry(
+        self, adapter: CachingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should skip the lookup when bypass_cache is set."""
+        await adapter.search(make_request())
+        await adapter.search(replace(make_request(), bypass_cache=True))
+
+        assert len(search_port_double.calls) == 2
+
+    async def test_expired_entries_are_evicted(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should search again once the TTL has passed."""
+        await adapter.search(make_request())
+        clock.now = 61
+        await adapter.search(make_request())
+
+        assert len(search_port_double.calls) == 2
+        assert adapter.stats.evictions == 1
+
+    async def test_least_recently_used_entry_is_evicted(
+        self, adapter: CachingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should drop the least recently used entry past max_entries."""
+        await adapter.search(make_request("a"))
+        await adapter.search(make_request("b"))
+        await adapter.search(make_request("a"))
+        await adapter.search(make_request("c"))
+        await adapter.search(make_request("a"))
+
+        assert [call.query for call in search_port_double.calls] == ["a", "b", "c"]
+        assert adapter.stats.evictions == 1
+
+    async def test_stream_is_cached(
+        self, adapter: CachingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should cache a streamed result and replay it."""
+        [chunk async for chunk in adapter.search_stream(make_request())]
+        chunks = [chunk async for chunk in adapter.search_stream(make_request())]
+
+        search_port_double.assert_called_once()
+        assert chunks[0].message == "Test response"
+
+
+class TestStaleWhileRevalidate:
+    """Tests for CachingSearchAdapter background revalidation."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def adapter(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> CachingSearchAdapter:
+        """Create a caching adapter going stale after 10 of its 60 seconds."""
+        store = MemoryCacheStore(ttl=60, max_entries=10, max_bytes=10_000, clock=clock)
+        return CachingSearchAdapter(
+            inner=search_port_double,
+            store=store,
+            stale_after=10,
+            refresh_ahead=0.8,
+            refresh_ahead_hits=3,
+            max_refreshes=1,
+        )
+
+    async def settle(self) -> None:
+        """Let background refreshes run to completion."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_stale_entry_is_served_and_refreshed(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should answer from the stale entry and replace it in the background."""
+        old = await adapter.search(make_request())
+        search_port_double.response = SearchResult(message="Fresh")
+        clock.now = 15
+
+        assert (await adapter.search(make_request())).message == old.message
+        await self.settle()
+
+        assert (await adapter.search(make_request())).message == "Fresh"
+        assert len(search_port_double.calls) == 2
+        assert search_port_double.calls[1].bypass_cache
+        assert (adapter.stats.stale_hits, adapter.stats.refreshes) == (1, 1)
+
+    async def test_concurrent_stale_hits_refresh_once(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should start a single refresh per key."""
+        await adapter.search(make_request())
+        search_port_double.gate = asyncio.Event()
+        clock.now = 15
+
+        await asyncio.gather(*(adapter.search(make_request()) for _ in range(3)))
+        await self.settle()
+
+        assert len(search_port_double.calls) == 2
+        assert adapter.stats.refreshes_skipped == 0
+        await adapter.close()
+
+    async def test_hot_entry_is_refreshed_ahead(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should refresh a frequently hit entry before it goes stale."""
+        await adapter.search(make_request("hot"))
+        await adapter.search(make_request("cold"))
+        await adapter.search(make_request("hot"))
+        await adapter.search(make_request("hot"))
+        clock.now = 9
+
+        await adapter.search(make_request("hot"))
+        await adapter.search(make_request("cold"))
+        await self.settle()
+
+        assert [call.query for call in search_port_double.calls] == ["hot", "cold", "hot"]
+        assert (adapter.stats.stale_hits, adapter.stats.refreshes) == (0, 1)
+
+    async def test_refreshes_are_bounded(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should skip refreshes beyond max_refreshes instead of queuing them."""
+        await adapter.search(make_request("a"))
+        await adapter.search(make_request("b"))
+        search_port_double.gate = asyncio.Event()
+        clock.now = 15
+
+        await adapter.search(make_request("a"))
+        await adapter.search(make_request("b"))
+        await self.settle()
+
+        assert len(search_port_double.calls) == 3
+        assert adapter.stats.refreshes_skipped == 1
+        await adapter.close()
+
+    async def test_failed_refresh_keeps_stale_entry(
+        self,
+        adapter: CachingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should keep serving the stale entry when revalidation fails."""
+        old = await adapter.search(make_request())
+        search_port_double.error = SearchError(message="down")
+        clock.now = 15
+
+        await adapter.search(make_request())
+        await self.settle()
+
+        assert (await adapter.search(make_request())).message == old.message
+        await self.settle()
+        assert adapter.stats.refresh_failures == 2
+
+
+class TestSqliteCacheStore:
+    """Tests for SqliteCacheStore."""
+
+    async def test_entries_survive_reopening(self, tmp_path: Path) -> None:
+        """Should serve entries written by a previous store instance."""
+        path = str(tmp_path / "cache.db")
+        result = SearchResult(message="Paris")
+        first = SqliteCacheStore(path=path, ttl=60, max_entries=10, max_bytes=10_000)
+        await first.put("key", result)
+        await first.close()
+
+        second = SqliteCacheStore(path=path, ttl=60, max_entries=10, max_bytes=10_000)
+
+        entry = await second.get("key")
+        assert entry is not None
+        assert entry.result == result
+        await second.close()
+
+    async def test_evicts_over_byte_limit(self, tmp_path: Path) -> None:
+        """Should evict the least recently used entry past max_bytes."""
+        clock = FakeClock()
+        store = SqliteCacheStore(
+            path=str(tmp_path / "cache.db"), ttl=60, max_entries=10, max_bytes=200, clock=clock
+        )
+        await store.put("a", SearchResult(message="a" * 20))
+        clock.now = 1
+        await store.put("b", SearchResult(message="b" * 20))
+
+        assert await store.get("a") is None
+        assert await store.get("b") is not None
+        assert store.evictions == 1
+        await store.close()
+
+    async def test_byte_limit_counts_encoded_bytes(self, tmp_path: Path) -> None:
+        """Should measure payloads in encoded bytes, not characters."""
+        store = SqliteCacheStore(
+            path=str(tmp_path / "cache.db"), ttl=60, max_entries=10, max_bytes=200
+        )
+        await store.put("a", SearchResult(message="é" * 80))
+
+        assert await store.get("a") is None
+        assert store.evictions == 1
+        await store.close()
@@ -0,0 +1,139 @@
+"""Unit tests for the circuit breaker search adapter."""
+
+import pytest
+
+from domain.entities import SearchRequest, SearchResult
+from domain.ports import SearchError, SearchUnavailableError
+from infrastructure.circuit_breaker.adapter import (
+    CircuitBreakerConfig,
+    CircuitBreakerSearchAdapter,
+    CircuitState,
+)
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request, status_error
+
+
+class SlowSearchPort(SearchPortDouble):
+    """Search port double that advances a fake clock on every call."""
+
+    def __init__(self, clock: FakeClock, duration: float) -> None:
+        """Initialize SlowSearchPort.
+
+        Args:
+            clock: The fake clock to advance.
+            duration: Seconds each call takes.
+        """
+        super().__init__()
+        self._clock = clock
+        self._duration = duration
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Advance the clock, then answer."""
+        self._clock.now += self._duration
+        return await super().search(request)
+
+
+class TestCircuitBreakerSearchAdapter:
+    """Tests for CircuitBreakerSearchAdapter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def breaker(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> CircuitBreakerSearchAdapter:
+        """Create a breaker tripping after two failed calls out of two."""
+        config = CircuitBreakerConfig(
+            min_calls=2, failure_rate_threshold=0.5, open_duration=30, half_open_max_calls=1
+        )
+        return CircuitBreakerSearchAdapter(inner=search_port_double, config=config, clock=clock)
+
+    async def trip(
+        self, breaker: CircuitBreakerSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Fail enough calls to open the breaker."""
+        search_port_double.error = SearchError(message="Perplexica down")
+        for _ in range(2):
+            with pytest.raises(SearchError):
+                await breaker.search(make_request())
+        search_port_double.error = None
+
+    async def test_opens_and_fails_fast(
+        self, breaker: CircuitBreakerSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should reject calls without reaching the port once tripped."""
+        await self.trip(breaker, search_port_double)
+
+        with pytest.raises(SearchUnavailableError) as exc_info:
+            await breaker.search(make_request())
+
+        assert breaker.state is CircuitState.OPEN
+        assert exc_info.value.retry_after == 30
+        assert len(search_port_double.calls) == 2
+
+    async def test_closes_after_successful_trial(
+        self,
+        breaker: CircuitBreakerSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should close again when the half-open trial succeeds."""
+        await self.trip(breaker, search_port_double)
+        clock.now = 30
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        await breaker.search(make_request())
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_reopens_after_failed_trial(
+        self,
+        breaker: CircuitBreakerSearchAdapter,
+        search_port_double: SearchPortDouble,
+        clock: FakeClock,
+    ) -> None:
+        """Should open again when the half-open trial fails."""
+        await self.trip(breaker, search_port_double)
+        clock.now = 30
+        search_port_double.error = SearchError(message="Still down")
+
+        with pytest.raises(SearchError):
+            await breaker.search(make_request())
+
+        assert breaker.state is CircuitState.OPEN
+
+    async def test_client_errors_do_not_trip(
+        self, breaker: CircuitBreakerSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should ignore 4xx failures caused by the request itself."""
+        search_port_double.error = status_error(400)
+
+        for _ in range(3):
+            with pytest.raises(SearchError):
+                await breaker.search(make_request())
+
+        assert breaker.stats.failure_rate == 0.0
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_slow_calls_trip(self, clock: FakeClock) -> None:
+        """Should open when too many calls exceed the slow-call duration."""
+        config = CircuitBreakerConfig(
+            min_calls=1, slow_call_duration=10, slow_call_rate_threshold=1.0
+        )
+        breaker = CircuitBreakerSearchAdapter(
+            inner=SlowSearchPort(clock, 15), config=config, clock=clock
+        )
+
+        await breaker.search(make_request())
+
+        assert breaker.state is CircuitState.OPEN
+
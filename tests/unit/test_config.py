@@ -0,0 +1,37 @@
+"""Unit tests for the application settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from config import Settings
+from domain.entities import FocusMode
+
+
+class TestSettings:
+    """Tests for Settings."""
+
+    def test_focus_mode_keys_are_parsed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should key per-focus-mode settings by FocusMode."""
+        monkeypatch.setenv("MODEL_ROUTES", '{"academicSearch": ["openai/gpt-4o"]}')
+        monkeypatch.setenv("RATE_LIMIT_FOCUS_MODES", '{"youtubeSearch": [6, 2]}')
+
+        settings = Settings()
+
+        assert settings.model_routes == {FocusMode.ACADEMIC_SEARCH: ["openai/gpt-4o"]}
+        assert settings.rate_limit_focus_modes == {FocusMode.YOUTUBE_SEARCH: (6.0, 2.0)}
+
+    @pytest.mark.parametrize(
+        ("variable", "value"),
+        [
+            ("MODEL_ROUTES", '{"academicSerch": ["openai/gpt-4o"]}'),
+            ("RATE_LIMIT_FOCUS_MODES", '{"academicSerch": [6, 2]}'),
+        ],
+    )
+    def test_unknown_focus_mode_is_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, variable: str, value: str
+    ) -> None:
+        """Should fail at startup on a misspelled focus mode."""
+        monkeypatch.setenv(variable, value)
+
+        with pytest.raises(ValidationError, match="academicSerch"):
+            Settings()
@@ -0,0 +1,233 @@
+"""Unit tests for the hedging search adapter."""
+
+import asyncio
+import gc
+from collections.abc import AsyncIterator
+from dataclasses import replace
+
+import pytest
+
+from domain.entities import ChatModel, SearchChunk, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort
+from infrastructure.attempts import RetryBudget, attempt_backends
+from infrastructure.hedging.adapter import HedgingPolicy, HedgingSearchAdapter
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_requests import make_request
+
+# Hedge after 10 ms, so slow attempts (sleeping much longer) are always hedged
+FAST_POLICY = HedgingPolicy(initial_delay=0.01, min_delay=0.01)
+SLOW = 10.0
+
+
+class ScriptedPort(SearchPort):
+    """Search port whose successive calls take scripted times to answer.
+
+    Attributes:
+        waits: Seconds each call sleeps before answering, in call order.
+        errors: Error raised by each call instead of answering, if any.
+        calls: Requests received.
+        backends: Backends recorded as serving the search, as seen by each call.
+        cancelled: Indexes of the calls that were cancelled.
+    """
+
+    def __init__(self, *waits: float, errors: dict[int, SearchError] | None = None) -> None:
+        """Initialize ScriptedPort.
+
+        Args:
+            waits: Seconds each call sleeps before answering.
+            errors: Error raised by each call, by call index.
+        """
+        self.waits = waits
+        self.errors = errors or {}
+        self.calls: list[SearchRequest] = []
+        self.backends: list[set[str] | None] = []
+        self.cancelled: list[int] = []
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Sleep for the call's scripted time, then answer with its index."""
+        index = len(self.calls)
+        self.calls.append(request)
+        self.backends.append(attempt_backends())
+        try:
+            await asyncio.sleep(self.waits[index])
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        if index in self.errors:
+            raise self.errors[index]
+        return SearchResult(message=f"answer {index}")
+
+
+class TestHedgingSearchAdapter:
+    """Tests for HedgingSearchAdapter."""
+
+    async def test_fast_search_is_not_hedged(self) -> None:
+        """Should send a single attempt when it answers before the delay."""
+        port = ScriptedPort(0)
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        result = await adapter.search(make_request())
+
+        assert result.message == "answer 0"
+        assert not result.metadata.hedged
+        assert len(port.calls) == 1
+        assert adapter.stats.hedges == 0
+
+    async def test_hedge_wins_and_primary_is_cancelled(self) -> None:
+        """Should answer with the hedge and cancel the slow first attempt."""
+        port = ScriptedPort(SLOW, 0)
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        result = await adapter.search(make_request())
+        await asyncio.sleep(0)
+
+        assert result.message == "answer 1"
+        assert result.metadata.hedged
+        assert port.cancelled == [0]
+        stats = adapter.stats
+        assert (stats.hedges, stats.hedge_wins) == (1, 1)
+
+    async def test_hedge_uses_fallback_chat_model(self) -> None:
+        """Should send the hedged attempt with the fallback chat model."""
+        fallback = ChatModel(provider_id="p1", key="fallback")
+        port = ScriptedPort(SLOW, 0)
+        adapter = HedgingSearchAdapter(
+            inner=port, policy=replace(FAST_POLICY, fallback_chat_model=fallback)
+        )
+
+        await adapter.search(make_request())
+
+        assert [call.chat_model for call in port.calls] == [
+            ChatModel(provider_id="p1", key="m1"),
+            fallback,
+        ]
+
+    async def test_attempts_share_their_backends(self) -> None:
+        """Should let a load balancer below keep the hedge off the primary's backend."""
+        port = ScriptedPort(SLOW, 0)
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        await adapter.search(make_request())
+
+        assert port.backends[0] is not None
+        assert port.backends[1] is port.backends[0]
+
+    async def test_primary_wins_when_hedge_fails(self) -> None:
+        """Should keep waiting for the first attempt when the hedge fails."""
+        port = ScriptedPort(0.05, 0, errors={1: SearchError("backend down")})
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        result = await adapter.search(make_request())
+
+        assert result.message == "answer 0"
+        assert not result.metadata.hedged
+        assert adapter.stats.hedge_wins == 0
+
+    async def test_error_raised_when_every_attempt_fails(self) -> None:
+        """Should raise the first failure once both attempts have failed."""
+        port = ScriptedPort(
+            0.05, 0, errors={0: SearchError("primary"), 1: SearchError("hedge")}
+        )
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        with pytest.raises(SearchError, match="hedge"):
+            await adapter.search(make_request())
+
+    async def test_empty_budget_skips_hedge(self) -> None:
+        """Should wait for the single attempt when the budget is exhausted."""
+        port = ScriptedPort(0.05)
+        adapter = HedgingSearchAdapter(
+            inner=port, policy=FAST_POLICY, budget=RetryBudget(ratio=0.0, max_tokens=0.0)
+        )
+
+        result = await adapter.search(make_request())
+
+        assert result.message == "answer 0"
+        assert len(port.calls) == 1
+        assert adapter.stats.budget_exhausted == 1
+
+    async def test_cancelling_caller_cancels_every_attempt(self) -> None:
+        """Should cancel both attempts when the caller gives up."""
+        port = ScriptedPort(SLOW, SLOW)
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await adapter.search(make_request())
+        await asyncio.sleep(0)
+
+        assert sorted(port.cancelled) == [0, 1]
+
+    async def test_delay_follows_latency_percentile(self) -> None:
+        """Should hedge after the configured percentile of recent latencies."""
+        clock = FakeClock()
+
+        class TimedPort(SearchPort):
+            """Search port advancing the fake clock by each call's latency."""
+
+            async def search(self, request: SearchRequest) -> SearchResult:
+                clock.now += float(request.query)
+                return SearchResult(message="ok")
+
+        adapter = HedgingSearchAdapter(
+            inner=TimedPort(),
+            policy=HedgingPolicy(percentile=0.9, window=10, min_samples=10, min_delay=0.5),
+            clock=clock,
+        )
+        assert adapter.stats.delay == 10.0  # initial delay until 10 samples
+
+        for latency in range(1, 21):
+            await adapter.search(make_request(str(latency)))
+
+        # The window holds latencies 11..20, whose 90th percentile is 20
+        assert adapter.stats.delay == 20.0
+
+    async def test_stream_is_hedged_on_first_chunk(self) -> None:
+        """Should stream from the hedge when the first stream is slow to start."""
+        port = ScriptedPort(SLOW, 0)
+        adapter = HedgingSearchAdapter(inner=port, policy=FAST_POLICY)
+
+        chunks = [chunk async for chunk in adapter.search_stream(make_request())]
+        await asyncio.sleep(0.01)  # the losing stream is cancelled through its pump task
+
+        assert [chunk.message for chunk in chunks] == ["answer 1"]
+        assert port.cancelled == [0]
+
+    async def test_stream_forwards_unexpected_errors(self) -> None:
+        """Should raise a stream's unexpected error rather than wait for its end."""
+
+        class BrokenStreamPort(ScriptedPort):
+            async def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+                yield SearchChunk(message=request.query)
+                raise RuntimeError("decoder crashed")
+
+        adapter = HedgingSearchAdapter(inner=BrokenStreamPort(0), policy=FAST_POLICY)
+        chunks: list[SearchChunk] = []
+
+        with pytest.raises(RuntimeError, match="decoder crashed"):
+            async with asyncio.timeout(1):
+                async for chunk in adapter.search_stream(make_request()):
+                    chunks.append(chunk)
+
+        assert [chunk.message for chunk in chunks] == ["test query"]
+
+    async def test_losing_attempt_errors_are_retrieved(self) -> None:
+        """Should retrieve the error of a losing attempt that fails while cancelled."""
+
+        class UnrulyPort(ScriptedPort):
+            async def search(self, request: SearchRequest) -> SearchResult:
+                try:
+                    return await super().search(request)
+                except asyncio.CancelledError:
+                    raise RuntimeError("cleanup failed") from None
+
+        unhandled: list[dict[str, object]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        adapter = HedgingSearchAdapter(inner=UnrulyPort(SLOW, 0), policy=FAST_POLICY)
+
+        await adapter.search(make_request())
+        await asyncio.sleep(0.01)
+        gc.collect()
+
+        assert unhandled == []
@@ -0,0 +1,118 @@
+"""Unit tests for the load-balancing search adapter."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from domain.ports import SearchError
+from infrastructure.attempts import distinct_backends
+from infrastructure.load_balancer.adapter import (
+    BalancingStrategy,
+    LoadBalancingSearchAdapter,
+)
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request
+
+
+class TestLoadBalancingSearchAdapter:
+    """Tests for LoadBalancingSearchAdapter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def backends(self) -> dict[str, SearchPortDouble]:
+        """Create two backend doubles."""
+        return {"a": SearchPortDouble(), "b": SearchPortDouble()}
+
+    async def test_round_robin_alternates(self, backends: dict[str, SearchPortDouble]) -> None:
+        """Should spread searches evenly across backends."""
+        balancer = LoadBalancingSearchAdapter(
+            backends=backends, strategy=BalancingStrategy.ROUND_ROBIN
+        )
+
+        for _ in range(4):
+            await balancer.search(make_request())
+
+        assert [len(b.calls) for b in backends.values()] == [2, 2]
+
+    async def test_attempts_of_one_search_use_distinct_backends(
+        self, backends: dict[str, SearchPortDouble]
+    ) -> None:
+        """Should avoid backends already serving another attempt of the search."""
+        balancer = LoadBalancingSearchAdapter(
+            backends=backends, strategy=BalancingStrategy.ROUND_ROBIN
+        )
+        attempts: set[str] = set()
+
+        with distinct_backends(attempts):
+            await balancer.search(make_request("attempt"))
+        await balancer.search(make_request("other"))
+        with distinct_backends(attempts):
+            await balancer.search(make_request("attempt"))
+
+        assert attempts == {"a", "b"}
+        assert [call.query for call in backends["a"].calls] == ["attempt"]
+        assert [call.query for call in backends["b"].calls] == ["other", "attempt"]
+
+    async def test_least_in_flight_avoids_busy_backend(self) -> None:
+        """Should send new searches to the backend with fewer searches running."""
+        busy = SearchPortDouble(gate=asyncio.Event())
+        idle = SearchPortDouble()
+        balancer = LoadBalancingSearchAdapter(
+            backends={"busy": busy, "idle": idle},
+            strategy=BalancingStrategy.LEAST_IN_FLIGHT,
+        )
+        first = asyncio.create_task(balancer.search(make_request()))
+        await asyncio.sleep(0)
+        assert len(busy.calls) + len(idle.calls) == 1
+        loaded = busy if busy.calls else idle
+
+        for _ in range(3):
+            await balancer.search(make_request())
+
+        assert len(loaded.calls) == 1
+        busy.release()
+        await first
+
+    async def test_failing_backend_is_ejected_and_readmitted(
+        self, backends: dict[str, SearchPortDouble], clock: FakeClock
+    ) -> None:
+        """Should stop routing to a failing backend until the ejection ends."""
+        backends["a"].error = SearchError(message="down")
+        balancer = LoadBalancingSearchAdapter(
+            backends=backends,
+            strategy=BalancingStrategy.ROUND_ROBIN,
+            max_failures=1,
+            ejection_time=30,
+            clock=clock,
+        )
+
+        for _ in range(4):
+            with contextlib.suppress(SearchError):
+                await balancer.search(make_request())
+
+        assert len(backends["a"].calls) == 1
+        assert [s.healthy for s in balancer.stats] == [False, True]
+
+        clock.now = 31
+        assert [s.healthy for s in balancer.stats] == [True, True]
+
+    async def test_ewma_prefers_faster_backend(
+        self, backends: dict[str, SearchPortDouble], clock: FakeClock
+    ) -> None:
+        """Should route to the backend with the lower smoothed latency."""
+        balancer = LoadBalancingSearchAdapter(
+            backends=backends, strategy=BalancingStrategy.EWMA, clock=clock
+        )
+        balancer._backends[0].ewma_latency = 5.0
+        balancer._backends[1].ewma_latency = 1.0
+
+        for _ in range(3):
+            await balancer.search(make_request())
+
+        assert len(backends["b"].calls) == 3
@@ -0,0 +1,115 @@
+"""Unit tests for the server entry point."""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from dependencies import app_lifespan, get_perplexica_adapters, lifespan, mcp, settings
+from main import create_app, main, parse_import_times
+
+SRC = Path(__file__).parents[2] / "src"
+
+# Generous enough for a slow CI runner; importing mcp alone takes about 0.5 s
+COLD_START_BUDGET = 5.0
+
+# Libraries only needed once a search runs or an optional layer is enabled
+DEFERRED_MODULES = (
+    "infrastructure.perplexica.adapter",
+    "infrastructure.cache.adapter",
+    "infrastructure.metrics.adapter",
+    "infrastructure.rate_limit.adapter",
+    "prometheus_client",
+    "sqlite3",
+    "numpy",
+    "opentelemetry",
+)
+
+
+class TestCreateApp:
+    """Tests for create_app."""
+
+    async def test_worker_holds_perplexica_clients_open(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should open the pooled clients for the worker's life and close them after."""
+        monkeypatch.setattr(settings, "transport", "streamable-http")
+        app = create_app()
+
+        async with app.router.lifespan_context(app):
+            assert all(adapter._client is not None for adapter in get_perplexica_adapters())
+
+        assert all(adapter._client is None for adapter in get_perplexica_adapters())
+
+    async def test_sessions_ending_leave_clients_open(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should keep the process-wide pool open when every MCP session has ended."""
+        monkeypatch.setattr(settings, "transport", "streamable-http")
+
+        async with app_lifespan():
+            async with lifespan(mcp):
+                pass
+            assert all(adapter._client is not None for adapter in get_perplexica_adapters())
+
+
+class TestMain:
+    """Tests for main."""
+
+    @pytest.mark.parametrize(
+        "feature", ["sessions_enabled", "metrics_enabled", "rate_limit_enabled", "admission_enabled"]
+    )
+    def test_workers_refuse_per_process_state(
+        self, monkeypatch: pytest.MonkeyPatch, feature: str
+    ) -> None:
+        """Should refuse several workers with a feature whose state lives in one process."""
+        monkeypatch.setattr(settings, "transport", "streamable-http")
+        monkeypatch.setattr(settings, "workers", 2)
+        monkeypatch.setattr(settings, feature, True)
+
+        with pytest.raises(SystemExit, match=feature.upper()):
+            main([])
+
+
+class TestColdStart:
+    """Tests for the server's startup cost."""
+
+    def test_import_stays_within_budget(self) -> None:
+        """Should import the server quickly, without loading deferred modules."""
+        script = (
+            "import json, sys, main; "
+            f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+        )
+        start = time.perf_counter()
+        child = subprocess.run(
+            [sys.executable, "-c", script], cwd=SRC, capture_output=True, text=True, check=True
+        )
+        elapsed = time.perf_counter() - start
+
+        assert json.loads(child.stdout) == []
+        assert elapsed < COLD_START_BUDGET
+
+    async def test_stdio_session_does_not_open_clients(self) -> None:
+        """Should leave creating the HTTP client to the first search in stdio mode."""
+        get_perplexica_adapters.cache_clear()
+
+        async with lifespan(mcp):
+            assert get_perplexica_adapters.cache_info().currsize == 0
+
+    def test_parse_import_times(self) -> None:
+        """Should read per-module times from the -X importtime report."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   config\n"
+            "import time:      1500 |       2500 | main\n"
+        )
+
+        times = parse_import_times(output)
+
+        assert [(t.module, t.self_time, t.cumulative) for t in times] == [
+            ("config", 0.00012, 0.00012),
+            ("main", 0.0015, 0.0025),
+        ]
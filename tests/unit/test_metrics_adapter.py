@@ -0,0 +1,167 @@
+"""Unit tests for the Prometheus metrics adapter."""
+
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from application.requests import ChatModelRequest, EmbeddingModelRequest, SearchRequestDTO
+from application.use_cases import SearchUseCase
+from domain.ports import SearchError, SearchUnavailableError
+from infrastructure.metrics.adapter import PrometheusMetrics, error_class
+from infrastructure.perplexica.adapter import PerplexicaAdapter
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request, status_error
+
+
+class TestErrorClass:
+    """Tests for error_class."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (SearchUnavailableError(message="busy"), "unavailable"),
+            (SearchError(message="slow", cause=httpx.ReadTimeout("slow")), "timeout"),
+            (SearchError(message="late", cause=TimeoutError()), "timeout"),
+            (SearchError(message="down", cause=httpx.ConnectError("down")), "connect"),
+            (status_error(503), "http_status"),
+            (SearchError(message="bad", cause=ValueError("bad json")), "parse"),
+            (SearchError(message="odd"), "other"),
+        ],
+    )
+    def test_classifies_errors(self, error: Exception, expected: str) -> None:
+        """Should map each failure to its error class."""
+        assert error_class(error) == expected
+
+
+class TestPrometheusMetrics:
+    """Tests for PrometheusMetrics."""
+
+    @pytest.fixture
+    def metrics(self) -> PrometheusMetrics:
+        """Create a metrics recorder with its own registry."""
+        return PrometheusMetrics(pool_max_connections=100, chat_models={"m1"})
+
+    def sample(self, metrics: PrometheusMetrics, name: str, **labels: str) -> float | None:
+        """Read one sample from the recorder's registry."""
+        return metrics.registry.get_sample_value(name, labels)
+
+    def test_measure_search_records_latency(self, metrics: PrometheusMetrics) -> None:
+        """Should count a successful search in the latency histogram."""
+        with metrics.measure_search(make_request()):
+            assert self.sample(metrics, "mcp_perplexica_searches_in_flight") == 1
+
+        assert self.sample(metrics, "mcp_perplexica_searches_in_flight") == 0
+        assert (
+            self.sample(
+                metrics,
+                "mcp_perplexica_search_duration_seconds_count",
+                focus_mode="webSearch",
+                optimization_mode="balanced",
+                chat_model="m1",
+                outcome="success",
+            )
+            == 1
+        )
+
+    def test_unconfigured_chat_models_share_a_label(self, metrics: PrometheusMetrics) -> None:
+        """Should label searches with chat models it was not configured with as 'other'."""
+        for key in ("unknown-1", "unknown-2"):
+            request = make_request()
+            with metrics.measure_search(
+                replace(request, chat_model=replace(request.chat_model, key=key))
+            ):
+                pass
+
+        assert (
+            self.sample(
+                metrics,
+                "mcp_perplexica_search_duration_seconds_count",
+                focus_mode="webSearch",
+                optimization_mode="balanced",
+                chat_model="other",
+                outcome="success",
+            )
+            == 2
+        )
+
+    def test_measure_upstream_counts_errors(self, metrics: PrometheusMetrics) -> None:
+        """Should count a failed upstream call by class and status."""
+        with (
+            pytest.raises(SearchError),
+            metrics.measure_upstream(make_request(), "http://perplexica"),
+        ):
+            raise status_error(503)
+
+        assert (
+            self.sample(
+                metrics,
+                "mcp_perplexica_errors_total",
+                stage="upstream",
+                error_class="http_status",
+                status="503",
+            )
+            == 1
+        )
+        assert (
+            self.sample(metrics, "mcp_perplexica_upstream_in_flight", backend="http://perplexica")
+            == 0
+        )
+
+    def test_exposition_lists_metrics(self, metrics: PrometheusMetrics) -> None:
+        """Should render the registry in the Prometheus text format."""
+        text = metrics.exposition().decode()
+
+        assert "mcp_perplexica_pool_max_connections 100.0" in text
+        assert "# TYPE mcp_perplexica_search_duration_seconds histogram" in text
+
+    async def test_use_case_measures_searches(self, metrics: PrometheusMetrics) -> None:
+        """Should record end-to-end failures raised through the use case."""
+        use_case = SearchUseCase(
+            search_port=SearchPortDouble(error=SearchError(message="down")), metrics=metrics
+        )
+        dto = SearchRequestDTO(
+            query="q",
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+        )
+
+        with pytest.raises(SearchError):
+            await use_case.execute(dto)
+
+        assert (
+            self.sample(
+                metrics,
+                "mcp_perplexica_errors_total",
+                stage="search",
+                error_class="other",
+                status="",
+            )
+            == 1
+        )
+
+    async def test_adapter_measures_upstream_calls(self, metrics: PrometheusMetrics) -> None:
+        """Should record the latency of each call to Perplexica."""
+        transport = httpx.MockTransport(
+            lambda _: httpx.Response(200, json={"message": "Paris", "sources": []})
+        )
+        adapter = PerplexicaAdapter(
+            base_url="http://perplexica",
+            client=httpx.AsyncClient(transport=transport),
+            metrics=metrics,
+        )
+
+        await adapter.search(make_request())
+        await adapter.close()
+
+        assert (
+            self.sample(
+                metrics,
+                "mcp_perplexica_upstream_duration_seconds_count",
+                focus_mode="webSearch",
+                optimization_mode="balanced",
+                chat_model="m1",
+                outcome="success",
+            )
+            == 1
+        )
@@ -0,0 +1,273 @@
+"""Unit tests for the Perplexica adapter."""
+
+import json
+import time
+from dataclasses import replace
+from typing import Any
+
+import httpx
+import pytest
+
+from domain.entities import (
+    FocusMode,
+    HistoryEntry,
+    SearchRequest,
+    SourceDedupe,
+    SourceLimits,
+)
+from domain.ports import SearchDeadlineError, SearchError, is_backend_failure
+from infrastructure.perplexica.adapter import (
+    ORJSON_CODEC,
+    STDLIB_CODEC,
+    JsonCodec,
+    PerplexicaAdapter,
+)
+from tests.doubles.search_requests import make_request
+
+
+def expected_payload(request: SearchRequest, stream: bool) -> dict[str, Any]:
+    """Build the JSON body Perplexica expects for a request."""
+    payload: dict[str, Any] = {
+        "chatModel": {"providerId": request.chat_model.provider_id, "key": request.chat_model.key},
+        "embeddingModel": {
+            "providerId": request.embedding_model.provider_id,
+            "key": request.embedding_model.key,
+        },
+        "optimizationMode": request.optimization_mode.value,
+        "focusMode": request.focus_mode.value,
+        "query": request.query,
+        "history": [[entry.role, entry.content] for entry in request.history],
+        "stream": stream,
+    }
+    if request.system_instructions is not None:
+        payload["systemInstructions"] = request.system_instructions
+    return payload
+
+
+class TestPerplexicaAdapter:
+    """Tests for PerplexicaAdapter."""
+
+    @pytest.fixture
+    def transport(self) -> httpx.MockTransport:
+        """Create a mock transport standing in for the Perplexica API."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "message": "Paris",
+                    "sources": [{"title": "Wiki", "url": "https://wiki.org"}],
+                },
+            )
+
+        return httpx.MockTransport(handler)
+
+    async def test_search_reuses_pooled_client(
+        self, transport: httpx.MockTransport
+    ) -> None:
+        """Should reuse a single HTTP client across searches."""
+        client = httpx.AsyncClient(transport=transport)
+        adapter = PerplexicaAdapter(base_url="http://perplexica", client=client)
+
+        first = await adapter.search(make_request())
+        second = await adapter.search(make_request())
+
+        assert first.message == "Paris"
+        assert second.sources[0].url == "https://wiki.org"
+        assert await adapter._get_client() is client
+        await adapter.close()
+
+    @pytest.mark.parametrize(
+        "codec",
+        [
+            STDLIB_CODEC,
+            pytest.param(
+                ORJSON_CODEC,
+                marks=pytest.mark.skipif(ORJSON_CODEC is None, reason="orjson not installed"),
+            ),
+        ],
+    )
+    async def test_codecs_send_and_parse_the_same_json(self, codec: JsonCodec) -> None:
+        """Should encode the payload and parse the answer identically with every codec."""
+        received: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "message": "Zürich ✓",
+                    "sources": [{"title": "Wiki", "url": "https://wiki.org", "snippet": "s"}],
+                },
+            )
+
+        adapter = PerplexicaAdapter(
+            base_url="http://perplexica",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            codec=codec,
+        )
+        request = replace(make_request("Größte Stadt?"), system_instructions="Be brief")
+
+        result = await adapter.search(request)
+
+        assert json.loads(received[0].content) == expected_payload(request, stream=False)
+        assert received[0].headers["Content-Type"] == "application/json"
+        assert result.message == "Zürich ✓"
+        assert result.sources[0].snippet == "s"
+        await adapter.close()
+
+    def test_payload_templates_are_reused_per_configuration(self) -> None:
+        """Should splice query and history into one template per configuration."""
+        adapter = PerplexicaAdapter(base_url="http://perplexica")
+        first = replace(
+            make_request("first"),
+            history=(HistoryEntry(role="human", content='say "hi"'),),
+            system_instructions="Be brief",
+        )
+        second = replace(first, query="second", history=())
+        academic = replace(first, focus_mode=FocusMode.ACADEMIC_SEARCH)
+
+        for request in (first, second, academic):
+            for stream in (False, True):
+                encoded = adapter._encode_payload(request, stream=stream)
+                assert json.loads(encoded) == expected_payload(request, stream=stream)
+
+        assert adapter._template(first) is adapter._template(second)
+        assert len(adapter._templates) == 2
+
+    async def test_sources_are_limited_while_parsing(self) -> None:
+        """Should de-duplicate, cap and truncate sources as they are parsed."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "message": "Paris",
+                    "sources": [
+                        {"title": "A", "url": "https://www.wiki.org/a", "snippet": "x" * 50},
+                        {"title": "B", "url": "https://wiki.org/b", "snippet": "short"},
+                        {"title": "C", "url": "https://other.org/c"},
+                        {"title": "D", "url": "https://third.org/d"},
+                    ],
+                },
+            )
+
+        adapter = PerplexicaAdapter(
+            base_url="http://perplexica",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        limits = SourceLimits(max_sources=2, snippet_max_chars=10, dedupe=SourceDedupe.DOMAIN)
+
+        result = await adapter.search(replace(make_request(), source_limits=limits))
+
+        assert [source.title for source in result.sources] == ["A", "C"]
+        assert result.sources[0].snippet == "x" * 9 + "…"
+        assert result.sources[1].snippet is None
+        await adapter.close()
+
+    async def test_timeouts_are_capped_by_deadline(self) -> None:
+        """Should shrink every timeout phase to the time left."""
+        adapter = PerplexicaAdapter(
+            base_url="http://perplexica", timeout=httpx.Timeout(120.0, connect=10.0)
+        )
+        request = replace(make_request(), deadline=time.monotonic() + 5)
+
+        timeout = adapter._request_timeout(request)
+
+        assert timeout.connect is not None and timeout.connect <= 5
+        assert timeout.read is not None and timeout.read <= 5
+
+    async def test_search_fails_fast_after_deadline(
+        self, transport: httpx.MockTransport
+    ) -> None:
+        """Should not contact Perplexica once the deadline has passed."""
+        client = httpx.AsyncClient(transport=transport)
+        adapter = PerplexicaAdapter(base_url="http://perplexica", client=client)
+        request = replace(make_request(), deadline=time.monotonic() - 1)
+
+        with pytest.raises(SearchDeadlineError) as exc_info:
+            await adapter.search(request)
+
+        assert not is_backend_failure(exc_info.value)
+
+    async def test_timeout_at_deadline_is_not_a_backend_failure(self) -> None:
+        """Should report a timeout caused by the request deadline as a deadline error."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.02)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        adapter = PerplexicaAdapter(base_url="http://perplexica", client=client)
+        request = replace(make_request(), deadline=time.monotonic() + 0.01)
+
+        with pytest.raises(SearchDeadlineError) as exc_info:
+            await adapter.search(request)
+
+        assert not is_backend_failure(exc_info.value)
+
+    async def test_context_manager_opens_and_closes_client(self) -> None:
+        """Should create the client on enter and release it on exit."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        adapter = PerplexicaAdapter(base_url="http://perplexica", limits=limits)
+
+        async with adapter:
+            client = adapter._client
+            assert client is not None
+
+        assert adapter._client is None
+        assert client.is_closed
+
+
+class TestPerplexicaAdapterStreaming:
+    """Tests for PerplexicaAdapter streaming mode."""
+
+    @pytest.fixture
+    def adapter(self) -> PerplexicaAdapter:
+        """Create an adapter whose transport answers with an NDJSON stream."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is True
+            lines = [
+                {"type": "init", "data": "Stream connected"},
+                {"type": "sources", "data": [{"title": "Wiki", "url": "https://wiki.org"}]},
+                {"type": "response", "data": "Par"},
+                {"type": "response", "data": "is"},
+                {"type": "done"},
+            ]
+            body = "\n".join(json.dumps(line) for line in lines) + "\n"
+            return httpx.Response(200, content=body.encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return PerplexicaAdapter(base_url="http://perplexica", client=client)
+
+    async def test_search_stream_yields_chunks(self, adapter: PerplexicaAdapter) -> None:
+        """Should yield sources and message chunks in arrival order."""
+        chunks = [chunk async for chunk in adapter.search_stream(make_request())]
+
+        assert [chunk.message for chunk in chunks] == ["", "Par", "is"]
+        assert chunks[0].sources[0].title == "Wiki"
+
+    async def test_search_assembles_streamed_response(
+        self, adapter: PerplexicaAdapter
+    ) -> None:
+        """Should assemble a streamed response when request.stream is set."""
+        request = replace(make_request(), stream=True)
+
+        result = await adapter.search(request)
+
+        assert result.message == "Paris"
+        assert len(result.sources) == 1
+
+    async def test_search_stream_raises_on_error_event(self) -> None:
+        """Should raise SearchError when Perplexica reports an error event."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"type": "error", "data": "boom"}\n')
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        adapter = PerplexicaAdapter(base_url="http://perplexica", client=client)
+
+        with pytest.raises(SearchError, match="boom"):
+            async for _ in adapter.search_stream(make_request()):
+                pass
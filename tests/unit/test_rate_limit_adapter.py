@@ -0,0 +1,209 @@
+"""Unit tests for the per-client rate limiting search adapter."""
+
+import contextlib
+from dataclasses import replace
+
+import pytest
+
+from domain.entities import FocusMode
+from domain.ports import SearchUnavailableError
+from infrastructure.rate_limit.adapter import RateLimit, RateLimitingSearchAdapter
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request
+
+# One search per second, in bursts of up to two
+LIMIT = RateLimit(rate=1.0, burst=2.0)
+
+
+class TestRateLimitingSearchAdapter:
+    """Tests for RateLimitingSearchAdapter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create the wrapped search port."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def adapter(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> RateLimitingSearchAdapter:
+        """Create a rate limiter applying LIMIT to every client."""
+        return RateLimitingSearchAdapter(inner=search_port_double, default=LIMIT, clock=clock)
+
+    async def test_throttles_client_past_its_burst(
+        self, adapter: RateLimitingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should refuse a client's searches past its burst, telling when to retry."""
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-a"))
+
+        with pytest.raises(SearchUnavailableError, match="client 'team-a'") as exc_info:
+            await adapter.search(make_request(client_id="team-a"))
+
+        assert exc_info.value.retry_after == pytest.approx(1.0)
+        assert len(search_port_double.calls) == 2
+        stats = adapter.stats
+        assert (stats.allowed, stats.throttled) == (2, 1)
+        assert stats.throttled_by_client == {"team-a": 1}
+
+    async def test_bucket_refills_over_time(
+        self, adapter: RateLimitingSearchAdapter, clock: FakeClock
+    ) -> None:
+        """Should allow one more search per second of rate."""
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-a"))
+
+        clock.now += 1.0
+        await adapter.search(make_request(client_id="team-a"))
+
+        with pytest.raises(SearchUnavailableError):
+            await adapter.search(make_request(client_id="team-a"))
+
+    async def test_clients_have_independent_buckets(
+        self, adapter: RateLimitingSearchAdapter
+    ) -> None:
+        """Should not throttle a client for another client's searches."""
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-a"))
+
+        await adapter.search(make_request(client_id="team-b"))
+        await adapter.search(make_request())
+
+        assert adapter.stats.clients == 3
+
+    async def test_focus_mode_with_own_limit_has_own_bucket(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should limit a focus mode separately from the client's other searches."""
+        adapter = RateLimitingSearchAdapter(
+            inner=search_port_double,
+            default=LIMIT,
+            by_focus_mode={FocusMode.ACADEMIC_SEARCH: RateLimit(rate=0.1, burst=1.0)},
+            clock=clock,
+        )
+        academic = replace(make_request(client_id="team-a"), focus_mode=FocusMode.ACADEMIC_SEARCH)
+        await adapter.search(academic)
+
+        with pytest.raises(SearchUnavailableError, match="'academicSearch'") as exc_info:
+            await adapter.search(academic)
+
+        assert exc_info.value.retry_after == pytest.approx(10.0)
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-a"))
+
+    async def test_weight_scales_client_limits(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should let a client weighing 2 burst twice as many searches."""
+        adapter = RateLimitingSearchAdapter(
+            inner=search_port_double,
+            default=LIMIT,
+            client_weights={"team-a": 2.0},
+            clock=clock,
+        )
+        for _ in range(4):
+            await adapter.search(make_request(client_id="team-a"))
+
+        with pytest.raises(SearchUnavailableError) as exc_info:
+            await adapter.search(make_request(client_id="team-a"))
+
+        assert exc_info.value.retry_after == pytest.approx(0.5)
+
+    async def test_throttles_stream_before_first_chunk(
+        self, adapter: RateLimitingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should refuse a throttled stream without starting it upstream."""
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-a"))
+
+        with pytest.raises(SearchUnavailableError):
+            async for _ in adapter.search_stream(make_request(client_id="team-a")):
+                pass
+
+        assert len(search_port_double.calls) == 2
+
+    async def test_refilled_buckets_are_forgotten(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should drop full buckets once max_clients buckets are tracked."""
+        adapter = RateLimitingSearchAdapter(
+            inner=search_port_double, default=LIMIT, max_clients=2, clock=clock
+        )
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-b"))
+
+        clock.now += 1.0
+        await adapter.search(make_request(client_id="team-c"))
+
+        assert adapter.stats.clients == 1
+
+    async def test_least_recently_used_bucket_is_forgotten_when_none_refilled(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should keep at most max_clients buckets even when none has refilled."""
+        adapter = RateLimitingSearchAdapter(
+            inner=search_port_double, default=LIMIT, max_clients=2, clock=clock
+        )
+        await adapter.search(make_request(client_id="team-a"))
+        await adapter.search(make_request(client_id="team-b"))
+        await adapter.search(make_request(client_id="team-a"))
+
+        await adapter.search(make_request(client_id="team-c"))
+
+        assert adapter.stats.clients == 2
+        with pytest.raises(SearchUnavailableError):
+            await adapter.search(make_request(client_id="team-a"))
+
+    async def test_throttled_counts_are_bounded(
+        self, search_port_double: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should count refusals by client for at most max_clients clients."""
+        adapter = RateLimitingSearchAdapter(
+            inner=search_port_double,
+            default=RateLimit(rate=1.0, burst=1.0),
+            max_clients=2,
+            top_clients=1,
+            clock=clock,
+        )
+        for client in ["team-a", "team-a", "team-a", "team-b", "team-b", "team-c", "team-c"]:
+            with contextlib.suppress(SearchUnavailableError):
+                await adapter.search(make_request(client_id=client))
+
+        stats = adapter.stats
+        assert stats.throttled == 4
+        assert stats.throttled_by_client == {"team-a": 2}
+
+    @pytest.mark.parametrize(
+        ("rate", "burst"),
+        [(0.0, 1.0), (-1.0, 1.0), (1.0, 0.0), (1.0, 0.5)],
+        ids=["zero", "negative", "burst", "fractional-burst"],
+    )
+    def test_rejects_non_positive_limits(self, rate: float, burst: float) -> None:
+        """Should refuse a limit that could never allow or refill a search."""
+        with pytest.raises(ValueError, match="Rate limit needs"):
+            RateLimit(rate=rate, burst=burst)
+
+    def test_rejects_non_positive_weights(self, search_port_double: SearchPortDouble) -> None:
+        """Should refuse a client weight that would zero its rate."""
+        with pytest.raises(ValueError, match="'team-a'"):
+            RateLimitingSearchAdapter(
+                inner=search_port_double, default=LIMIT, client_weights={"team-a": 0.0}
+            )
+
+    def test_rejects_weights_scaling_burst_below_one(
+        self, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should refuse a weight leaving a client less than one search of burst."""
+        with pytest.raises(ValueError, match="'team-a'"):
+            RateLimitingSearchAdapter(
+                inner=search_port_double,
+                default=LIMIT,
+                by_focus_mode={FocusMode.ACADEMIC_SEARCH: RateLimit(rate=1.0, burst=1.0)},
+                client_weights={"team-a": 0.5},
+            )
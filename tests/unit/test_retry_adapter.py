@@ -0,0 +1,117 @@
+"""Unit tests for the retrying search adapter."""
+
+import httpx
+import pytest
+
+from domain.ports import SearchError
+from infrastructure.attempts import RetryBudget
+from infrastructure.retry.adapter import RetryingSearchAdapter, RetryPolicy
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request, status_error
+
+
+def connect_error() -> SearchError:
+    """Create a SearchError caused by a connection failure."""
+    cause = httpx.ConnectError("connection refused")
+    return SearchError(message="Failed to connect to Perplexica API", cause=cause)
+
+
+class TestRetryingSearchAdapter:
+    """Tests for RetryingSearchAdapter."""
+
+    @pytest.fixture
+    def delays(self) -> list[float]:
+        """Collect the delays the adapter sleeps for."""
+        return []
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def adapter(
+        self, search_port_double: SearchPortDouble, delays: list[float]
+    ) -> RetryingSearchAdapter:
+        """Create a retrying adapter that records delays instead of sleeping."""
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+
+        return RetryingSearchAdapter(
+            inner=search_port_double,
+            policy=RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0),
+            sleep=sleep,
+            jitter=lambda: 0.5,
+        )
+
+    async def test_retries_transient_failures(
+        self,
+        adapter: RetryingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        delays: list[float],
+    ) -> None:
+        """Should retry with exponential backoff and record the attempts."""
+        search_port_double.errors = [connect_error(), status_error(503)]
+
+        result = await adapter.search(make_request())
+
+        assert result.metadata.attempts == 3
+        assert delays == [0.5, 1.0]
+
+    async def test_does_not_retry_client_errors(
+        self, adapter: RetryingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should raise non-retryable failures immediately."""
+        search_port_double.errors = [status_error(400)]
+
+        with pytest.raises(SearchError):
+            await adapter.search(make_request())
+
+        search_port_double.assert_called_once()
+
+    async def test_gives_up_after_max_attempts(
+        self, adapter: RetryingSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should raise the last failure once max_attempts is reached."""
+        search_port_double.error = status_error(502)
+
+        with pytest.raises(SearchError):
+            await adapter.search(make_request())
+
+        assert len(search_port_double.calls) == 3
+
+    async def test_honours_retry_after(
+        self,
+        adapter: RetryingSearchAdapter,
+        search_port_double: SearchPortDouble,
+        delays: list[float],
+    ) -> None:
+        """Should wait at least as long as the Retry-After header asks."""
+        search_port_double.errors = [status_error(429, {"Retry-After": "4"})]
+
+        await adapter.search(make_request())
+
+        assert delays == [4.0]
+
+    async def test_budget_stops_retry_storms(
+        self, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should stop retrying once the retry budget is spent."""
+        search_port_double.error = connect_error()
+
+        async def sleep(_: float) -> None:
+            pass
+
+        adapter = RetryingSearchAdapter(
+            inner=search_port_double,
+            budget=RetryBudget(ratio=0.0, max_tokens=1.0),
+            sleep=sleep,
+        )
+
+        for _ in range(2):
+            with pytest.raises(SearchError):
+                await adapter.search(make_request())
+
+        assert len(search_port_double.calls) == 3
+        assert adapter.stats.budget_exhausted == 2
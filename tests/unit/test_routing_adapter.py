@@ -0,0 +1,157 @@
+"""Unit tests for the model routing search adapter."""
+
+import pytest
+
+from domain.entities import ChatModel, EmbeddingModel, SearchRequest, SearchResult
+from domain.ports import SearchError, SearchPort
+from infrastructure.routing.adapter import ModelRoutingSearchAdapter
+from tests.doubles.fake_clock import FakeClock
+from tests.doubles.search_requests import status_error
+
+PRIMARY = ChatModel(provider_id="p1", key="primary")
+FALLBACK = ChatModel(provider_id="p2", key="fallback")
+
+
+def make_request(*fallbacks: ChatModel) -> SearchRequest:
+    """Create a search request sent to PRIMARY with the given fallbacks."""
+    return SearchRequest(
+        query="test query",
+        chat_model=PRIMARY,
+        embedding_model=EmbeddingModel(provider_id="p3", key="embed"),
+        chat_model_fallbacks=fallbacks,
+    )
+
+
+class ModelPort(SearchPort):
+    """Search port answering per chat model, failing or taking time as told.
+
+    Attributes:
+        errors: Error raised for each chat model key, if any.
+        latencies: Seconds the fake clock advances per call, by chat model key.
+        calls: Chat models of the requests received.
+    """
+
+    def __init__(self, clock: FakeClock) -> None:
+        """Initialize ModelPort.
+
+        Args:
+            clock: Fake clock advanced by each call's latency.
+        """
+        self.clock = clock
+        self.errors: dict[str, SearchError] = {}
+        self.latencies: dict[str, float] = {}
+        self.calls: list[ChatModel] = []
+
+    async def search(self, request: SearchRequest) -> SearchResult:
+        """Answer with the chat model key, or raise its error."""
+        self.calls.append(request.chat_model)
+        self.clock.now += self.latencies.get(request.chat_model.key, 0.0)
+        if request.chat_model.key in self.errors:
+            raise self.errors[request.chat_model.key]
+        return SearchResult(message=request.chat_model.key)
+
+
+class TestModelRoutingSearchAdapter:
+    """Tests for ModelRoutingSearchAdapter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def port(self, clock: FakeClock) -> ModelPort:
+        """Create the wrapped search port."""
+        return ModelPort(clock)
+
+    @pytest.fixture
+    def adapter(self, port: ModelPort, clock: FakeClock) -> ModelRoutingSearchAdapter:
+        """Create a router ejecting models after two failures."""
+        return ModelRoutingSearchAdapter(
+            inner=port, max_failures=2, ejection_time=30, slow_latency=10, clock=clock
+        )
+
+    async def test_falls_back_on_backend_failure(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should answer with the next model and name it in the metadata."""
+        port.errors["primary"] = status_error(429)
+
+        result = await adapter.search(make_request(FALLBACK))
+
+        assert result.message == "fallback"
+        assert result.metadata.chat_model == FALLBACK
+        assert port.calls == [PRIMARY, FALLBACK]
+
+    async def test_client_errors_do_not_fall_back(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should raise errors caused by the request without trying other models."""
+        port.errors["primary"] = status_error(400)
+
+        with pytest.raises(SearchError):
+            await adapter.search(make_request(FALLBACK))
+
+        assert port.calls == [PRIMARY]
+
+    async def test_last_error_raised_when_chain_fails(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should raise the last model's error once every model failed."""
+        port.errors["primary"] = status_error(503)
+        port.errors["fallback"] = status_error(502)
+
+        with pytest.raises(SearchError, match="502"):
+            await adapter.search(make_request(FALLBACK))
+
+    async def test_failing_model_is_skipped_until_ejection_ends(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort, clock: FakeClock
+    ) -> None:
+        """Should stop trying a model that failed max_failures times in a row."""
+        port.errors["primary"] = status_error(503)
+        await adapter.search(make_request(FALLBACK))
+        await adapter.search(make_request(FALLBACK))
+        port.calls.clear()
+
+        await adapter.search(make_request(FALLBACK))
+        assert port.calls == [FALLBACK]
+
+        clock.now += 31
+        del port.errors["primary"]
+        await adapter.search(make_request(FALLBACK))
+        assert port.calls[-1] == PRIMARY
+
+    async def test_slow_model_is_tried_last(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should prefer the fallback while the primary is slower than slow_latency."""
+        port.latencies["primary"] = 20
+        await adapter.search(make_request(FALLBACK))
+
+        result = await adapter.search(make_request(FALLBACK))
+
+        assert result.message == "fallback"
+        stats = {model.key: model for model in adapter.stats}
+        assert stats["primary"].ewma_latency == 20
+        assert stats["fallback"].fallbacks == 1
+
+    async def test_requests_without_fallbacks_pass_through(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should neither retry nor track models that have no fallbacks."""
+        port.errors["primary"] = status_error(503)
+
+        with pytest.raises(SearchError):
+            await adapter.search(make_request())
+
+        assert adapter.stats == []
+
+    async def test_stream_falls_back_before_first_chunk(
+        self, adapter: ModelRoutingSearchAdapter, port: ModelPort
+    ) -> None:
+        """Should stream from the next model when the first fails to start."""
+        port.errors["primary"] = status_error(503)
+
+        chunks = [chunk async for chunk in adapter.search_stream(make_request(FALLBACK))]
+
+        assert [chunk.message for chunk in chunks] == ["fallback"]
@@ -0,0 +1,266 @@
+"""Unit tests for the semantic cache adapter."""
+
+import importlib.util
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    import numpy
+
+np = pytest.importorskip("numpy")
+
+from domain.entities import (  # noqa: E402
+    ChatModel,
+    FocusMode,
+    HistoryEntry,
+)
+from infrastructure.semantic_cache.adapter import (  # noqa: E402
+    HashingEmbedder,
+    HnswIndex,
+    NumpyIndex,
+    SemanticCachingSearchAdapter,
+)
+from tests.doubles.fake_clock import FakeClock  # noqa: E402
+from tests.doubles.search_port_double import SearchPortDouble  # noqa: E402
+from tests.doubles.search_requests import make_request  # noqa: E402
+
+
+class AngleEmbedder:
+    """Embedder placing each known query on the unit circle at a given angle."""
+
+    def __init__(self, degrees: dict[str, float]) -> None:
+        """Initialize AngleEmbedder.
+
+        Args:
+            degrees: Angle of each query, in degrees.
+        """
+        self.degrees = degrees
+
+    async def embed(self, text: str) -> "numpy.ndarray":
+        """Return the unit vector at the query's angle."""
+        radians = np.radians(self.degrees[text])
+        return np.array([np.cos(radians), np.sin(radians)], dtype=np.float32)
+
+
+class TestHashingEmbedder:
+    """Tests for HashingEmbedder."""
+
+    async def test_paraphrases_are_closer_than_other_questions(self) -> None:
+        """Should score a rephrasing above a different question."""
+        embedder = HashingEmbedder()
+        query = await embedder.embed("capital of France")
+
+        paraphrase = await embedder.embed("what's France's capital city")
+        other = await embedder.embed("capital of Germany")
+
+        assert float(query @ paraphrase) >= 0.85
+        assert float(query @ other) < 0.6
+        assert np.linalg.norm(query) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "index_factory",
+    [
+        NumpyIndex,
+        pytest.param(
+            HnswIndex,
+            marks=pytest.mark.skipif(
+                importlib.util.find_spec("hnswlib") is None, reason="hnswlib not installed"
+            ),
+        ),
+    ],
+)
+class TestVectorIndexes:
+    """Tests shared by every VectorIndex implementation."""
+
+    def test_nearest_finds_most_similar(self, index_factory) -> None:
+        """Should return the key of the closest vector and its similarity."""
+        index = index_factory()
+        index.add(1, np.array([1.0, 0.0], dtype=np.float32))
+        index.add(2, np.array([0.0, 1.0], dtype=np.float32))
+
+        [(key, similarity)] = index.nearest(np.array([0.6, 0.8], dtype=np.float32))
+
+        assert key == 2
+        assert similarity == pytest.approx(0.8, abs=1e-5)
+
+    def test_nearest_returns_k_most_similar_in_order(self, index_factory) -> None:
+        """Should return up to k keys, most similar first."""
+        index = index_factory()
+        index.add(1, np.array([1.0, 0.0], dtype=np.float32))
+        index.add(2, np.array([0.0, 1.0], dtype=np.float32))
+
+        matches = index.nearest(np.array([0.6, 0.8], dtype=np.float32), k=3)
+
+        assert [key for key, _ in matches] == [2, 1]
+
+    def test_removed_vectors_are_not_returned(self, index_factory) -> None:
+        """Should forget removed vectors."""
+        index = index_factory()
+        index.add(1, np.array([1.0, 0.0], dtype=np.float32))
+
+        index.remove(1)
+
+        assert index.nearest(np.array([1.0, 0.0], dtype=np.float32)) == []
+
+
+class TestSemanticCachingSearchAdapter:
+    """Tests for SemanticCachingSearchAdapter."""
+
+    @pytest.fixture
+    def inner(self) -> SearchPortDouble:
+        """Create the wrapped search port."""
+        return SearchPortDouble()
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, inner: SearchPortDouble, clock: FakeClock) -> SemanticCachingSearchAdapter:
+        """Create a semantic cache over the double."""
+        return SemanticCachingSearchAdapter(
+            inner=inner, embedder=HashingEmbedder(), ttl=60, max_entries=2, clock=clock
+        )
+
+    async def test_paraphrase_is_answered_from_cache(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should serve a near-duplicate query without calling upstream."""
+        first = await cache.search(make_request("capital of France"))
+        second = await cache.search(make_request("what's France's capital city"))
+
+        assert second is first
+        inner.assert_called_once()
+        stats = cache.stats
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.mean_hit_similarity >= 0.85
+        assert sum(stats.similarity_histogram) == 2
+
+    async def test_different_question_misses(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should go upstream for a question below the threshold."""
+        await cache.search(make_request("capital of France"))
+        await cache.search(make_request("capital of Germany"))
+
+        assert len(inner.calls) == 2
+
+    async def test_partitions_do_not_share_results(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should not reuse a result across focus modes or chat models."""
+        request = make_request("capital of France")
+        await cache.search(request)
+
+        await cache.search(replace(request, focus_mode=FocusMode.ACADEMIC_SEARCH))
+        await cache.search(replace(request, chat_model=ChatModel(provider_id="p1", key="m9")))
+
+        assert len(inner.calls) == 3
+
+    async def test_history_is_never_cached(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should pass searches with history straight through."""
+        request = replace(make_request("capital of France"), history=(HistoryEntry(role="human", content="hi"),))
+
+        await cache.search(request)
+        await cache.search(request)
+
+        assert len(inner.calls) == 2
+        assert cache.stats.entries == 0
+
+    async def test_entries_expire(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should stop serving a result after its TTL."""
+        await cache.search(make_request("capital of France"))
+        clock.now = 61
+
+        await cache.search(make_request("capital of France"))
+
+        assert len(inner.calls) == 2
+
+    async def test_expired_nearest_entry_does_not_hide_live_one(
+        self, inner: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should serve the nearest live entry when a nearer one has expired."""
+        cache = SemanticCachingSearchAdapter(
+            inner=inner,
+            embedder=AngleEmbedder({"query": 0, "older": 12, "newer": -15}),
+            threshold=0.95,
+            ttl=60,
+            clock=clock,
+        )
+        await cache.search(make_request("older"))
+        clock.now = 30
+        await cache.search(make_request("newer"))
+        clock.now = 61
+
+        await cache.search(make_request("query"))
+
+        assert len(inner.calls) == 2
+        assert cache.stats.hits == 1
+
+    async def test_expired_entries_are_purged(
+        self, inner: SearchPortDouble, clock: FakeClock
+    ) -> None:
+        """Should drop expired entries of every partition once per purge interval."""
+        cache = SemanticCachingSearchAdapter(
+            inner=inner, embedder=HashingEmbedder(), ttl=60, purge_interval=100, clock=clock
+        )
+        academic = replace(make_request("tallest mountain"), focus_mode=FocusMode.ACADEMIC_SEARCH)
+        youtube = replace(make_request("speed of light"), focus_mode=FocusMode.YOUTUBE_SEARCH)
+        await cache.search(make_request("capital of France"))
+        clock.now = 61
+        await cache.search(academic)
+        assert cache.stats.entries == 2
+
+        clock.now = 100
+        await cache.search(youtube)
+
+        # The first entry expired at 60 and is gone, though never looked up again
+        assert cache.stats.entries == 2
+        await cache.search(make_request("capital of France"))
+        assert len(inner.calls) == 4
+
+    async def test_least_recently_used_is_evicted(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should evict the least recently used entry beyond max_entries."""
+        await cache.search(make_request("capital of France"))
+        await cache.search(make_request("tallest mountain on earth"))
+        await cache.search(make_request("capital of France"))
+        await cache.search(make_request("speed of light in vacuum"))
+
+        await cache.search(make_request("capital of France"))
+
+        assert cache.stats.evictions == 1
+        assert len(inner.calls) == 3
+
+    async def test_bypass_cache_refreshes_entry(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should skip the lookup and replace the similar entry."""
+        await cache.search(make_request("capital of France"))
+
+        await cache.search(replace(make_request("capital of France"), bypass_cache=True))
+
+        assert len(inner.calls) == 2
+        assert cache.stats.entries == 1
+
+    async def test_stream_hit_replays_single_chunk(
+        self, cache: SemanticCachingSearchAdapter, inner: SearchPortDouble
+    ) -> None:
+        """Should cache a streamed answer and replay it as one chunk."""
+        request = replace(make_request("capital of France"), stream=True)
+        streamed = [chunk async for chunk in cache.search_stream(request)]
+
+        replayed = [chunk async for chunk in cache.search_stream(request)]
+
+        inner.assert_called_once()
+        assert len(replayed) == 1
+        assert replayed[0].message == "".join(chunk.message for chunk in streamed)
@@ -0,0 +1,75 @@
+"""Unit tests for the in-memory session store."""
+
+import pytest
+
+from domain.entities import HistoryEntry
+from infrastructure.sessions.adapter import MemorySessionStore
+from tests.doubles.fake_clock import FakeClock
+
+
+def make_turn(content: str) -> tuple[HistoryEntry, HistoryEntry]:
+    """Create a question and its answer."""
+    return (
+        HistoryEntry(role="human", content=content),
+        HistoryEntry(role="assistant", content=content.upper()),
+    )
+
+
+class TestMemorySessionStore:
+    """Tests for MemorySessionStore."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self, clock: FakeClock) -> MemorySessionStore:
+        """Create a store of two sessions of 10 characters each."""
+        return MemorySessionStore(ttl=60, max_sessions=2, max_chars=10, clock=clock)
+
+    async def test_appended_turns_are_returned_in_order(self, store: MemorySessionStore) -> None:
+        """Should return every entry of a session, oldest first."""
+        await store.append("s1", make_turn("ab"))
+        await store.append("s1", make_turn("cd"))
+
+        history = await store.get_history("s1")
+
+        assert [entry.content for entry in history] == ["ab", "AB", "cd", "CD"]
+        assert await store.get_history("unknown") == ()
+
+    async def test_oldest_turns_are_trimmed_past_max_chars(
+        self, store: MemorySessionStore
+    ) -> None:
+        """Should drop whole turns, answers included, once the session exceeds max_chars."""
+        await store.append("s1", make_turn("abc"))
+        await store.append("s1", make_turn("def"))
+
+        history = await store.get_history("s1")
+
+        assert [entry.content for entry in history] == ["def", "DEF"]
+        assert store.stats.trimmed_entries == 2
+
+    async def test_idle_sessions_expire(self, store: MemorySessionStore, clock: FakeClock) -> None:
+        """Should forget sessions unused for longer than the TTL."""
+        await store.append("idle", make_turn("a"))
+        clock.now = 50
+        await store.append("active", make_turn("b"))
+        clock.now = 70
+
+        assert await store.get_history("idle") == ()
+        assert await store.get_history("active") != ()
+        assert store.stats.evictions == 1
+
+    async def test_least_recently_used_session_is_evicted(
+        self, store: MemorySessionStore
+    ) -> None:
+        """Should drop the least recently used session past max_sessions."""
+        await store.append("a", make_turn("a"))
+        await store.append("b", make_turn("b"))
+        await store.get_history("a")
+
+        await store.append("c", make_turn("c"))
+
+        assert await store.get_history("b") == ()
+        assert store.stats.sessions == 2
@@ -0,0 +1,94 @@
+"""Unit tests for the single-flight search adapter."""
+
+import asyncio
+
+import pytest
+
+from domain.ports import SearchError
+from infrastructure.singleflight.adapter import SingleFlightSearchAdapter
+from tests.doubles.search_port_double import SearchPortDouble
+from tests.doubles.search_requests import make_request
+
+
+class TestSingleFlightSearchAdapter:
+    """Tests for SingleFlightSearchAdapter."""
+
+    @pytest.fixture
+    def search_port_double(self) -> SearchPortDouble:
+        """Create a search port double that blocks until released."""
+        return SearchPortDouble(gate=asyncio.Event())
+
+    @pytest.fixture
+    def adapter(self, search_port_double: SearchPortDouble) -> SingleFlightSearchAdapter:
+        """Create a single-flight adapter over the double."""
+        return SingleFlightSearchAdapter(inner=search_port_double)
+
+    async def test_concurrent_equal_requests_share_one_call(
+        self, adapter: SingleFlightSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should issue one upstream call for concurrent equal requests."""
+        tasks = [asyncio.create_task(adapter.search(make_request())) for _ in range(3)]
+        await asyncio.sleep(0)
+        search_port_double.release()
+
+        results = await asyncio.gather(*tasks)
+
+        search_port_double.assert_called_once()
+        assert results[0] is results[1] is results[2]
+
+    async def test_different_requests_are_not_coalesced(
+        self, adapter: SingleFlightSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should issue separate calls for different requests."""
+        search_port_double.release()
+
+        await asyncio.gather(
+            adapter.search(make_request("a")), adapter.search(make_request("b"))
+        )
+
+        assert len(search_port_double.calls) == 2
+
+    async def test_cancelling_one_waiter_keeps_shared_call(
+        self, adapter: SingleFlightSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should keep the shared call running while other waiters remain."""
+        first = asyncio.create_task(adapter.search(make_request()))
+        second = asyncio.create_task(adapter.search(make_request()))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        search_port_double.release()
+
+        assert (await second).message == "Test response"
+        assert first.cancelled()
+
+    async def test_errors_are_shared(
+        self, adapter: SingleFlightSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should raise the shared SearchError to every waiter."""
+        search_port_double.error = SearchError(message="Search failed")
+        tasks = [asyncio.create_task(adapter.search(make_request())) for _ in range(2)]
+        await asyncio.sleep(0)
+        search_port_double.release()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        search_port_double.assert_called_once()
+        assert all(isinstance(result, SearchError) for result in results)
+
+    async def test_caller_after_last_waiter_cancels_starts_fresh_call(
+        self, adapter: SingleFlightSearchAdapter, search_port_double: SearchPortDouble
+    ) -> None:
+        """Should not join a shared call that is being cancelled."""
+        first = asyncio.create_task(adapter.search(make_request()))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)  # the caller is cancelled, the shared task not yet done
+
+        second = asyncio.create_task(adapter.search(make_request()))
+        await asyncio.sleep(0)
+        search_port_double.release()
+
+        assert (await second).message == "Test response"
+        assert len(search_port_double.calls) == 2
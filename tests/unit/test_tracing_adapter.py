@@ -0,0 +1,134 @@
+"""Unit tests for the OpenTelemetry tracing adapter."""
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import (  # noqa: E402
+    BatchSpanProcessor,
+    SimpleSpanProcessor,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+from application.requests import (  # noqa: E402
+    ChatModelRequest,
+    EmbeddingModelRequest,
+    SearchRequestDTO,
+)
+from application.use_cases import SearchUseCase  # noqa: E402
+from domain.ports import SearchError  # noqa: E402
+from infrastructure.perplexica.adapter import PerplexicaAdapter  # noqa: E402
+from infrastructure.tracing.adapter import OpenTelemetryTracer  # noqa: E402
+from tests.doubles.search_port_double import SearchPortDouble  # noqa: E402
+
+
+def make_dto(stream: bool = False) -> SearchRequestDTO:
+    """Create a minimal search request DTO."""
+    return SearchRequestDTO(
+        query="test query",
+        chatModel=ChatModelRequest(providerId="p1", key="m1"),
+        embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+        stream=stream,
+    )
+
+
+class TestOpenTelemetryTracer:
+    """Tests for OpenTelemetryTracer."""
+
+    @pytest.fixture
+    def exporter(self) -> InMemorySpanExporter:
+        """Create an exporter collecting finished spans in memory."""
+        return InMemorySpanExporter()
+
+    @pytest.fixture
+    def tracer(self, exporter: InMemorySpanExporter) -> OpenTelemetryTracer:
+        """Create a tracer exporting to the in-memory exporter."""
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        return OpenTelemetryTracer(tracer_provider=provider)
+
+    async def test_close_exports_batched_spans(self, exporter: InMemorySpanExporter) -> None:
+        """Should flush spans still waiting in a batch processor."""
+        provider = TracerProvider()
+        provider.add_span_processor(BatchSpanProcessor(exporter, schedule_delay_millis=60_000))
+        tracer = OpenTelemetryTracer(tracer_provider=provider)
+        with tracer.span("search"):
+            pass
+        assert not exporter.get_finished_spans()
+
+        await tracer.close()
+
+        assert [span.name for span in exporter.get_finished_spans()] == ["search"]
+
+    async def test_spans_cover_use_case_and_upstream(
+        self, tracer: OpenTelemetryTracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Should nest the upstream call under the search and propagate context."""
+        received: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(
+                200,
+                json={"message": "Paris", "sources": [{"title": "Wiki", "url": "https://w"}]},
+            )
+
+        adapter = PerplexicaAdapter(
+            base_url="http://perplexica",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            tracer=tracer,
+        )
+        use_case = SearchUseCase(search_port=adapter, tracer=tracer)
+
+        await use_case.execute(make_dto())
+        await adapter.close()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        search, upstream = spans["search"], spans["perplexica.search"]
+        build_parent = spans["search.build_request"].parent
+        assert search.context is not None and upstream.context is not None
+        assert build_parent is not None and upstream.parent is not None
+        assert build_parent.span_id == search.context.span_id
+        assert upstream.parent.span_id == search.context.span_id
+        assert search.attributes is not None and upstream.attributes is not None
+        assert search.attributes["search.source_count"] == 1
+        assert search.attributes["search.attempts"] == 1
+        assert search.attributes["search.chat_model"] == "m1"
+        assert upstream.attributes["http.response.status_code"] == 200
+        body_size = upstream.attributes["http.request.body.size"]
+        assert isinstance(body_size, int) and body_size > 0
+        trace_id = format(upstream.context.trace_id, "032x")
+        span_id = format(upstream.context.span_id, "016x")
+        assert received[0].headers["traceparent"].startswith(f"00-{trace_id}-{span_id}-")
+
+    async def test_failures_are_recorded(
+        self, tracer: OpenTelemetryTracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Should mark the search span as failed."""
+        use_case = SearchUseCase(
+            search_port=SearchPortDouble(error=SearchError(message="down")), tracer=tracer
+        )
+
+        with pytest.raises(SearchError):
+            await use_case.execute(make_dto())
+
+        (search,) = [s for s in exporter.get_finished_spans() if s.name == "search"]
+        assert not search.status.is_ok
+        assert search.events[0].name == "exception"
+
+    async def test_stream_span_counts_chunks(
+        self, tracer: OpenTelemetryTracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Should record the number of streamed chunks."""
+        use_case = SearchUseCase(search_port=SearchPortDouble(), tracer=tracer)
+
+        chunks = [chunk async for chunk in use_case.execute_stream(make_dto(stream=True))]
+
+        (search,) = [s for s in exporter.get_finished_spans() if s.name == "search"]
+        assert search.attributes is not None
+        assert search.attributes["search.chunk_count"] == len(chunks)
+        assert search.attributes["search.source_count"] == 1
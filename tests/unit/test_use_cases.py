@@ -1,15 +1,35 @@
 """Unit tests for use cases."""
 
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
 
+from application.degradation import DegradationPolicy, LoadDegrader, LoadTrackingSearchAdapter
 from application.requests import (
     ChatModelRequest,
     EmbeddingModelRequest,
     SearchRequestDTO,
 )
-from application.use_cases import SearchUseCase
-from domain.entities import FocusMode, OptimizationMode, SearchResult, Source
-from domain.ports import SearchError
+from application.use_cases import BatchSearchUseCase, SearchUseCase, trim_history
+from domain.entities import (
+    ChatModel,
+    EmbeddingModel,
+    FocusMode,
+    HistoryEntry,
+    ModelRoute,
+    ModelRoutes,
+    OptimizationMode,
+    SearchChunk,
+    SearchRequest,
+    SearchResult,
+    Source,
+    SourceDedupe,
+    SourceLimits,
+)
+from domain.ports import SearchDeadlineError, SearchError, SearchPort, SearchUnavailableError
+from infrastructure.sessions.adapter import MemorySessionStore
+from tests.doubles.fake_clock import FakeClock
 from tests.doubles.search_port_double import SearchPortDouble
 
 
@@ -143,3 +163,462 @@ class TestSearchUseCase:
             await use_case.execute(request_dto)
 
         assert "Search failed" in str(exc_info.value)
+
+    async def test_execute_enforces_deadline(self) -> None:
+        """Should cancel the search and fail once deadlineMs has passed."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        use_case = SearchUseCase(search_port=search_port_double)
+        request_dto = SearchRequestDTO(
+            query="slow",
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+            deadlineMs=10,
+        )
+
+        with pytest.raises(SearchDeadlineError, match="deadline of 10 ms"):
+            await use_case.execute(request_dto)
+
+        assert search_port_double.calls[0].deadline is not None
+
+    async def test_execute_stream_enforces_deadline(self) -> None:
+        """Should fail a stream with SearchDeadlineError once deadlineMs has passed."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        use_case = SearchUseCase(search_port=search_port_double)
+        request_dto = SearchRequestDTO(
+            query="slow",
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+            deadlineMs=10,
+        )
+
+        with pytest.raises(SearchDeadlineError, match="deadline of 10 ms"):
+            [chunk async for chunk in use_case.execute_stream(request_dto)]
+
+    async def test_execute_stream_yields_port_chunks(
+        self,
+        use_case: SearchUseCase,
+        search_port_double: SearchPortDouble,
+        minimal_request: SearchRequestDTO,
+    ) -> None:
+        """Should stream chunks from the port for the mapped request."""
+        chunks = [chunk async for chunk in use_case.execute_stream(minimal_request)]
+
+        search_port_double.assert_called_with_query("test query")
+        assert "".join(chunk.message for chunk in chunks) == "Test response"
+
+    async def test_execute_stream_accepts_plain_async_iterators(
+        self, minimal_request: SearchRequestDTO
+    ) -> None:
+        """Should stream from a port whose stream is not an async generator."""
+
+        class ChunkIterator:
+            """Async iterator over one chunk per word, without an aclose method."""
+
+            def __init__(self, words: list[str]) -> None:
+                self.chunks = [SearchChunk(message=word) for word in words]
+
+            def __aiter__(self) -> "ChunkIterator":
+                return self
+
+            async def __anext__(self) -> SearchChunk:
+                if not self.chunks:
+                    raise StopAsyncIteration
+                return self.chunks.pop(0)
+
+        class IteratorPort(SearchPort):
+            """Search port streaming through a plain async iterator."""
+
+            async def search(self, request: SearchRequest) -> SearchResult:
+                return SearchResult(message=request.query)
+
+            def search_stream(self, request: SearchRequest) -> AsyncIterator[SearchChunk]:
+                return ChunkIterator(request.query.split())
+
+        use_case = SearchUseCase(search_port=IteratorPort())
+
+        chunks = [chunk async for chunk in use_case.execute_stream(minimal_request)]
+
+        assert [chunk.message for chunk in chunks] == ["test", "query"]
+
+
+class TestSourceLimits:
+    """Tests for SearchUseCase source limits."""
+
+    async def test_request_limits_override_defaults(self) -> None:
+        """Should fill limits the request leaves unset from the defaults."""
+        search_port_double = SearchPortDouble()
+        use_case = SearchUseCase(
+            search_port=search_port_double,
+            source_limits=SourceLimits(max_sources=5, snippet_max_chars=100),
+        )
+
+        await use_case.execute(
+            SearchRequestDTO(
+                query="q",
+                chatModel=ChatModelRequest(providerId="p1", key="m1"),
+                embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+                maxSources=2,
+                dedupeSources="url",
+            )
+        )
+
+        assert search_port_double.calls[0].source_limits == SourceLimits(
+            max_sources=2, snippet_max_chars=100, dedupe=SourceDedupe.URL
+        )
+
+
+class TestSessions:
+    """Tests for SearchUseCase with server-side sessions."""
+
+    @staticmethod
+    def make_request(query: str, **fields) -> SearchRequestDTO:
+        """Create a search request DTO in session s1."""
+        return SearchRequestDTO(
+            query=query,
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+            sessionId="s1",
+            **fields,
+        )
+
+    @pytest.fixture
+    def sessions(self) -> MemorySessionStore:
+        """Create a session store."""
+        return MemorySessionStore(ttl=60, max_sessions=10, max_chars=10_000)
+
+    async def test_session_history_is_sent_and_extended(
+        self, sessions: MemorySessionStore
+    ) -> None:
+        """Should send earlier turns of the session and remember the new one."""
+        search_port_double = SearchPortDouble()
+        use_case = SearchUseCase(search_port=search_port_double, sessions=sessions)
+
+        await use_case.execute(self.make_request("first", history=[["human", "context"]]))
+        chunks = [chunk async for chunk in use_case.execute_stream(self.make_request("second"))]
+
+        assert [(e.role, e.content) for e in search_port_double.calls[1].history] == [
+            ("human", "context"),
+            ("human", "first"),
+            ("assistant", "Test response"),
+        ]
+        history = await sessions.get_history("anonymous/s1")
+        assert [e.content for e in history[-2:]] == [
+            "second",
+            "".join(chunk.message for chunk in chunks),
+        ]
+
+    async def test_history_is_trimmed_to_budget(self, sessions: MemorySessionStore) -> None:
+        """Should send only the newest turns fitting in history_max_chars."""
+        search_port_double = SearchPortDouble(response=SearchResult(message="x" * 10))
+        use_case = SearchUseCase(
+            search_port=search_port_double, sessions=sessions, history_max_chars=25
+        )
+
+        for query in ("one", "two", "three"):
+            await use_case.execute(self.make_request(query))
+
+        assert [e.content for e in search_port_double.calls[2].history] == ["two", "x" * 10]
+
+    async def test_failed_search_is_not_remembered(self, sessions: MemorySessionStore) -> None:
+        """Should leave the session unchanged when the search fails."""
+        use_case = SearchUseCase(
+            search_port=SearchPortDouble(error=SearchError(message="down")), sessions=sessions
+        )
+
+        with pytest.raises(SearchError):
+            await use_case.execute(self.make_request("first"))
+
+        assert await sessions.get_history("anonymous/s1") == ()
+
+    async def test_sessions_are_scoped_to_their_client(
+        self, sessions: MemorySessionStore
+    ) -> None:
+        """Should not let a client read another client's session by reusing its id."""
+        search_port_double = SearchPortDouble()
+        use_case = SearchUseCase(search_port=search_port_double, sessions=sessions)
+
+        await use_case.execute(self.make_request("secret"), client_id="team-a")
+        await use_case.execute(self.make_request("guess"), client_id="team-b")
+
+        assert search_port_double.calls[1].history == ()
+        assert len(await sessions.get_history("team-a/s1")) == 2
+
+    async def test_session_requires_a_store(self) -> None:
+        """Should reject session ids when sessions are disabled."""
+        use_case = SearchUseCase(search_port=SearchPortDouble())
+
+        with pytest.raises(SearchError, match="Sessions are not enabled"):
+            await use_case.execute(self.make_request("first"))
+
+    def test_trim_history_keeps_newest_entries(self) -> None:
+        """Should drop whole entries from the oldest end."""
+        history = tuple(HistoryEntry(role="human", content=c) for c in ("aaa", "bb", "c"))
+
+        assert trim_history(history, None) == history
+        assert trim_history(history, 4) == history[1:]
+        assert trim_history(history, 0) == ()
+
+    def test_trim_history_drops_whole_turns(self) -> None:
+        """Should not keep an answer whose question was trimmed."""
+        history = (
+            HistoryEntry(role="human", content="first question"),
+            HistoryEntry(role="assistant", content="a1"),
+            HistoryEntry(role="human", content="q2"),
+            HistoryEntry(role="assistant", content="a2"),
+        )
+
+        assert trim_history(history, 8) == history[2:]
+        assert trim_history(history, 3) == ()
+
+
+class TestModelRoutes:
+    """Tests for SearchUseCase choosing the models of searches naming none."""
+
+    EMBEDDING = EmbeddingModel(provider_id="p2", key="embed")
+    ROUTES = ModelRoutes(
+        default=ModelRoute(
+            chat_models=(ChatModel("p1", "default"), ChatModel("p1", "cheap")),
+            embedding_model=EMBEDDING,
+        ),
+        by_focus_mode={
+            FocusMode.ACADEMIC_SEARCH: ModelRoute(
+                chat_models=(ChatModel("p1", "academic"),), embedding_model=EMBEDDING
+            )
+        },
+    )
+
+    async def test_omitted_models_follow_focus_mode_route(self) -> None:
+        """Should use the focus mode's route, with its fallbacks, or the default one."""
+        search_port_double = SearchPortDouble()
+        use_case = SearchUseCase(search_port=search_port_double, model_routes=self.ROUTES)
+
+        await use_case.execute(SearchRequestDTO(query="q"))
+        await use_case.execute(SearchRequestDTO(query="q", focusMode="academicSearch"))
+
+        default, academic = search_port_double.calls
+        assert default.chat_model == ChatModel("p1", "default")
+        assert default.chat_model_fallbacks == (ChatModel("p1", "cheap"),)
+        assert default.embedding_model == self.EMBEDDING
+        assert academic.chat_model == ChatModel("p1", "academic")
+        assert academic.chat_model_fallbacks == ()
+
+    async def test_named_model_has_no_fallbacks(self) -> None:
+        """Should send a model the client names as is."""
+        search_port_double = SearchPortDouble()
+        use_case = SearchUseCase(search_port=search_port_double, model_routes=self.ROUTES)
+
+        await use_case.execute(
+            SearchRequestDTO(query="q", chatModel=ChatModelRequest(providerId="p9", key="m9"))
+        )
+
+        request = search_port_double.calls[0]
+        assert request.chat_model == ChatModel("p9", "m9")
+        assert request.chat_model_fallbacks == ()
+        assert request.embedding_model == self.EMBEDDING
+
+    async def test_models_required_without_routes(self) -> None:
+        """Should reject searches naming no model when no defaults are configured."""
+        use_case = SearchUseCase(search_port=SearchPortDouble())
+
+        with pytest.raises(SearchError, match="chatModel and embeddingModel are required"):
+            await use_case.execute(SearchRequestDTO(query="q"))
+
+
+class TestDegradation:
+    """Tests for SearchUseCase with load-aware degradation."""
+
+    @staticmethod
+    def make_request(**fields) -> SearchRequestDTO:
+        """Create a 'quality' search request DTO."""
+        return SearchRequestDTO(
+            query="q",
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+            optimizationMode="quality",
+            **fields,
+        )
+
+    def test_mode_cap_follows_in_flight_and_latency(self) -> None:
+        """Should cap the mode by whichever load signal is highest."""
+        clock = FakeClock()
+        degrader = LoadDegrader(
+            DegradationPolicy(balanced_in_flight=1, speed_in_flight=2, speed_latency=10),
+            clock=clock,
+        )
+
+        assert degrader.degrade(OptimizationMode.QUALITY) == OptimizationMode.QUALITY
+        with degrader.track():
+            assert degrader.degrade(OptimizationMode.QUALITY) == OptimizationMode.BALANCED
+            assert degrader.degrade(OptimizationMode.SPEED) == OptimizationMode.SPEED
+            with degrader.track():
+                assert degrader.degrade(OptimizationMode.BALANCED) == OptimizationMode.SPEED
+                clock.now = 20
+
+        # The 20 s search pushed the smoothed latency past speed_latency
+        assert degrader.stats.ewma_latency == 20
+        assert degrader.degrade(OptimizationMode.QUALITY) == OptimizationMode.SPEED
+        assert degrader.stats.degraded == 3
+
+    async def test_loaded_server_downgrades_and_reports_mode(self) -> None:
+        """Should run the search in the capped mode, with the degraded history budget."""
+        search_port_double = SearchPortDouble()
+        degrader = LoadDegrader(DegradationPolicy(balanced_in_flight=1, history_max_chars=5))
+        use_case = SearchUseCase(search_port=search_port_double, degrader=degrader)
+
+        with degrader.track():
+            result = await use_case.execute(
+                self.make_request(history=[["human", "older"], ["human", "newer"]])
+            )
+
+        request = search_port_double.calls[0]
+        assert request.optimization_mode == OptimizationMode.BALANCED
+        assert [e.content for e in request.history] == ["newer"]
+        assert result.metadata.degraded_to == OptimizationMode.BALANCED
+
+    async def test_request_can_opt_out(self) -> None:
+        """Should keep the requested mode when the request disallows degradation."""
+        search_port_double = SearchPortDouble()
+        degrader = LoadDegrader(DegradationPolicy(balanced_in_flight=0))
+        use_case = SearchUseCase(search_port=search_port_double, degrader=degrader)
+
+        result = await use_case.execute(self.make_request(allowDegradation=False))
+
+        assert search_port_double.calls[0].optimization_mode == OptimizationMode.QUALITY
+        assert result.metadata.degraded_to is None
+
+    async def test_stream_reports_mode_on_first_chunk(self) -> None:
+        """Should mark the first streamed chunk with the mode it runs in."""
+        degrader = LoadDegrader(DegradationPolicy(speed_in_flight=0))
+        use_case = SearchUseCase(search_port=SearchPortDouble(), degrader=degrader)
+
+        chunks = [chunk async for chunk in use_case.execute_stream(self.make_request())]
+
+        assert chunks[0].degraded_to == OptimizationMode.SPEED
+        assert degrader.stats.in_flight == 0
+
+    async def test_use_case_leaves_load_to_the_port_stack(self) -> None:
+        """Should not count searches answered above the load tracker, such as cache hits."""
+        degrader = LoadDegrader(DegradationPolicy())
+        use_case = SearchUseCase(search_port=SearchPortDouble(), degrader=degrader)
+
+        await use_case.execute(self.make_request())
+
+        assert degrader.stats.ewma_latency is None
+
+    async def test_tracker_counts_searches_reaching_the_backend(self) -> None:
+        """Should count a search in flight until it answers, then record its latency."""
+        gate = asyncio.Event()
+        degrader = LoadDegrader(DegradationPolicy())
+        tracker = LoadTrackingSearchAdapter(inner=SearchPortDouble(gate=gate), degrader=degrader)
+        request = SearchRequest(
+            query="q",
+            chat_model=ChatModel(provider_id="p1", key="m1"),
+            embedding_model=EmbeddingModel(provider_id="p2", key="m2"),
+        )
+
+        search = asyncio.create_task(tracker.search(request))
+        await asyncio.sleep(0)
+        assert degrader.stats.in_flight == 1
+
+        gate.set()
+        await search
+        chunks = [chunk async for chunk in tracker.search_stream(request)]
+
+        assert chunks
+        assert degrader.stats.in_flight == 0
+        assert degrader.stats.ewma_latency is not None
+
+
+class TestBatchSearchUseCase:
+    """Tests for BatchSearchUseCase."""
+
+    @staticmethod
+    def make_request(query: str) -> SearchRequestDTO:
+        """Create a search request DTO for a query."""
+        return SearchRequestDTO(
+            query=query,
+            chatModel=ChatModelRequest(providerId="p1", key="m1"),
+            embeddingModel=EmbeddingModelRequest(providerId="p2", key="m2"),
+        )
+
+    async def test_execute_returns_items_in_input_order(self) -> None:
+        """Should return one item per request, in input order."""
+        search_port_double = SearchPortDouble()
+        use_case = BatchSearchUseCase(search_port=search_port_double, max_concurrency=2)
+
+        items = await use_case.execute([self.make_request(q) for q in ("a", "b", "c")])
+
+        assert [item.query for item in items] == ["a", "b", "c"]
+        assert all(item.result is not None for item in items)
+        assert len(search_port_double.calls) == 3
+
+    async def test_execute_reports_errors_per_item(self) -> None:
+        """Should report failures on the item instead of failing the batch."""
+        search_port_double = SearchPortDouble(error=SearchError(message="Search failed"))
+        use_case = BatchSearchUseCase(search_port=search_port_double)
+
+        items = await use_case.execute([self.make_request("a")])
+
+        assert items[0].result is None
+        assert items[0].error == "Search failed"
+
+    async def test_execute_tags_searches_with_client(self) -> None:
+        """Should send every search of the batch with the batch's client."""
+        search_port_double = SearchPortDouble()
+        use_case = BatchSearchUseCase(search_port=search_port_double)
+
+        await use_case.execute([self.make_request(q) for q in ("a", "b")], client_id="team-a")
+
+        assert [call.client_id for call in search_port_double.calls] == ["team-a", "team-a"]
+
+    async def test_execute_reports_when_to_retry_refused_searches(self) -> None:
+        """Should tell when to retry a search refused for lack of capacity."""
+        search_port_double = SearchPortDouble(
+            error=SearchUnavailableError(message="Rate limit exceeded", retry_after=2.5)
+        )
+        use_case = BatchSearchUseCase(search_port=search_port_double)
+
+        items = await use_case.execute([self.make_request("a")])
+
+        assert items[0].error == "Rate limit exceeded. Retry after 3s."
+
+    async def test_execute_bounds_concurrency(self) -> None:
+        """Should run at most max_concurrency searches at once."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        use_case = BatchSearchUseCase(search_port=search_port_double, max_concurrency=2)
+
+        task = asyncio.create_task(
+            use_case.execute([self.make_request(q) for q in ("a", "b", "c")])
+        )
+        await asyncio.sleep(0.01)
+        assert len(search_port_double.calls) == 2
+
+        search_port_double.release()
+        await task
+        assert len(search_port_double.calls) == 3
+
+    async def test_execute_times_out_unfinished_searches(self) -> None:
+        """Should report searches still running at the deadline as timed out."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        use_case = BatchSearchUseCase(search_port=search_port_double)
+
+        items = await use_case.execute([self.make_request("slow")], timeout=0.01)
+
+        assert items[0].result is None
+        assert items[0].error is not None
+        assert "Timed out" in items[0].error
+
+    async def test_cancelling_execute_cancels_its_searches(self) -> None:
+        """Should not leave searches running once the batch is cancelled."""
+        search_port_double = SearchPortDouble(gate=asyncio.Event())
+        use_case = BatchSearchUseCase(search_port=search_port_double, max_concurrency=1)
+
+        task = asyncio.create_task(use_case.execute([self.make_request(q) for q in ("a", "b")]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        search_port_double.release()
+        await asyncio.sleep(0.01)
+        assert [call.query for call in search_port_double.calls] == ["a"]